@@ -0,0 +1,171 @@
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
+# Admission control in front of the solver pool. At most `max_running`
+# places are taken at once, one per worker, so a solve using several
+# workers (a portfolio race) takes several; up to `max_waiting` more
+# requests wait in line, first come first served. A request arriving to a
+# full line is turned away at once with QueueFull rather than left to wait
+# behind everyone else, and so is one whose deadline passes while it
+# waits. Both carry a retry_after (seconds) estimated from how long solves
+# have been taking and how many are ahead.
+#
+# The cubes of a batch wait in a line of their own, which only moves when
+# the main one is empty, so a big batch cannot starve single requests.
+DEFAULT_MAX_WAITING = 32
+# Weight of the newest solve in the running average of solve times.
+_SERVICE_WEIGHT = 0.2
+
+
+class QueueFull(RuntimeError):
+    # `reason` is "queue_full" or "deadline" (it ran out while waiting).
+    def __init__(self, reason, retry_after):
+        super().__init__(reason, retry_after)
+        self.reason = reason
+        self.retry_after = retry_after
+
+    def __str__(self):
+        if self.reason == "deadline":
+            return "the deadline passed while waiting for a solver"
+        return "too many solves waiting; try again later"
+
+
+class AdmissionQueue:
+    # Only for use from the event loop's thread.
+    def __init__(self, max_running, max_waiting=DEFAULT_MAX_WAITING):
+        self.max_running = max(1, max_running)
+        self.max_waiting = max_waiting
+        self._running = 0
+        # (future, places) of everyone waiting.
+        self._waiters = deque()
+        self._bulk = deque()
+        self._service_s = None
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._wait_total_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    @classmethod
+    def from_env(cls, workers):
+        return cls(workers, int(os.environ.get("SOLVER_QUEUE_SIZE", DEFAULT_MAX_WAITING)))
+
+    @property
+    def depth(self):
+        return len(self._waiters)
+
+    @property
+    def bulk_depth(self):
+        return len(self._bulk)
+
+    def full(self, bulk=False):
+        if bulk:
+            return self.bulk_depth >= self.max_waiting
+        return self._running >= self.max_running and self.depth >= self.max_waiting
+
+    def retry_after(self, bulk=False):
+        # Whole seconds until a place is likely to be free, at least 1.
+        per_solve = self._service_s or 1.0
+        ahead = self.depth + (self.bulk_depth if bulk else 0)
+        return max(1, math.ceil(per_solve * (ahead + 1) / self.max_running))
+
+    @asynccontextmanager
+    async def slot(self, deadline=None, places=1, bulk=False):
+        # Holds `places` of the running places for the body. `deadline` is a
+        # time.monotonic() value. bulk=True queues in the batch line, which
+        # is never full (the batch as a whole was already let in).
+        #
+        # Yields a list for the futures of the worker calls the body starts.
+        # Those keep the places taken until they are done, even if the body
+        # is left sooner (cancelled, or done with a race whose losers are
+        # still stopping): a worker that is still searching is still busy.
+        places = min(max(1, places), self.max_running)
+        started = time.monotonic()
+        await self._acquire(deadline, places, bulk)
+        waited_ms = (time.monotonic() - started) * 1000
+        self.admitted += 1
+        self._wait_total_ms += waited_ms
+        self.max_wait_ms = max(self.max_wait_ms, waited_ms)
+        busy = []
+        try:
+            yield busy
+        finally:
+            elapsed = time.monotonic() - started - waited_ms / 1000
+            self._service_s = elapsed if self._service_s is None else (
+                _SERVICE_WEIGHT * elapsed + (1 - _SERVICE_WEIGHT) * self._service_s
+            )
+            busy = [future for future in busy if not future.done()]
+            if busy:
+                asyncio.ensure_future(self._release_when_done(busy, places))
+            else:
+                self._release(places)
+
+    async def _release_when_done(self, futures, places):
+        await asyncio.wait(futures)
+        self._release(places)
+
+    async def _acquire(self, deadline, places, bulk):
+        line = self._bulk if bulk else self._waiters
+        if self._running + places <= self.max_running and not self._waiters and not (bulk and self._bulk):
+            self._running += places
+            return
+        if not bulk and self.depth >= self.max_waiting:
+            self.rejected += 1
+            raise QueueFull("queue_full", self.retry_after())
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (waiter, places)
+        line.append(entry)
+        try:
+            if deadline is None:
+                await waiter
+            else:
+                await asyncio.wait_for(waiter, max(0.0, deadline - time.monotonic()))
+        except BaseException as exc:
+            if waiter.done() and not waiter.cancelled():
+                # The places were handed over just as we gave up; pass them on.
+                self._release(places)
+            elif entry in line:
+                line.remove(entry)
+                # Whoever was stuck behind us may fit now.
+                self._grant()
+            if isinstance(exc, asyncio.TimeoutError):
+                self.timed_out += 1
+                raise QueueFull("deadline", self.retry_after()) from None
+            raise
+
+    def _release(self, places):
+        self._running -= places
+        self._grant()
+
+    def _grant(self):
+        # Hand free places straight to the waiters, in order, the main line
+        # before the batch line, for as long as the next one fits.
+        for line in (self._waiters, self._bulk):
+            while line:
+                waiter, places = line[0]
+                if waiter.done():
+                    line.popleft()
+                    continue
+                if self._running + places > self.max_running:
+                    return
+                line.popleft()
+                self._running += places
+                waiter.set_result(None)
+
+    def stats(self):
+        return {
+            "depth": self.depth,
+            "bulk_depth": self.bulk_depth,
+            "running": self._running,
+            "max_running": self.max_running,
+            "max_waiting": self.max_waiting,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "mean_wait_ms": round(self._wait_total_ms / self.admitted, 1) if self.admitted else 0.0,
+            "max_wait_ms": round(self.max_wait_ms, 1),
+        }
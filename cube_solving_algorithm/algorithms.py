@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from move_tables import parse_moves, sequence_perm
+
+# Named move sequences the layer method uses again and again, each
+# precomposed into one sticker permutation when it is registered. Cube.
+# run_algorithm applies the whole sequence in one gather instead of one per
+# turn, while the move log still gets every turn.
+#
+# Move names are the ones CubeHelper records (L, D and B are axis based, see
+# move_tables.py).
+
+
+@dataclass(frozen=True)
+class Algorithm:
+    name: str
+    moves: tuple
+    # Gather index: new_stickers = old_stickers[perm].
+    perm: np.ndarray
+
+
+_ALGORITHMS = {}
+
+
+def register(name, moves):
+    moves = tuple(moves.split() if isinstance(moves, str) else moves)
+    parse_moves(moves)  # unknown names fail here rather than mid-solve
+    perm = sequence_perm(moves)
+    perm.setflags(write=False)
+    algorithm = Algorithm(name, moves, perm)
+    _ALGORITHMS[name] = algorithm
+    return algorithm
+
+
+def get(name):
+    # A registered name, or any move sequence, which is compiled once and
+    # kept under its own text.
+    algorithm = _ALGORITHMS.get(name)
+    if algorithm is None:
+        algorithm = register(name, name)
+    return algorithm
+
+
+def names():
+    return sorted(_ALGORITHMS)
+
+
+# Second layer: bring the top edge at the first position down into the slot
+# at the second.
+register("layer2_UB_to_BL", "U L' U' L U' B U B'")
+register("layer2_UB_to_BR", "U' R' U R U B' U' B")
+register("layer2_UF_to_FL", "U' L U L' U F U' F'")
+register("layer2_UF_to_FR", "U R U' R' U' F' U F")
+register("layer2_UL_to_BL", "U' B U B' U L' U' L")
+register("layer2_UL_to_FL", "U F U' F' U' L U L'")
+register("layer2_UR_to_FR", "U' F' U F U R U' R'")
+register("layer2_UR_to_BR", "U B' U' B U' R' U R")
+
+# Top cross from a line, held horizontally or vertically.
+register("line_to_cross", "F R U R' U' F'")
+register("line_to_cross_left", "L' F U F' U' L")
+
+# Sune, started from each side face.
+register("sune_R", "R U R' U R U U R'")
+register("sune_L", "L' U L U L' U U L")
+register("sune_F", "F U F' U F U U F'")
+register("sune_B", "B' U B U B' U U B")
+
+# Three top corners cycled in place, the named one staying put.
+register("corner_cycle_URF", "U R U' L U R' U' L'")
+register("corner_cycle_ULB", "U L' U' R' U L U' R")
+register("corner_cycle_UBR", "U B' U' F' U B U' F")
+register("corner_cycle_UFL", "U F U' B U F' U' B'")
+
+# Swaps the top and bottom right front corners, twisting both; six in a row
+# bring the cube back, so it is repeated until the top one sits right.
+register("corner_twist", "R' D R D'")
@@ -0,0 +1,81 @@
+import numpy as np
+
+from move_tables import FACES, MOVE_INDEX, MOVE_PERMS, N_MOVES, SOLVED_STATE
+
+# Row N_MOVES is the identity, so a negative move index can pad ragged
+# sequences in an (N, L) move array.
+_PERMS = np.vstack([MOVE_PERMS, np.arange(54, dtype=np.intp)])
+NO_MOVE = -1
+
+
+def to_batch(cubes):
+    # Stack nested 6x3x3 lists, Cube objects or flat 54-sticker rows into an
+    # (N, 54) uint8 array.
+    rows = []
+    for cube in cubes:
+        state = getattr(cube, "scrambled_cube", cube)
+        rows.append(np.asarray(state, dtype=np.uint8).reshape(54))
+    return np.stack(rows) if rows else np.empty((0, 54), dtype=np.uint8)
+
+
+def to_nested(states):
+    return np.asarray(states).reshape(-1, 6, 3, 3).tolist()
+
+
+def solved_batch(n, colors=None):
+    # `colors` gives the sticker value of each face in Back, Top, Front,
+    # Bottom, Left, Right order; defaults to the face index 0..5.
+    solved = SOLVED_STATE if colors is None else np.repeat(np.asarray(colors, dtype=np.uint8), 9)
+    return np.tile(solved, (n, 1))
+
+
+def encode_moves(sequences, length=None):
+    # Lists of move names ("R", "U2", ...) -> (N, L) int array padded with NO_MOVE.
+    sequences = [s.split() if isinstance(s, str) else list(s) for s in sequences]
+    if length is None:
+        length = max((len(s) for s in sequences), default=0)
+    out = np.full((len(sequences), length), NO_MOVE, dtype=np.int8)
+    for i, seq in enumerate(sequences):
+        out[i, : len(seq)] = [m if isinstance(m, (int, np.integer)) else MOVE_INDEX[m] for m in seq]
+    return out
+
+
+def apply_moves_batch(states, moves):
+    # states: (N, 54). moves: (N,) for one move per cube or (N, L) for a
+    # sequence per cube, applied left to right. Returns a new (N, 54) array.
+    states = np.asarray(states)
+    moves = np.asarray(moves)
+    if states.ndim != 2 or states.shape[1] != 54:
+        raise ValueError(f"expected states of shape (N, 54), got {states.shape}")
+    if moves.ndim == 1:
+        moves = moves[:, None]
+    if moves.ndim != 2 or moves.shape[0] != states.shape[0]:
+        raise ValueError(f"expected moves of shape (N,) or (N, L) with N={states.shape[0]}, got {moves.shape}")
+    moves = np.where(moves < 0, N_MOVES, moves).astype(np.intp)
+    for step in range(moves.shape[1]):
+        states = np.take_along_axis(states, _PERMS[moves[:, step]], axis=1)
+    return states
+
+
+def random_move_sequences(n, length, rng=None):
+    # (N, L) random moves that never turn the same face twice in a row.
+    rng = np.random.default_rng(rng)
+    faces = np.empty((n, length), dtype=np.intp)
+    if length:
+        faces[:, 0] = rng.integers(0, len(FACES), n)
+    for step in range(1, length):
+        # Draw from the five faces other than the previous one.
+        offset = rng.integers(1, len(FACES), n)
+        faces[:, step] = (faces[:, step - 1] + offset) % len(FACES)
+    powers = rng.integers(0, 3, (n, length))
+    return (3 * faces + powers).astype(np.int8)
+
+
+def scramble_batch(n, length=25, rng=None, colors=None):
+    moves = random_move_sequences(n, length, rng)
+    return apply_moves_batch(solved_batch(n, colors), moves), moves
+
+
+def is_solved_batch(states):
+    faces = np.asarray(states).reshape(-1, 6, 9)
+    return (faces == faces[:, :, 4:5]).all(axis=(1, 2))
@@ -0,0 +1,217 @@
+import argparse
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+from cubie import CubieCube
+import bidirectional
+import engines
+import optimal
+import two_by_two
+import two_phase
+
+# Benchmarks solver engines on a fixed corpus of random cubes and writes the
+# numbers as JSON, so runs can be compared:
+#
+#   python bench.py --engine layer --engine two_phase --out bench.json
+#   python bench.py --engine layer --out new.json --baseline bench.json
+#
+# The corpus is drawn uniformly from all solvable states (not from random
+# move sequences) with a fixed seed, so every run sees the same cubes. 2x2
+# cubes are the corners of the 3x3 ones. There is no 4x4 solver yet, so
+# there is nothing to benchmark for size 4.
+#
+# The report also has the time a fresh interpreter takes to import the
+# solver, and whether that pulled in pandas (it should not).
+#
+# With --baseline, any run that is slower than the matching baseline run by
+# more than --threshold (solves/sec down or a latency percentile up) is
+# reported and the exit status is 1, as is a slower import.
+DEFAULT_COUNT = 10000
+DEFAULT_SEED = 0
+DEFAULT_THRESHOLD = 0.10
+
+# Colours of the Back, Top, Front, Bottom, Left and Right faces, held the way
+# the README describes, which every engine can solve.
+COLORS = [5, 1, 6, 3, 2, 4]
+
+# What to load (or build) before timing each engine, by (engine, size).
+WARM_UP = {
+    ("two_phase", 3): two_phase.get_tables,
+    ("optimal", 3): optimal.get_tables,
+    ("bidirectional", 3): bidirectional.warm_up,
+    ("optimal", 2): two_by_two.get_tables,
+}
+
+
+def corpus(count=DEFAULT_COUNT, seed=DEFAULT_SEED, size=3):
+    rng = np.random.default_rng(seed)
+    cubes = [CubieCube.random(rng).to_cube(COLORS) for _ in range(count)]
+    if size == 2:
+        cubes = [[[face[r][0], face[r][2]] for r in (0, 2)] for cube in cubes for face in cube]
+        cubes = [cubes[i : i + 6] for i in range(0, len(cubes), 6)]
+    return cubes
+
+
+def corpus_digest(cubes):
+    # Short fingerprint of the cubes, so results are only compared when they
+    # were measured on the same corpus.
+    return hashlib.sha1(np.asarray(cubes, dtype=np.uint8).tobytes()).hexdigest()[:12]
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return round(peak / (1 << 20 if sys.platform == "darwin" else 1 << 10), 1)
+
+
+def measure_import(module="solver", repeat=5):
+    # Median wall time of `import module` in a fresh interpreter, in ms.
+    script = (
+        "import sys, time\n"
+        "started = time.perf_counter()\n"
+        f"import {module}\n"
+        "print((time.perf_counter() - started) * 1000, 'pandas' in sys.modules)\n"
+    )
+    here = os.path.dirname(os.path.abspath(__file__))
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", script], cwd=here, capture_output=True, text=True, check=True)
+        ms, pandas_loaded = out.stdout.split()
+        times.append(float(ms))
+    return {"module": module, "ms": round(float(np.median(times)), 1), "loads_pandas": pandas_loaded == "True"}
+
+
+def run(engine, size=3, count=DEFAULT_COUNT, seed=DEFAULT_SEED, cubes=None):
+    cubes = corpus(count, seed, size) if cubes is None else cubes
+    if (engine, size) in WARM_UP:
+        WARM_UP[engine, size]()
+
+    latencies = []
+    lengths = []
+    gave_up = Counter()
+    started = time.perf_counter()
+    for cube in cubes:
+        t0 = time.perf_counter()
+        try:
+            moves = engines.solve_state(cube, engine, size).moves
+        except engines.SolveGaveUp as exc:
+            gave_up[exc.reason] += 1
+        else:
+            lengths.append(len(moves))
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+
+    latencies_ms = np.array(latencies) * 1000
+    failures = sum(gave_up.values())
+    return {
+        "engine": engine,
+        "size": size,
+        "count": len(cubes),
+        "seed": seed,
+        "corpus": corpus_digest(cubes),
+        "elapsed_s": round(elapsed, 3),
+        "solves_per_sec": round(len(cubes) / elapsed, 2),
+        "latency_ms": {
+            "p50": round(float(np.percentile(latencies_ms, 50)), 3),
+            "p95": round(float(np.percentile(latencies_ms, 95)), 3),
+            "p99": round(float(np.percentile(latencies_ms, 99)), 3),
+            "max": round(float(latencies_ms.max()), 3),
+        },
+        "moves": {
+            "mean": round(float(np.mean(lengths)), 2) if lengths else None,
+            "max": max(lengths) if lengths else None,
+        },
+        "failures": failures,
+        "failure_rate": round(failures / len(cubes), 4),
+        "gave_up": dict(gave_up),
+        # Peak of the whole process so far, so it includes earlier runs.
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD):
+    # Regressions of `report` against the baseline report, as messages. Runs
+    # without a baseline on the same corpus are skipped.
+    regressions = []
+    now, was = report.get("import"), baseline.get("import")
+    if now and was and now["module"] == was["module"] and now["ms"] > was["ms"] * (1 + threshold):
+        regressions.append(f"import {now['module']}: {now['ms']} ms, up from {was['ms']} ms")
+    if now and now["loads_pandas"]:
+        regressions.append(f"import {now['module']}: loads pandas")
+    previous = {(r["engine"], r["size"], r["corpus"]): r for r in baseline.get("runs", [])}
+    runs = report["runs"]
+    for r in runs:
+        before = previous.get((r["engine"], r["size"], r["corpus"]))
+        if before is None:
+            continue
+        name = f"{r['engine']} ({r['size']}x{r['size']})"
+        if r["solves_per_sec"] < before["solves_per_sec"] * (1 - threshold):
+            regressions.append(
+                f"{name}: {r['solves_per_sec']} solves/sec, down from {before['solves_per_sec']}"
+            )
+        for key in ("p50", "p95", "p99"):
+            now, was = r["latency_ms"][key], before["latency_ms"][key]
+            if now > was * (1 + threshold):
+                regressions.append(f"{name}: {key} latency {now} ms, up from {was} ms")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the cube solvers on a fixed random corpus.")
+    parser.add_argument("--engine", action="append", help="engine to run (repeatable; default: the size's default)")
+    parser.add_argument("--size", type=int, choices=sorted(engines.ENGINES_BY_SIZE), default=3)
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--out", help="write the report here as JSON")
+    parser.add_argument("--baseline", help="earlier report to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown (0.1 = 10%%)")
+    args = parser.parse_args(argv)
+
+    cubes = corpus(args.count, args.seed, args.size)
+    runs = []
+    for engine in args.engine or [engines.DEFAULT_ENGINE[args.size]]:
+        result = run(engine, args.size, seed=args.seed, cubes=cubes)
+        runs.append(result)
+        print(
+            f"{engine}: {result['solves_per_sec']} solves/sec, "
+            f"p50/p95/p99 {result['latency_ms']['p50']}/{result['latency_ms']['p95']}/{result['latency_ms']['p99']} ms, "
+            f"{result['moves']['mean']} moves on average (max {result['moves']['max']}), "
+            f"{result['failure_rate']:.1%} gave up, peak RSS {result['peak_rss_mb']} MB"
+        )
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "import": measure_import(),
+        "runs": runs,
+    }
+    print(f"import solver: {report['import']['ms']} ms")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
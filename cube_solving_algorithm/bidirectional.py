@@ -0,0 +1,155 @@
+import threading
+import time
+
+import numpy as np
+
+from cubie import MOVE_CUBES, CubieCube
+from move_tables import INVERSE_MOVE, MOVE_NAMES, N_MOVES
+
+# Bidirectional breadth-first search: grows layers of states outwards from
+# the scrambled cube and meets them with layers grown from the solved cube.
+# It finds shortest solutions for short scrambles quickly and gives up on
+# anything deeper than both sides together can reach. The layers around
+# the solved cube are the same for every cube, so each process builds them
+# once (about a third of a second for the default five moves) and
+# keeps them.
+#
+# States are whole cubies: row k of `corners` holds piece * 3 + twist for
+# every corner position, `edges` piece * 2 + flip for every edge position.
+MAX_SIDE_DEPTH = 5
+
+# Corner move m sends the value at position _CORNER_SRC[m][i] to position i
+# and _CORNER_TURN[m][i] maps that value to its new one.
+_CORNER_SRC = np.array([c.cp for c in MOVE_CUBES], dtype=np.intp)
+_EDGE_SRC = np.array([c.ep for c in MOVE_CUBES], dtype=np.intp)
+_CORNER_TURN = np.empty((N_MOVES, 8, 24), dtype=np.uint8)
+_EDGE_TURN = np.empty((N_MOVES, 12, 24), dtype=np.uint8)
+for _m, _move in enumerate(MOVE_CUBES):
+    _v = np.arange(24)
+    for _i in range(8):
+        _CORNER_TURN[_m, _i] = _v // 3 * 3 + (_v % 3 + _move.co[_i]) % 3
+    for _i in range(12):
+        _EDGE_TURN[_m, _i] = _v // 2 * 2 + (_v % 2 + _move.eo[_i]) % 2
+_CORNER_WEIGHTS = 24 ** np.arange(8, dtype=np.int64)
+_EDGE_WEIGHTS = 24 ** np.arange(12, dtype=np.int64)
+
+
+class _Layer:
+    # One BFS layer: its states, and for each the index of its parent in the
+    # layer before and the move that led from there.
+    def __init__(self, corners, edges, parent, move):
+        self.corners = corners
+        self.edges = edges
+        self.parent = parent
+        self.move = move
+        self.keys = _keys(corners, edges)
+        self._order = None
+
+    def sorted_keys(self):
+        # (order, keys[order]), sorted once and kept for the solved side.
+        if self._order is None:
+            # _order last: another thread may be reading as soon as it is set.
+            order = np.argsort(self.keys)
+            self._sorted = self.keys[order]
+            self._order = order
+        return self._order, self._sorted
+
+
+def _keys(corners, edges):
+    # 64-bit digest of each state; matches are confirmed on the full state.
+    ck = corners.astype(np.int64) @ _CORNER_WEIGHTS
+    ek = edges.astype(np.int64) @ _EDGE_WEIGHTS
+    return ek.astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15) + ck.astype(np.uint64)
+
+
+def _expand(layer, seen):
+    # All states one move further out that are not in `seen`.
+    n = len(layer.keys)
+    corners = np.empty((N_MOVES * n, 8), dtype=np.uint8)
+    edges = np.empty((N_MOVES * n, 12), dtype=np.uint8)
+    for m in range(N_MOVES):
+        rows = slice(m * n, (m + 1) * n)
+        corners[rows] = _CORNER_TURN[m, np.arange(8), layer.corners[:, _CORNER_SRC[m]]]
+        edges[rows] = _EDGE_TURN[m, np.arange(12), layer.edges[:, _EDGE_SRC[m]]]
+    keys = _keys(corners, edges)
+    _, first = np.unique(keys, return_index=True)
+    first = first[~np.isin(keys[first], seen)]
+    parent = (first % n).astype(np.int32)
+    move = (first // n).astype(np.int8)
+    return _Layer(corners[first], edges[first], parent, move)
+
+
+def _start(cube):
+    corners = np.array([[p * 3 + o for p, o in zip(cube.cp, cube.co)]], dtype=np.uint8)
+    edges = np.array([[p * 2 + o for p, o in zip(cube.ep, cube.eo)]], dtype=np.uint8)
+    return _Layer(corners, edges, np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.int8))
+
+
+def _path(layers, index):
+    # Moves leading from layers[0] to state `index` of the last layer.
+    moves = []
+    for layer in reversed(layers[1:]):
+        moves.append(int(layer.move[index]))
+        index = int(layer.parent[index])
+    return moves[::-1]
+
+
+_solved_layers = []
+_solved_lock = threading.Lock()
+
+
+def _solved_side(depth):
+    # Layers around the solved cube, grown on demand and kept per process.
+    # Solves in other threads wait while a layer is added.
+    with _solved_lock:
+        if not _solved_layers:
+            _solved_layers.append(_start(CubieCube()))
+        while len(_solved_layers) <= depth:
+            seen = np.concatenate([layer.keys for layer in _solved_layers])
+            _solved_layers.append(_expand(_solved_layers[-1], seen))
+        return _solved_layers[: depth + 1]
+
+
+def warm_up(side_depth=MAX_SIDE_DEPTH):
+    _solved_side(side_depth)
+
+
+def _meet(layer, others):
+    # First (shallowest) layer among `others` sharing a state with `layer`:
+    # (depth, index in layer, index in that other layer), or None.
+    for depth, other in enumerate(others):
+        order, sorted_keys = other.sorted_keys()
+        pos = np.minimum(np.searchsorted(sorted_keys, layer.keys), len(sorted_keys) - 1)
+        for i in np.flatnonzero(sorted_keys[pos] == layer.keys):
+            j = order[pos[i]]
+            if (layer.corners[i] == other.corners[j]).all() and (layer.edges[i] == other.edges[j]).all():
+                return depth, int(i), int(j)
+    return None
+
+
+def solve(scrambled_cube, side_depth=MAX_SIDE_DEPTH, timeout=None, cancelled=None):
+    # Returns a shortest solution as move names, or None if there is none of
+    # at most 2 * side_depth moves or the search was stopped first.
+    # `cancelled` is polled between layers.
+    deadline = None if timeout is None else time.perf_counter() + timeout
+    solved = _solved_side(side_depth)
+    layers = [_start(CubieCube.from_cube(scrambled_cube))]
+    seen = layers[0].keys
+    while True:
+        # Meeting the solved side at its shallowest possible layer makes
+        # this the shortest solution through the newest scrambled layer,
+        # and every shorter one would have met a layer before.
+        found = _meet(layers[-1], solved)
+        if found is not None:
+            depth, i, j = found
+            # The solved side was grown with moves away from solved; undo
+            # them in reverse to get back there.
+            back = _path(solved[: depth + 1], j)
+            moves = _path(layers, i) + [int(INVERSE_MOVE[m]) for m in reversed(back)]
+            return [MOVE_NAMES[m] for m in moves]
+        if len(layers) > side_depth:
+            return None
+        if (deadline is not None and time.perf_counter() > deadline) or (cancelled is not None and cancelled()):
+            return None
+        layers.append(_expand(layers[-1], seen))
+        seen = np.concatenate([seen, layers[-1].keys])
@@ -2,14 +2,16 @@
 
 from typing import Optional
 from helper import CubeHelper
+from facelet_state import FaceletState, FaceletCubeHelper
+from cubie import CubieCube
+from move_tables import sequence_perm
+import algorithms
+from solver_log import debug
 import random as rd
-import sys
-
-sys.setrecursionlimit(100)
 
 
 class Cube:
-    def __init__(self, scrambledCube: Optional[list]):
+    def __init__(self, scrambledCube: Optional[list], backend: str = "facelet"):
         self.cube = []
         self.colors = {
             "White": 4,
@@ -62,10 +64,20 @@ class Cube:
                 [[3, 4, 1], [6, 4, 4], [2, 3, 4]],
             ]
 
-        self.cube_helper = CubeHelper(self.dirs)
+        # "facelet" keeps the stickers in one flat uint8 buffer and exposes
+        # scrambled_cube as a (6, 3, 3) view of it; "list" keeps the original
+        # nested lists and the loop-based CubeHelper.
+        if backend == "facelet":
+            self.state = FaceletState.from_nested(self.scrambled_cube)
+            self.scrambled_cube = self.state.faces
+            self.cube_helper = FaceletCubeHelper(self.dirs)
+        elif backend == "list":
+            self.state = None
+            self.cube_helper = CubeHelper(self.dirs)
+        else:
+            raise ValueError(f"Unknown cube backend: {backend}")
         self.n = 3
         # self.scramble_moly_cube()
-        self.moves = []
         self.ursina_commands = {
             "L": "a",
             "D": "s",
@@ -93,9 +105,41 @@ class Cube:
             [[6, 6, 6], [6, 6, 6], [6, 6, 6]],
         ]
 
+    @property
+    def moves(self):
+        # The move log lives in the helper; this is the same list.
+        return self.cube_helper.moves
+
     def get_moves(self):
         return self.cube_helper.getmoves()
 
+    def to_cubie(self):
+        return CubieCube.from_cube(self.scrambled_cube)
+
+    def apply_moves(self, moves):
+        # Applies move_tables names (half turns included) as one permutation
+        # and appends them to the move log as given.
+        self._permute(sequence_perm(moves))
+        self.cube_helper.moves.extend(moves)
+
+    def run_algorithm(self, name):
+        # A named sequence from algorithms.py (or any move string), applied
+        # in one step. The turns go into the move log first, so a bounded
+        # log can stop it before the cube changes.
+        algorithm = algorithms.get(name)
+        self.cube_helper.moves.extend(algorithm.moves)
+        self._permute(algorithm.perm)
+
+    def _permute(self, perm):
+        if self.state is not None:
+            self.state.data[:] = self.state.data[perm]
+        else:
+            flat = [x for face in self.scrambled_cube for row in face for x in row]
+            flat = [flat[i] for i in perm]
+            for f in range(6):
+                for r in range(3):
+                    self.scrambled_cube[f][r] = flat[f * 9 + r * 3 : f * 9 + r * 3 + 3]
+
     def scramble_moly_cube(self):
         moves = ["F", "F1", "B", "B1", "U", "U1", "BT", "BT1", "L", "L1", "R", "R1"]
         for i in range(100):
@@ -211,7 +255,7 @@ class Cube:
         n = len(self.scrambled_cube[0])
         m = len(self.scrambled_cube[0][0])
         desired_piece_locs = set()
-        print(color)
+        debug("%s", color)
         color = 3
         # print(color)
         for i in range(size):
@@ -261,29 +305,24 @@ class Cube:
     def make_this_place_empty(self, index_of_opp_color, color, row, col):
         while self.is_occupied(index_of_opp_color, color, row, col):
             self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.moves.append("U")
 
     def move_center_pieces(self, pos_of_edge_piece, color, level):
         pieces = pos_of_edge_piece
         opp_color = self.get_opposite_color(color)
         index_of_opp_color = self.find_color(opp_color)
         color = self.colors[color]
-        print(pieces)
+        debug("pieces: %s", pieces, piece=pieces)
         # print(opp_color)
         # print(self.find_index_of_opposite_color(opp_color))
         for _ in pieces:
             dim, r, c = _
-            print(r)
+            debug("%s", r)
             if dim == 3:
-                print("Resolving Bottom Piece...")
+                debug("Resolving Bottom Piece...")
                 if c == 0 or c == self.n - 1:
                     if not self.is_occupied(index_of_opp_color, color, r, c):
                         self.cube_helper.rotate_X(self.scrambled_cube, 1, c)
                         self.cube_helper.rotate_X(self.scrambled_cube, 1, c)
-                        if c == 0:
-                            self.moves.extend(["L", "L"])
-                        else:
-                            self.moves.extend(["R", "R"])
                         # if c== 0:
                         #    self.scrambled_cube[0][0][c], self.scrambled_cube[0][2][c] = self.scrambled_cube[0][2][c], self.scrambled_cube[0][0][c]
                         # self.scrambled_cube[3][0][c], self.scrambled_cube[3][2][c] = self.scrambled_cube[3][2][c], self.scrambled_cube[3][0][c]
@@ -291,10 +330,6 @@ class Cube:
                         self.make_this_place_empty(index_of_opp_color, color, r, c)
                         self.cube_helper.rotate_X(self.scrambled_cube, 1, c)
                         self.cube_helper.rotate_X(self.scrambled_cube, 1, c)
-                        if c == 0:
-                            self.moves.extend(["L", "L"])
-                        else:
-                            self.moves.extend(["R", "R"])
                 else:
                     if not self.is_occupied(
                         index_of_opp_color, color, self.n - 1 - r, c
@@ -305,10 +340,6 @@ class Cube:
                         self.cube_helper.rotate_Z(
                             self.scrambled_cube, 1, self.n - 1 - r
                         )
-                        if self.n - 1 - r == 0:
-                            self.moves.extend(["B", "B"])
-                        else:
-                            self.moves.extend(["F", "F"])
                     else:
                         self.make_this_place_empty(
                             index_of_opp_color, color, self.n - 1 - r, c
@@ -319,103 +350,67 @@ class Cube:
                         self.cube_helper.rotate_Z(
                             self.scrambled_cube, 1, self.n - 1 - r
                         )
-                        if self.n - 1 - r == 0:
-                            self.moves.extend(["B", "B"])
-                        else:
-                            self.moves.extend(["F", "F"])
 
             elif dim == index_of_opp_color:
                 continue
             else:
                 # Back Plane
                 if dim == 0:
-                    print("Resolving Back Piece...")
+                    debug("Resolving Back Piece...")
                     if c == 0 or c == self.n - 1:
                         if not self.is_occupied(index_of_opp_color, color, r, c):
                             self.cube_helper.rotate_X(self.scrambled_cube, -1, c)
-                            if c == 0:
-                                self.moves.append("L'")
-                            else:
-                                self.moves.append("R'")
                         else:
                             self.make_this_place_empty(index_of_opp_color, color, r, c)
                             self.cube_helper.rotate_X(self.scrambled_cube, -1, c)
-                            if c == 0:
-                                self.moves.append("L'")
-                            else:
-                                self.moves.append("R")
                     else:
                         if r == self.n - 1:
                             lrow, lcol = r + 1, c - 1
                             rrow, rcol = r + 1, c + 1
                             self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
-                            self.moves.append("B")
                             self.make_this_place_empty(index_of_opp_color, color, 1, 0)
                             self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
-                            self.moves.append("L'")
                         else:
                             if self.is_occupied(index_of_opp_color, color, 0, 1):
                                 self.make_this_place_empty(
                                     index_of_opp_color, color, 0, 1
                                 )
-                            print("Rotating in Z direction")
+                            debug("Rotating in Z direction")
                             self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
-                            self.moves.append("B")
                             self.make_this_place_empty(index_of_opp_color, color, 1, 0)
                             self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
-                            self.moves.append("L'")
 
                 # Front
                 elif dim == 2:
-                    print("Resolving Front piece...")
+                    debug("Resolving Front piece...")
                     if c == 0 or c == self.n - 1:
                         if not self.is_occupied(index_of_opp_color, color, r, c):
                             self.cube_helper.rotate_X(self.scrambled_cube, 1, c)
-                            if c == 0:
-                                self.moves.append("L")
-                            else:
-                                self.moves.append("R")
                         else:
                             self.make_this_place_empty(index_of_opp_color, color, r, c)
                             self.cube_helper.rotate_X(self.scrambled_cube, 1, c)
-                            if c == 0:
-                                self.moves.append("L")
-                            else:
-                                self.moves.append("R")
                     else:
                         self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-                        self.moves.append("F")
                         self.make_this_place_empty(index_of_opp_color, color, 1, 2)
                         self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
-                        self.moves.append("L")
                 # Left
                 elif dim == 4:
-                    print("Resolving Left piece...")
+                    debug("Resolving Left piece...")
                     if c == 0 or c == self.n - 1:
                         if not self.is_occupied(index_of_opp_color, color, c, r):
                             self.cube_helper.rotate_Z(self.scrambled_cube, 1, c)
-                            if c == 0:
-                                self.moves.append("B")
-                            else:
-                                self.moves.append("F")
                         else:
                             # print("making this place empty...")
                             self.make_this_place_empty(index_of_opp_color, color, c, r)
                             self.cube_helper.rotate_Z(self.scrambled_cube, 1, c)
-                            if c == 0:
-                                self.moves.append("B")
-                            else:
-                                self.moves.append("F")
                     else:
                         # self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
                         # piece = self.collect_pieces(color, 1)
                         # dim_, r_, c_ = piece[0]
                         self.make_this_place_empty(index_of_opp_color, color, 1, 0)
                         self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
-                        self.moves.append("L")
                         self.make_this_place_empty(index_of_opp_color, color, 2, 1)
                         self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-                        self.moves.append("F")
                         # if not self.is_occupied(index_of_opp_color, color, c_, r_):
                         # self.cube_helper.rotate_Z(self.scrambled_cube, 1, c_)
                         # else:
@@ -424,7 +419,7 @@ class Cube:
 
                 # Right
                 elif dim == 5:
-                    print("Resolving Right Piece...")
+                    debug("Resolving Right Piece...")
                     if c == 0 or c == self.n - 1:
                         if not self.is_occupied(
                             index_of_opp_color, color, self.n - 1 - c, r
@@ -432,10 +427,6 @@ class Cube:
                             self.cube_helper.rotate_Z(
                                 self.scrambled_cube, -1, self.n - 1 - c
                             )
-                            if self.n - 1 - c == 0:
-                                self.moves.append("B'")
-                            else:
-                                self.moves.append("F'")
                         else:
                             self.make_this_place_empty(
                                 index_of_opp_color, color, self.n - 1 - c, r
@@ -443,19 +434,13 @@ class Cube:
                             self.cube_helper.rotate_Z(
                                 self.scrambled_cube, -1, self.n - 1 - c
                             )
-                            if self.n - 1 - c == 0:
-                                self.moves.append("B'")
-                            else:
-                                self.moves.append("F'")
                         # self.scrambled_cube[4][0][2], self.scrambled_cube[4][2][2] = self.scrambled_cube[4][2][2], self.scrambled_cube[4][0][2]
                         # self.scrambled_cube[5][0][0], self.scrambled_cube[5][2][0] = self.scrambled_cube[5][2][0], self.scrambled_cube[5][0][0]
                     else:
                         self.make_this_place_empty(index_of_opp_color, color, 1, 2)
                         self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                        self.moves.append("R")
                         self.make_this_place_empty(index_of_opp_color, color, 0, 1)
                         self.cube_helper.rotate_Z(self.scrambled_cube, -1, 0)
-                        self.moves.append("B'")
 
     def collect_pieces2(self, index_of_opp_color, color):
         if self.scrambled_cube[index_of_opp_color][0][1] == color:
@@ -483,14 +468,14 @@ class Cube:
             # print("Left and Back")
             if index_of_color > index_of_matching_color:
                 # left to back
-                print("Rotating from left to back")
+                debug("Rotating from left to back")
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                 self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
                 # self.scrambled_cube[3][2] = self.scrambled_cube[3][2][::-1]
             else:
                 # Back to Left
-                print("Rotating from back to left")
+                debug("Rotating from back to left")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
@@ -505,14 +490,14 @@ class Cube:
             # print("Left and Face")
             if index_of_color > index_of_matching_color:
                 # Left to Face
-                print("Rotating from left to face")
+                debug("Rotating from left to face")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
                 self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
                 # self.scrambled_cube[3][0] = self.scrambled_cube[3][0][::-1]
             else:
                 # Face to Left
-                print("Rotating from face to left")
+                debug("Rotating from face to left")
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                 self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
@@ -527,7 +512,7 @@ class Cube:
             # print("Left and Right")
             if index_of_color < index_of_matching_color:
                 # Left to Right
-                print("Rotating from left to right")
+                debug("Rotating from left to right")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 # self.scrambled_cube[4][0] = self.scrambled_cube[4][0][::-1]
@@ -549,7 +534,7 @@ class Cube:
 
             else:
                 # Right to Left
-                print("Rotating from right to left")
+                debug("Rotating from right to left")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 # self.scrambled_cube[4][0] = self.scrambled_cube[4][0][::-1]
@@ -574,7 +559,7 @@ class Cube:
             # print("Back and Right")
             if index_of_color < index_of_matching_color:
                 # Back to right
-                print("Rotating from back to right")
+                debug("Rotating from back to right")
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                 self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
                 self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
@@ -595,7 +580,7 @@ class Cube:
 
             else:
                 # Right to Back
-                print("Rotating from right to back")
+                debug("Rotating from right to back")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
@@ -606,7 +591,7 @@ class Cube:
             # print("Back and Face")
             if index_of_color < index_of_matching_color:
                 # Back to Face
-                print("Rotating from back to face")
+                debug("Rotating from back to face")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 # self.scrambled_cube[2][0] = self.scrambled_cube[2][0][::-1]
@@ -618,7 +603,7 @@ class Cube:
 
             else:
                 # Face to Back
-                print("Rotating from face to back")
+                debug("Rotating from face to back")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 # self.scrambled_cube[0][0] = self.scrambled_cube[0][0][::-1]
@@ -631,7 +616,7 @@ class Cube:
             # print("Right and Face")
             if index_of_color > index_of_matching_color:
                 # Right to Face
-                print("Rotating from right to face")
+                debug("Rotating from right to face")
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                 self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
                 self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
@@ -639,7 +624,7 @@ class Cube:
                 # self.scrambled_cube[3][0] = self.scrambled_cube[3][0][::-1]
             else:
                 # Face to Right
-                print("Rotating from face to right")
+                debug("Rotating from face to right")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
                 self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
@@ -657,44 +642,44 @@ class Cube:
                 for i in range(3):
                     self.scrambled_cube[3][i][2] = temp[i]
         else:
-            print("Inavlid...")
+            debug("Inavlid...")
 
     def helper_of_edge_to_bottom(self, piece, index_of_opp_color_, color_):
         pieces = piece
-        print(pieces)
+        debug("pieces: %s", pieces, piece=pieces)
         index_of_opp_color = index_of_opp_color_
         color = color_
         dim, r, c = pieces
         if r == 0:
             # It is connected to back [row = 2 and col = c]
             back_color = self.scrambled_cube[0][2][c]
-            print("Back color " + str(back_color))
+            debug("Back color %s", back_color)
             index_of_back_color = self.find_matching_color(back_color)
             if index_of_back_color == 0:  # index of back is 0
-                print("Already matched...")
+                debug("Already matched...")
                 self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
                 # self.scrambled_cube[1][0] = self.scrambled_cube[1][0][::-1]
                 # self.scrambled_cube[3][2] = self.scrambled_cube[3][2][::-1]
             else:
-                print("Not matched...")
+                debug("Not matched...")
                 self.handle_when_centre_dont_matched(0, index_of_back_color)
         elif r == self.n - 1:
             # It is connected to Front face [row = 0 and col = c]
             face_color = self.scrambled_cube[2][0][c]
-            print("Face color " + str(face_color))
+            debug("Face color %s", face_color)
             index_of_face_color = self.find_matching_color(face_color)
             if index_of_face_color == 2:  # index of face is 2
-                print("Already matched...")
+                debug("Already matched...")
                 self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
                 self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-                print("I am here...")
+                debug("I am here...")
             # self.scrambled_cube[1][2] = self.scrambled_cube[1][2][::-1]
             # self.scrambled_cube[3][0] = self.scrambled_cube[3][0][::-1]
             # self.scrambled_cube[1][2][0], self.scrambled_cube[1][2][2] = self.scrambled_cube[1][2][2], self.scrambled_cube[1][2][0]
             #               self.scrambled_cube[3][0][0], self.scrambled_cube[3][0][2] = self.scrambled_cube[3][0][2], self.scrambled_cube[3][0][0]
             else:
-                print("Not matched...")
+                debug("Not matched...")
                 self.handle_when_centre_dont_matched(2, index_of_face_color)
         elif c == 0:
             # It is connected to left piece
@@ -702,7 +687,7 @@ class Cube:
             # print("Left color "+str(left_color))
             index_of_left_color = self.find_matching_color(left_color)
             if index_of_left_color == 4:  # index of left is 4
-                print("Already matched...")
+                debug("Already matched...")
                 self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
                 # self.scrambled_cube[0][0][0], self.scrambled_cube[0][2][0] = self.scrambled_cube[0][2][0], self.scrambled_cube[0][0][0]
@@ -722,7 +707,7 @@ class Cube:
             #                   self.scrambled_cube[3][i][0] = temp[i]
 
             else:
-                print("Not matched...")
+                debug("Not matched...")
                 self.handle_when_centre_dont_matched(4, index_of_left_color)
         else:
             # It is connected to right piece
@@ -730,7 +715,7 @@ class Cube:
             # print("Right color "+str(right_color))
             index_of_right_color = self.find_matching_color(right_color)
             if index_of_right_color == 5:  # index of right color is 5
-                print("Already matched...")
+                debug("Already matched...")
                 self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
                 self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
                 temp = []
@@ -747,7 +732,7 @@ class Cube:
                 for i in range(3):
                     self.scrambled_cube[3][i][2] = temp[i]
             else:
-                print("Not matched...")
+                debug("Not matched...")
                 self.handle_when_centre_dont_matched(5, index_of_right_color)
 
     def bring_edge_pieces_to_bottom(self, color):
@@ -757,7 +742,7 @@ class Cube:
         piece = self.collect_pieces2(index_of_opp_color, index_of_color)
         # print(opp_color, index_of_opp_color, piece)
         if len(piece) == 0:
-            print("Task completed...")
+            debug("Task completed...")
             return 1
         else:
             self.helper_of_edge_to_bottom(piece, index_of_opp_color, color)
@@ -767,7 +752,7 @@ class Cube:
         pieces = self.collect_pieces(color, 1)
         # print(pieces)
         if len(pieces) == 0:
-            print("Level 1 is completed")
+            debug("Level 1 is completed")
             return 1
         else:
             self.move_center_pieces(pieces, color, 1)
@@ -796,16 +781,14 @@ class Cube:
         return -1
 
     def find_centres_of_two_colors(self, dim, color1, color2):
-        print(f"Two colors are: {color1} and {color2}")
+        debug("Two colors are: %s and %s", color1, color2)
         if color1 == 2 and color2 == 5:
             # Red -> Green
             dimc1, dimc2 = self.find_dimensions(color1), self.find_dimensions(color2)
-            print(
-                f"Current dimensions: {dim}, Color1 dimension: {dimc1}, Color2 dimension: {dimc2}"
-            )
+            debug("Current dimensions: %s, Color1 dimension: %s, Color2 dimension: %s", dim, dimc1, dimc2)
             if dimc2 == 0:
                 # take it to the back
-                print("Taking it back")
+                debug("Taking it back")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
@@ -821,7 +804,7 @@ class Cube:
                 # take it to right
                 pass
             else:
-                print("Invalid")
+                debug("Invalid")
         elif color1 == 5 and color2 == 2:
             pass
         elif color1 == 2 and color2 == 6:
@@ -837,24 +820,24 @@ class Cube:
         elif color1 == 5 and color2 == 4:
             pass
         else:
-            print("Inavlid")
+            debug("Inavlid")
 
     def handle_top_facers(self, piece, color):
         dim, r, c = piece
         if dim == 1:
-            print("Handling top facing...")
+            debug("Handling top facing...")
             # Top facing
             if c == 2:
-                print("I am at last col")
+                debug("I am at last col")
                 if r == 0:
-                    print("I am at first row")
+                    debug("I am at first row")
                     self.cube_helper.rotate_X(self.scrambled_cube, -1, c)
                     self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                     self.cube_helper.rotate_X(self.scrambled_cube, 1, c)
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                     self.handle_front_facers([2, 0, 2], color)
                 else:
-                    print("I am at last row")
+                    debug("I am at last row")
                     self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                     self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
@@ -867,17 +850,17 @@ class Cube:
                 # self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
                 # self.handle_front_facers([4, 0, 0], color)
             elif c == 0:
-                print("I am at first col")
+                debug("I am at first col")
                 # self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 if r == 0:
-                    print("I am at first row")
+                    debug("I am at first row")
                     self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                     self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
                     self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                     self.handle_front_facers([2, 0, 0], color)
                 else:
-                    print("I am at last row")
+                    debug("I am at last row")
                     self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
                     self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                     self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
@@ -889,30 +872,30 @@ class Cube:
 
         elif dim == 3:
             # Down facing
-            print("Handling down facing...")
+            debug("Handling down facing...")
 
     def handle_front_facers(self, piece, color):
         dim, r, c = piece
-        print(piece)
+        debug("piece: %s", piece, piece=piece)
         if dim == 4:
             # Left sides
             if r == 0:
-                print("Bringing top cornered from left to front")
+                debug("Bringing top cornered from left to front")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
 
                 # self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
             else:
-                print("Bringing bottom cornered from left to front")
+                debug("Bringing bottom cornered from left to front")
         elif dim == 5:
             # right side
             if r == 0:
-                print("Bringing top cornered from right to front")
+                debug("Bringing top cornered from right to front")
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
             else:
-                print("Bringing bottom cornered from right to front")
+                debug("Bringing bottom cornered from right to front")
         elif dim == 2:
             if r == 2:
-                print("Bringing front facer from bottom to top")
+                debug("Bringing front facer from bottom to top")
                 self.cube_helper.rotate_X(self.scrambled_cube, 1, c)
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_X(self.scrambled_cube, -1, c)
@@ -927,29 +910,29 @@ class Cube:
         # self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
 
         # piece = self.collect_pieces3(color)
-        print(piece)
+        debug("piece: %s", piece, piece=piece)
         if dim == 1 or dim == 3:
             self.handle_top_facers(piece, color)
             return
 
         if dim == 0:
-            print("Handling back cornered piece...")
-            print("I am at back...")
+            debug("Handling back cornered piece...")
+            debug("I am at back...")
             if c == 0:
-                print("I am at left....")
+                debug("I am at left....")
                 if r == 2:
-                    print("I am at bottom")
+                    debug("I am at bottom")
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                     up_color = self.scrambled_cube[1][2][2]
                     right_color = self.scrambled_cube[5][0][0]
-                    print(up_color, right_color)
+                    debug("%s %s", up_color, right_color)
                     if (
                         self.scrambled_cube[2][1][1] == up_color
                         and self.scrambled_cube[5][1][1] == right_color
                     ):
                         # corner piece lies between front and right face
-                        print("i lie between front and right... -> corner piece")
+                        debug("i lie between front and right... -> corner piece")
                         self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                         self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
                         self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
@@ -959,7 +942,7 @@ class Cube:
                         and self.scrambled_cube[2][1][1] == right_color
                     ):
                         # corner piece lies between front and left piece
-                        print("I lie between front and left piece... -> corner piece")
+                        debug("I lie between front and left piece... -> corner piece")
                         self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                         self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                         self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
@@ -970,7 +953,7 @@ class Cube:
                         and self.scrambled_cube[0][1][1] == up_color
                     ):
                         # corner piece lies between left and back
-                        print("I lie between left and back... -> corner piece")
+                        debug("I lie between left and back... -> corner piece")
                         self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                         self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                         self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
@@ -982,22 +965,22 @@ class Cube:
                         and self.scrambled_cube[0][1][1] == right_color
                     ):
                         # corner piece lies between back and right
-                        print("I lie between back and right... -> corner piece")
+                        debug("I lie between back and right... -> corner piece")
                         self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                         self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                         self.cube_helper.rotate_Z(self.scrambled_cube, -1, 0)
                         self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                         self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
                 else:
-                    print("I am at top")
+                    debug("I am at top")
                     self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                     self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
                     self.handle_front_facers([0, 2, 0], color)
             else:
-                print("I am at right....")
+                debug("I am at right....")
                 if r == 2:
-                    print("I am at bottom...")
+                    debug("I am at bottom...")
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                     up_color = self.scrambled_cube[1][2][0]
@@ -1007,7 +990,7 @@ class Cube:
                         left_color == self.scrambled_cube[2][1][1]
                         and up_color == self.scrambled_cube[5][1][1]
                     ):
-                        print("I am at front and right....")
+                        debug("I am at front and right....")
                         self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                         self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                         self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
@@ -1017,7 +1000,7 @@ class Cube:
                         left_color == self.scrambled_cube[4][1][1]
                         and up_color == self.scrambled_cube[2][1][1]
                     ):
-                        print("I am at left and front....")
+                        debug("I am at left and front....")
                         self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                         self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
                         self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
@@ -1026,12 +1009,12 @@ class Cube:
                         left_color == self.scrambled_cube[0][1][1]
                         and up_color == self.scrambled_cube[4][1][1]
                     ):
-                        print("I am at back and left....")
+                        debug("I am at back and left....")
                     elif (
                         left_color == self.scrambled_cube[5][1][1]
                         and up_color == self.scrambled_cube[0][1][1]
                     ):
-                        print("I am at right and back....")
+                        debug("I am at right and back....")
                         self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                         self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                         self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
@@ -1040,7 +1023,7 @@ class Cube:
                         self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
 
                 else:
-                    print("I am at top...")
+                    debug("I am at top...")
                     self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
                     self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                     self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
@@ -1052,7 +1035,7 @@ class Cube:
                         and right_color == self.scrambled_cube[5][1][1]
                     ):
                         # I will be at back
-                        print("I will be at back")
+                        debug("I will be at back")
                         self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                         self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
                         self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
@@ -1062,19 +1045,19 @@ class Cube:
                         and right_color == self.scrambled_cube[0][1][1]
                     ):
                         # I will be at left and back
-                        print("I will be at left and back")
+                        debug("I will be at left and back")
                     elif (
                         top_color == self.scrambled_cube[2][1][1]
                         and right_color == self.scrambled_cube[4][1][1]
                     ):
                         # I will be at front and left
-                        print("I will be at front and left")
+                        debug("I will be at front and left")
                     elif (
                         top_color == self.scrambled_cube[5][1][1]
                         and right_color == self.scrambled_cube[2][1][1]
                     ):
                         # I will be at front and right
-                        print("I will be at front and right")
+                        debug("I will be at front and right")
                 # self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                 # self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                 # self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
@@ -1087,7 +1070,7 @@ class Cube:
             # Left Cornered
             if r == 0:
                 # top
-                print("Handling left-top cornered...")
+                debug("Handling left-top cornered...")
                 up_color = self.scrambled_cube[1][2][0]
                 left_color = self.scrambled_cube[4][0][2]
                 if (
@@ -1095,7 +1078,7 @@ class Cube:
                     and self.scrambled_cube[4][1][1] == left_color
                 ):
                     # if cornere pieces lies between left and front pieces
-                    print("I will be at left and front")
+                    debug("I will be at left and front")
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                     self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
                     # self.scrambled_cube[0][0][0], self.scrambled_cube[0][2][0] = self.scrambled_cube[0][2][0], self.scrambled_cube[0][0][0]
@@ -1109,7 +1092,7 @@ class Cube:
                     and self.scrambled_cube[5][1][1] == up_color
                 ):
                     # if corner piece lies between front and right pieces
-                    print("I will be at right and front")
+                    debug("I will be at right and front")
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                     self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
@@ -1121,7 +1104,7 @@ class Cube:
                     and self.scrambled_cube[0][1][1] == left_color
                 ):
                     # if corner piece lies between left and back
-                    print("I will be at left and back")
+                    debug("I will be at left and back")
                     self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                     # self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
@@ -1141,7 +1124,7 @@ class Cube:
                     and self.scrambled_cube[5][1][1] == left_color
                 ):
                     # if corner piece lies between back and right_color
-                    print("I will be at back and right")
+                    debug("I will be at back and right")
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
@@ -1150,7 +1133,7 @@ class Cube:
                     self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
             else:
                 # Bottom
-                print("Handling left-bottom cornered...")
+                debug("Handling left-bottom cornered...")
                 self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
@@ -1167,16 +1150,16 @@ class Cube:
             # Right Cornered
             if r == 0:
                 # Top
-                print("Handling Right-top cornered...")
+                debug("Handling Right-top cornered...")
                 up_color = self.scrambled_cube[1][2][2]
                 right_color = self.scrambled_cube[5][0][0]
-                print(f"Top color: {up_color} and Right color: {right_color}")
+                debug("Top color: %s and Right color: %s", up_color, right_color)
                 if (
                     self.scrambled_cube[4][1][1] == up_color
                     and self.scrambled_cube[2][1][1] == right_color
                 ):
                     # piece will lie between left and face
-                    print("I am left and face")
+                    debug("I am left and face")
                     self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                     self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                     self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
@@ -1187,7 +1170,7 @@ class Cube:
                     and self.scrambled_cube[5][1][1] == right_color
                 ):
                     # piece will lie between front and right
-                    print("I am face and right")
+                    debug("I am face and right")
                     self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                     self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
@@ -1197,7 +1180,7 @@ class Cube:
                     and self.scrambled_cube[0][1][1] == right_color
                 ):
                     # piece will lie between right and back
-                    print("I am right and back")
+                    debug("I am right and back")
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                     # self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                     self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
@@ -1209,7 +1192,7 @@ class Cube:
                     and self.scrambled_cube[4][1][1] == right_color
                 ):
                     # piece will lie between left and back
-                    print("I am left and back")
+                    debug("I am left and back")
                     self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                     self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                     self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
@@ -1218,7 +1201,7 @@ class Cube:
                     self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
             else:
                 # Bottom
-                print("Handling Right-bottom cornered...")
+                debug("Handling Right-bottom cornered...")
                 self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
@@ -1248,46 +1231,46 @@ class Cube:
     def handle_corner_pieces(self, color):
         piece = self.collect_pieces3(color)
         if len(piece) == 0:
-            print("No corner pieces...")
+            debug("No corner pieces...")
             response = self.is_layer_2_complete(color)
-            print(f"{response=}")
+            debug("response=%r", response)
             if len(response) != 0:
                 d, r, c = response
                 if d == 0:
                     if r == 0 and c == 0:
-                        print("I am at back first peice")
+                        debug("I am at back first peice")
                         self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
                         self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                         self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
                         self.handle_front_facers([5, 0, 2], color)
                         return self.is_layer_2_complete(color)
                     elif r == 0 and c == 2:
-                        print("I am at back last piece")
+                        debug("I am at back last piece")
                         pass
                 elif d == 2:
                     if c == 0:
-                        print("I am at front first piece")
+                        debug("I am at front first piece")
                         pass
                     elif c == 2:
-                        print("I am at front last piece")
+                        debug("I am at front last piece")
                         pass
                 elif d == 4:
                     if c == 0:
-                        print("I am at left first piece")
+                        debug("I am at left first piece")
                         pass
                     elif c == 2:
-                        print("I am at left last piece")
+                        debug("I am at left last piece")
                         pass
                 else:
                     if c == 0:
-                        print("I am at right first piece")
+                        debug("I am at right first piece")
                         pass
                     elif c == 0:
-                        print("I am at right last piece")
+                        debug("I am at right last piece")
                         pass
                 return 0
             return 1
-        print(f"Corner piece: {piece}")
+        debug("Corner piece: %s", piece, piece=piece)
         dim, r, c = piece
         if dim == 1 or dim == 3:
             self.handle_top_facers(piece, color)
@@ -1297,10 +1280,10 @@ class Cube:
 
     def running_template(self, color):
         while self.solve_level_one(color) == 0:
-            self.solve_level_one(color)
+            pass
 
         while self.bring_edge_pieces_to_bottom(color) == 0:
-            self.bring_edge_pieces_to_bottom(color)
+            pass
 
         # self.handle_corner_pieces(color)
         # self.handle_corner_pieces(color)
@@ -1331,162 +1314,92 @@ class Cube:
     def handle_layer2_middle_pieces(self, front_color, top_color, piece):
         dim, r, c = piece
         if dim == 0:
-            print("I am at back broo...")
+            debug("I am at back broo...")
             if self.scrambled_cube[4][1][1] == top_color:
-                print("Move from back to right...")
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, -1, 0)
+                debug("Move from back to right...")
+                self.run_algorithm("layer2_UB_to_BL")
             elif self.scrambled_cube[5][1][1] == top_color:
-                print("Move fron back to left...")
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
+                debug("Move fron back to left...")
+                self.run_algorithm("layer2_UB_to_BR")
             return
         if dim == 2:
-            print("I am at front bro...")
+            debug("I am at front bro...")
             if self.scrambled_cube[4][1][1] == top_color:
-                print("Moving front to right")
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
+                debug("Moving front to right")
+                self.run_algorithm("layer2_UF_to_FL")
             elif self.scrambled_cube[5][1][1] == top_color:
-                print("Moving front to left")
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
+                debug("Moving front to left")
+                self.run_algorithm("layer2_UF_to_FR")
             return
         if dim == 4:
-            print("I am at left bro...")
+            debug("I am at left bro...")
             if self.scrambled_cube[0][1][1] == top_color:
-                print("Move to front....")
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
+                debug("Move to front....")
+                self.run_algorithm("layer2_UL_to_BL")
             elif self.scrambled_cube[2][1][1] == top_color:
-                print("Move to back....")
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
+                debug("Move to back....")
+                self.run_algorithm("layer2_UL_to_FL")
             return
 
         if dim == 5:
-            print("I am at right bro...")
+            debug("I am at right bro...")
             if self.scrambled_cube[2][1][1] == top_color:
-                print("Move right to back")
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
+                debug("Move right to back")
+                self.run_algorithm("layer2_UR_to_FR")
             elif self.scrambled_cube[0][1][1] == top_color:
-                print("Move right to front")
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
+                debug("Move right to front")
+                self.run_algorithm("layer2_UR_to_BR")
             else:
-                print("No match")
+                debug("No match")
             return
         else:
-            print("Invalid...")
+            debug("Invalid...")
 
     def layer2_helper(self, piece):
         if len(piece) == 0:
-            print("Handling invalid piece")
+            debug("Handling invalid piece")
             if (
                 self.scrambled_cube[0][1][2] != self.scrambled_cube[0][1][1]
                 or self.scrambled_cube[0][1][0] != self.scrambled_cube[0][1][1]
             ):
-                print("I am at back")
+                debug("I am at back")
                 if self.scrambled_cube[0][1][2] != self.scrambled_cube[0][1][1]:
-                    print("Move back to left")
-                    self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                    self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                    self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                    self.cube_helper.rotate_Z(self.scrambled_cube, -1, 0)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                    self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
+                    debug("Move back to left")
+                    self.run_algorithm("layer2_UB_to_BR")
                     piece = self.collect_pieces4()
                     self.layer2_helper(piece)
                 else:
-                    print("Move back to right")
+                    debug("Move back to right")
             elif (
                 self.scrambled_cube[4][1][2] != self.scrambled_cube[4][1][1]
                 or self.scrambled_cube[4][1][0] != self.scrambled_cube[4][1][1]
             ):
-                print("I am at left")
+                debug("I am at left")
                 if self.scrambled_cube[4][1][2] != self.scrambled_cube[4][1][1]:
-                    print("Move left to back")
+                    debug("Move left to back")
                 else:
-                    print("Move to left to front")
-                    self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                    self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                    self.cube_helper.rotate_Z(self.scrambled_cube, -1, 0)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                    self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                    self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
+                    debug("Move to left to front")
+                    self.run_algorithm("layer2_UL_to_BL")
                     piece = self.collect_pieces4()
                     self.layer2_helper(piece)
             elif (
                 self.scrambled_cube[2][1][2] != self.scrambled_cube[2][1][1]
                 or self.scrambled_cube[2][1][0] != self.scrambled_cube[2][1][1]
             ):
-                print("I am at front")
+                debug("I am at front")
                 if self.scrambled_cube[2][1][2] != self.scrambled_cube[2][1][1]:
-                    print("Move front to left")
+                    debug("Move front to left")
                 else:
-                    print("Move front to right")
+                    debug("Move front to right")
             elif (
                 self.scrambled_cube[5][1][2] != self.scrambled_cube[5][1][1]
                 or self.scrambled_cube[5][1][0] != self.scrambled_cube[5][1][1]
             ):
-                print("I am at right")
+                debug("I am at right")
                 if self.scrambled_cube[5][1][2] != self.scrambled_cube[5][1][1]:
-                    print("Move right to front")
+                    debug("Move right to front")
                 else:
-                    print("Move right to back")
+                    debug("Move right to back")
             return
         dim, r, c = piece
         front_color = self.scrambled_cube[dim][r][c]
@@ -1501,80 +1414,80 @@ class Cube:
 
         top_color = self.scrambled_cube[1][r_][c_]
 
-        print(f"Top color: {top_color}")
-        print(f"Front color: {front_color}")
+        debug("Top color: %s", top_color)
+        debug("Front color: %s", front_color)
         if self.scrambled_cube[dim][1][1] == front_color:
-            print("Already matched...")
+            debug("Already matched...")
             self.handle_layer2_middle_pieces(front_color, top_color, piece)
             return
         if self.scrambled_cube[4][1][1] == front_color:
-            print("I am at left: center...")
+            debug("I am at left: center...")
             # self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
             if dim == 0:
-                print("I am at back...")
+                debug("I am at back...")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.handle_layer2_middle_pieces(front_color, top_color, [4, 0, 1])
                 return
             elif dim == 2:
-                print("I am at front...")
-                print("Moving from front -> left...")
+                debug("I am at front...")
+                debug("Moving from front -> left...")
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                 self.handle_layer2_middle_pieces(front_color, top_color, [4, 0, 1])
                 return
 
             elif dim == 5:
-                print("I am at right")
+                debug("I am at right")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.handle_layer2_middle_pieces(front_color, top_color, [4, 0, 1])
 
         elif self.scrambled_cube[5][1][1] == front_color:
-            print("I am at right: center....")
+            debug("I am at right: center....")
             if dim == 0:
-                print("Moving from back to right...")
+                debug("Moving from back to right...")
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                 self.handle_layer2_middle_pieces(front_color, top_color, [5, 0, 1])
             elif dim == 4:
-                print("Moving from left to right")
+                debug("Moving from left to right")
             elif dim == 2:
-                print("Moving from front to right")
+                debug("Moving from front to right")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.handle_layer2_middle_pieces(front_color, top_color, [5, 0, 1])
         elif self.scrambled_cube[0][1][1] == front_color:
-            print("I am at back: center....")
+            debug("I am at back: center....")
             if dim == 2:
-                print(" moving from front to back...")
+                debug(" moving from front to back...")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.handle_layer2_middle_pieces(front_color, top_color, [0, 2, 1])
                 return
             elif dim == 4:
-                print("moving from left to back...")
+                debug("moving from left to back...")
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                 self.handle_layer2_middle_pieces(front_color, top_color, [0, 2, 1])
             elif dim == 5:
-                print("moving from right to back...")
+                debug("moving from right to back...")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.handle_layer2_middle_pieces(front_color, top_color, [0, 2, 1])
         elif self.scrambled_cube[2][1][1] == front_color:
-            print("I am at front: center...")
+            debug("I am at front: center...")
             if dim == 5:
-                print("Bringing piece from right to front")
+                debug("Bringing piece from right to front")
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                 self.handle_layer2_middle_pieces(front_color, top_color, [2, 0, 1])
 
             elif dim == 0:
-                print("Brining peice from back to front")
+                debug("Brining peice from back to front")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.handle_layer2_middle_pieces(front_color, top_color, [2, 0, 1])
             else:
-                print("Bringing piece from left to front")
+                debug("Bringing piece from left to front")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.handle_layer2_middle_pieces(front_color, top_color, [2, 0, 1])
 
         else:
-            print("Invalid...")
+            debug("Invalid...")
 
     def check_is_middle_layer_completed(self):
         dims = [0, 4, 2, 5]
@@ -1598,7 +1511,7 @@ class Cube:
 
     def hande_layer2(self, color):
         piece = self.collect_pieces4()
-        print(f"Layer 2: {piece}")
+        debug("Layer 2: %s", piece, piece=piece)
         if len(piece) == 0:
             if self.check_is_middle_layer_completed():
                 return True
@@ -1607,50 +1520,36 @@ class Cube:
                 dim, t = pos
                 r, c = t
                 if dim == 0:
-                    print("Perform operations on back")
+                    debug("Perform operations on back")
                     if c == 0:
-                        print("Move right")
-                        self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                        self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
-                        self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                        self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
-                        self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                        self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
-                        self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                        self.cube_helper.rotate_Z(self.scrambled_cube, -1, 0)
+                        debug("Move right")
+                        self.run_algorithm("layer2_UB_to_BL")
                     else:
-                        print("Move left")
+                        debug("Move left")
                         # self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 elif dim == 2:
-                    print("Perform operations on front")
+                    debug("Perform operations on front")
                     if c == 0:
-                        print("Move right")
+                        debug("Move right")
                     else:
-                        print("Move left")
-                        self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                        self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                        self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                        self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                        self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                        self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
-                        self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                        self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
+                        debug("Move left")
+                        self.run_algorithm("layer2_UF_to_FR")
                         # self.layer2_helper([2, 0, 1])
 
                 elif dim == 4:
-                    print("Perform operations on left")
+                    debug("Perform operations on left")
                     if c == 0:
-                        print("Move right")
+                        debug("Move right")
                     else:
-                        print("Move left")
+                        debug("Move left")
                 elif dim == 4:
-                    print("Perform operations on right")
+                    debug("Perform operations on right")
                     if c == 0:
-                        print("Move right")
+                        debug("Move right")
                     else:
-                        print("Move left")
+                        debug("Move left")
                 else:
-                    print("You are a dick")
+                    debug("You are a dick")
             # return True
 
         self.layer2_helper(piece)
@@ -1759,10 +1658,10 @@ class Cube:
         c_colors2.sort()
         c_colors3.sort()
         c_colors4.sort()
-        print(f"T1pieces: {tpiece1} and C1_colors: {c_colors1}")
-        print(f"T1pieces: {tpiece2} and C1_colors: {c_colors2}")
-        print(f"T1pieces: {tpiece3} and C1_colors: {c_colors3}")
-        print(f"T1pieces: {tpiece4} and C1_colors: {c_colors4}")
+        debug("T1pieces: %s and C1_colors: %s", tpiece1, c_colors1)
+        debug("T1pieces: %s and C1_colors: %s", tpiece2, c_colors2)
+        debug("T1pieces: %s and C1_colors: %s", tpiece3, c_colors3)
+        debug("T1pieces: %s and C1_colors: %s", tpiece4, c_colors4)
 
         if (
             tpiece1 == c_colors1
@@ -1770,166 +1669,89 @@ class Cube:
             and tpiece3 == c_colors3
             and tpiece4 == c_colors4
         ):
-            print("All are perfect....")
+            debug("All are perfect....")
             k = self.check_is_top_complete()
             if len(k) == 0:
-                print("Go duck yourself....")
-                return
+                debug("Go duck yourself....")
+                return 1
             if k[0] == 0 and k[1] == 0:
-                print("Bringing left top cornered to bottom right cornered")
+                debug("Bringing left top cornered to bottom right cornered")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 while self.scrambled_cube[1][2][2] != self.scrambled_cube[1][1][1]:
-                    self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, 1, 2)
+                    self.run_algorithm("corner_twist")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 while self.scrambled_cube[1][2][2] != self.scrambled_cube[1][1][1]:
-                    self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, 1, 2)
+                    self.run_algorithm("corner_twist")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 while self.scrambled_cube[1][2][2] != self.scrambled_cube[1][1][1]:
-                    self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, 1, 2)
+                    self.run_algorithm("corner_twist")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 while self.scrambled_cube[1][2][2] != self.scrambled_cube[1][1][1]:
-                    self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, 1, 2)
+                    self.run_algorithm("corner_twist")
                 while self.scrambled_cube[2][1][1] != self.scrambled_cube[2][0][1]:
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                print("Go SYD now...")
-                return
+                debug("Go SYD now...")
+                return 1
             elif k[0] == 0 and k[1] == 2:
-                print("Bringing top right cornered to bottom right cornered")
+                debug("Bringing top right cornered to bottom right cornered")
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
                 while self.scrambled_cube[1][2][2] != self.scrambled_cube[1][1][1]:
-                    self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, 1, 2)
+                    self.run_algorithm("corner_twist")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 while self.scrambled_cube[1][2][2] != self.scrambled_cube[1][1][1]:
-                    self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, 1, 2)
+                    self.run_algorithm("corner_twist")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 while self.scrambled_cube[1][2][2] != self.scrambled_cube[1][1][1]:
-                    self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, 1, 2)
+                    self.run_algorithm("corner_twist")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 while self.scrambled_cube[1][2][2] != self.scrambled_cube[1][1][1]:
-                    self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, 1, 2)
+                    self.run_algorithm("corner_twist")
                 while self.scrambled_cube[2][1][1] != self.scrambled_cube[2][0][1]:
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                print("Go SYD now...")
-
-                return
+                debug("Go SYD now...")
+                return 1
             elif k[0] == 2 and k[1] == 0:
-                print("Bringing left bottom cornered to bottom right cornered")
+                debug("Bringing left bottom cornered to bottom right cornered")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 while self.scrambled_cube[1][2][2] != self.scrambled_cube[1][1][1]:
-                    self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, 1, 2)
+                    self.run_algorithm("corner_twist")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 while self.scrambled_cube[1][2][2] != self.scrambled_cube[1][1][1]:
-                    self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, 1, 2)
+                    self.run_algorithm("corner_twist")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 while self.scrambled_cube[1][2][2] != self.scrambled_cube[1][1][1]:
-                    self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, 1, 2)
+                    self.run_algorithm("corner_twist")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
                 while self.scrambled_cube[1][2][2] != self.scrambled_cube[1][1][1]:
-                    self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, -1, 2)
-                    self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                    self.cube_helper.rotate_Y(self.scrambled_cube, 1, 2)
+                    self.run_algorithm("corner_twist")
                 while self.scrambled_cube[2][1][1] != self.scrambled_cube[2][0][1]:
                     self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                print("Go SYD now...")
-                return
+                debug("Go SYD now...")
+                return 1
             else:
-                print("Eat 5-star do nothing!!")
-                return
+                debug("Eat 5-star do nothing!!")
+                return 1
 
         if tpiece1 == c_colors1:
-            print("Applying algorithm on top left cornered")
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-            self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-            self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-            self.handle_twisted_pieces()
-            return
+            debug("Applying algorithm on top left cornered")
+            self.run_algorithm("corner_cycle_ULB")
+            return 0
         if tpiece2 == c_colors2:
-            print("Applying algorithm on top right cornered")
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-            self.handle_twisted_pieces()
-
-            return
+            debug("Applying algorithm on top right cornered")
+            self.run_algorithm("corner_cycle_UBR")
+            return 0
         if tpiece3 == c_colors3:
-            print("Applying algorithm on bottom left cornered")
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, -1, 0)
-            self.handle_twisted_pieces()
-            return
+            debug("Applying algorithm on bottom left cornered")
+            self.run_algorithm("corner_cycle_UFL")
+            return 0
         if tpiece4 == c_colors4:
-            print("Applying algorithm on bottom right cornered")
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-            self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-            self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
-            self.handle_twisted_pieces()
-            return
-        print("No one matched.. apply on anyone")
-        self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-        self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-        self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-        self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
-        self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-        self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-        self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-        self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
-        self.handle_twisted_pieces()
+            debug("Applying algorithm on bottom right cornered")
+            self.run_algorithm("corner_cycle_URF")
+            return 0
+        debug("No one matched.. apply on anyone")
+        self.run_algorithm("corner_cycle_URF")
+        return 0
 
     def is_L_shaped(self, top_mat):
         # L shaped
@@ -1947,7 +1769,7 @@ class Cube:
         return False
 
     def handle_plus_on_top(self, color):
-        print("Let's handle plus on top...")
+        debug("Let's handle plus on top...")
         is_matching = False
         dims = []
         if (
@@ -1956,144 +1778,94 @@ class Cube:
             and self.scrambled_cube[0][2][1] == self.scrambled_cube[0][1][1]
             and self.scrambled_cube[5][0][1] == self.scrambled_cube[5][1][1]
         ):
-            print("Hurray!!, we did it...")
-            self.handle_twisted_pieces()
-            return
+            debug("Hurray!!, we did it...")
+            return 1
         if (
             self.scrambled_cube[2][0][1] == self.scrambled_cube[2][1][1]
             and self.scrambled_cube[4][0][1] == self.scrambled_cube[4][1][1]
         ):
             is_matching = True
             dims.extend([2, 4])
-            print("Front and Left")
-            self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
+            debug("Front and Left")
+            self.run_algorithm("sune_L")
             while self.scrambled_cube[2][0][1] != self.scrambled_cube[2][1][1]:
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.handle_plus_on_top(color)
-            return
+            return 0
         elif (
             self.scrambled_cube[2][0][1] == self.scrambled_cube[2][1][1]
             and self.scrambled_cube[5][0][1] == self.scrambled_cube[5][1][1]
         ):
             is_matching = True
             dims.extend([2, 5])
-            print("Front and right")
-            self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
+            debug("Front and right")
+            self.run_algorithm("sune_F")
             self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
             while self.scrambled_cube[2][0][1] != self.scrambled_cube[2][1][1]:
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.handle_plus_on_top(color)
-            return
+            return 0
         elif (
             self.scrambled_cube[2][0][1] == self.scrambled_cube[2][1][1]
             and self.scrambled_cube[0][2][1] == self.scrambled_cube[0][1][1]
         ):
             is_matching = True
             dims.extend([2, 0])
-            print("Front and back")
+            debug("Front and back")
             while self.scrambled_cube[4][1][1] != self.scrambled_cube[4][0][1]:
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-            self.handle_plus_on_top(color)
-            return
+            return 0
         elif (
             self.scrambled_cube[4][0][1] == self.scrambled_cube[4][1][1]
             and self.scrambled_cube[0][2][1] == self.scrambled_cube[0][1][1]
         ):
             is_matching = True
             dims.extend([4, 0])
-            print("Left and back")
-            self.cube_helper.rotate_Z(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, 1, 0)
+            debug("Left and back")
+            self.run_algorithm("sune_B")
             while not self.is_two_colors_matching()[0]:
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.handle_plus_on_top(color)
-            return
+            return 0
         elif (
             self.scrambled_cube[4][0][1] == self.scrambled_cube[4][1][1]
             and self.scrambled_cube[5][0][1] == self.scrambled_cube[5][1][1]
         ):
             is_matching = True
             dims.extend([4, 5])
-            print("Left and right")
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
+            debug("Left and right")
             self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
+            self.run_algorithm("sune_F")
             while not self.is_two_colors_matching()[0]:
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.handle_plus_on_top(color)
-
-            return
+            return 0
         elif (
             self.scrambled_cube[0][2][1] == self.scrambled_cube[0][1][1]
             and self.scrambled_cube[5][0][1] == self.scrambled_cube[5][1][1]
         ):
             is_matching = True
             dims.extend([0, 5])
-            print("back and right....")
-            self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
+            debug("back and right....")
+            self.run_algorithm("sune_R")
             while not self.is_two_colors_matching()[0]:
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.handle_plus_on_top(color)
-            return
+            return 0
         if is_matching:
-            print("I am matching in two sides")
-            print(f"Dimensions: {dims}")
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
+            debug("I am matching in two sides")
+            debug("Dimensions: %s", dims)
             self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
+            self.run_algorithm("sune_F")
             while not self.is_two_colors_matching()[0]:
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
 
             materials = self.is_two_colors_matching()[1]
-            print(f"Here are matching colors...{materials}")
-            self.handle_plus_on_top(color)
+            debug("Here are matching colors...%s", materials)
+            return 0
 
         else:
-            print("I am not matching, unfortunately....")
+            debug("I am not matching, unfortunately....")
             self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.handle_plus_on_top(color)
+            return 0
 
     def handle_top_layer_figures(self, color):
-        print("Checking for a plus on top....")
+        debug("Checking for a plus on top....")
         top_mat = self.scrambled_cube[1]
         top_color = self.scrambled_cube[1][1][1]
         if (
@@ -2102,81 +1874,45 @@ class Cube:
             and top_mat[1][2] == top_color
             and top_mat[2][1] == top_color
         ):
-            print("Hello buddy i am your plus....")
-            self.handle_plus_on_top(color)
-            return
+            debug("Hello buddy i am your plus....")
+            return 1
         elif (top_mat[1][0] == top_color and top_mat[1][2] == top_color) or (
             top_mat[0][1] == top_color and top_mat[2][1] == top_color
         ):
-            print("Hello buddy i am your line...")
+            debug("Hello buddy i am your line...")
             if top_mat[1][0] == top_color and top_mat[1][2] == top_color:
-                print("I am horizontal line...")
-                self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-                self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
-                self.handle_top_layer_figures(color)
+                debug("I am horizontal line...")
+                self.run_algorithm("line_to_cross")
+                return 0
             else:
-                print("I am vertical line...")
-                self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
-                self.handle_top_layer_figures(color)
+                debug("I am vertical line...")
+                self.run_algorithm("line_to_cross_left")
+                return 0
 
         elif self.is_L_shaped(top_mat):
             if top_mat[0][1] == top_color and top_mat[1][0] == top_color:
-                print("I am L in upside left...")
-                self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-                self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
-                self.handle_top_layer_figures(color)
+                debug("I am L in upside left...")
+                self.run_algorithm("line_to_cross")
+                return 0
             elif top_mat[0][1] == top_color and top_mat[1][2] == top_color:
-                print("I am L in upside right...")
-                self.cube_helper.rotate_X(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, 1, 0)
-                self.handle_top_layer_figures(color)
+                debug("I am L in upside right...")
+                self.run_algorithm("line_to_cross_left")
+                return 0
             elif top_mat[2][1] == top_color and top_mat[1][0] == top_color:
-                print("I am L in downside left...")
+                debug("I am L in downside left...")
                 self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-                self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
-                self.handle_top_layer_figures(color)
+                self.run_algorithm("line_to_cross")
+                return 0
             elif top_mat[2][1] == top_color and top_mat[1][2] == top_color:
-                print("I am L in downside right...")
-                self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
+                debug("I am L in downside right...")
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-                self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-                self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-                self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
                 self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-                self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
-                self.handle_top_layer_figures(color)
+                self.run_algorithm("line_to_cross")
+                return 0
         else:
-            print("I am dot....")
-            self.cube_helper.rotate_Z(self.scrambled_cube, 1, 2)
-            self.cube_helper.rotate_X(self.scrambled_cube, 1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, -1, 0)
-            self.cube_helper.rotate_X(self.scrambled_cube, -1, 2)
-            self.cube_helper.rotate_Y(self.scrambled_cube, 1, 0)
-            self.cube_helper.rotate_Z(self.scrambled_cube, -1, 2)
-            self.handle_top_layer_figures(color)
+            debug("I am dot....")
+            self.run_algorithm("line_to_cross")
+            return 0
             # else:
             #     print("I am dot...")
             # while self.scrambled_cube[1][0][1] == self.scrambled_cube[1][1][1]:
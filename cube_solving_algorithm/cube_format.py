@@ -0,0 +1,114 @@
+import base64
+import binascii
+
+import numpy as np
+
+from cubie import FACE_SLOT
+from validator import InvalidCubeError
+
+# Compact wire formats for a 3x3 cube, next to the nested 6x3x3 lists:
+#
+#   facelets  54 letters, one per sticker, naming the face whose centre has
+#             its colour. Faces come in URFDLB order, each read row by row
+#             as seen from outside with U up (D with F up, U with B up), so
+#             a solved cube is "UUUUUUUUURRRRRRRRRFFFFFFFFFDDD..."
+#   packed    the same letters as 0-5, 3 bits each, in 21 bytes of base64
+#             (28 characters)
+#
+# Both convert with numpy lookups rather than per-sticker Python, and both
+# round-trip to the Cube.scrambled_cube layout.
+FACES = "URFDLB"
+FACELETS_LENGTH = 54
+PACKED_LENGTH = 28
+
+# Colours the letters stand for by default: a cube held the way the README
+# describes (Blue on top, Red in front, Green at the bottom).
+DEFAULT_COLORS = {"U": 1, "R": 4, "F": 6, "D": 3, "L": 2, "B": 5}
+
+# Sticker index in Cube.scrambled_cube of each facelet. The Back face is
+# stored rotated by 180 degrees, so it is read backwards.
+_ORDER = np.concatenate(
+    [
+        FACE_SLOT[face] * 9 + (np.arange(8, -1, -1) if face == "B" else np.arange(9))
+        for face in FACES
+    ]
+)
+_LETTERS = np.frombuffer(FACES.encode(), dtype=np.uint8)
+_FACE_OF_LETTER = np.full(256, 255, dtype=np.uint8)
+_FACE_OF_LETTER[_LETTERS] = np.arange(6)
+_CENTERS = [FACE_SLOT[face] * 9 + 4 for face in FACES]
+_BIT_WEIGHTS = np.array([4, 2, 1], dtype=np.uint8)
+
+
+def _face_indices(scrambled_cube):
+    # Face index (into FACES) of every facelet, naming colours by centres.
+    stickers = np.asarray(scrambled_cube)
+    if stickers.size != 54 or not np.issubdtype(stickers.dtype, np.integer):
+        raise InvalidCubeError("shape", "expected a 6x3x3 cube of integer colours")
+    stickers = stickers.reshape(54)
+    if stickers.min() < 0 or stickers.max() > 255:
+        raise InvalidCubeError("colors", "sticker colours must be between 0 and 255")
+    face_of = np.full(256, 255, dtype=np.uint8)
+    face_of[stickers[_CENTERS]] = np.arange(6)
+    faces = face_of[stickers[_ORDER]]
+    if len(set(stickers[_CENTERS].tolist())) != 6 or (faces == 255).any():
+        raise InvalidCubeError("centers", "every colour must be on exactly one centre")
+    return faces
+
+
+def _to_cube(faces, colors):
+    colors = DEFAULT_COLORS if colors is None else colors
+    stickers = np.empty(54, dtype=np.int64)
+    stickers[_ORDER] = np.array([colors[face] for face in FACES])[faces]
+    return stickers.reshape(6, 3, 3).tolist()
+
+
+def to_facelets(scrambled_cube):
+    return _LETTERS[_face_indices(scrambled_cube)].tobytes().decode()
+
+
+def from_facelets(facelets, colors=None):
+    # `colors` maps each letter to a colour number (default DEFAULT_COLORS).
+    raw = np.frombuffer(facelets.encode(), dtype=np.uint8)
+    if len(raw) != FACELETS_LENGTH:
+        raise InvalidCubeError("format", f"expected {FACELETS_LENGTH} facelet letters, got {len(raw)}")
+    faces = _FACE_OF_LETTER[raw]
+    if (faces == 255).any():
+        raise InvalidCubeError("format", f"facelets may only use the letters {FACES}")
+    return _to_cube(faces, colors)
+
+
+def to_packed(scrambled_cube):
+    bits = _face_indices(scrambled_cube)[:, None] >> np.array([2, 1, 0], dtype=np.uint8) & 1
+    return base64.b64encode(np.packbits(bits.reshape(-1)).tobytes()).decode()
+
+
+def from_packed(packed, colors=None):
+    try:
+        raw = base64.b64decode(packed, validate=True)
+    except (binascii.Error, ValueError):
+        raise InvalidCubeError("format", "packed cube is not valid base64") from None
+    if len(raw) != 21:
+        raise InvalidCubeError("format", f"packed cube must be 21 bytes, got {len(raw)}")
+    bits = np.unpackbits(np.frombuffer(raw, dtype=np.uint8))[: 3 * 54].reshape(54, 3)
+    faces = bits @ _BIT_WEIGHTS
+    if (faces > 5).any():
+        raise InvalidCubeError("format", "packed cube has a sticker value above 5")
+    return _to_cube(faces, colors)
+
+
+def decode(scrambled_cube, colors=None, size=3):
+    # Any of the three forms -> nested lists. Strings are told apart by
+    # length: 54 characters are facelets, 28 are packed.
+    if not isinstance(scrambled_cube, str):
+        return scrambled_cube
+    if size != 3:
+        raise InvalidCubeError("format", "only 3x3 cubes can be sent as strings")
+    if len(scrambled_cube) == FACELETS_LENGTH:
+        return from_facelets(scrambled_cube, colors)
+    if len(scrambled_cube) == PACKED_LENGTH:
+        return from_packed(scrambled_cube, colors)
+    raise InvalidCubeError(
+        "format",
+        f"a cube string must be {FACELETS_LENGTH} facelet letters or {PACKED_LENGTH} characters of packed base64",
+    )
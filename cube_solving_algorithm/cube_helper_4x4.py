@@ -1,3 +1,6 @@
+from solver_log import debug
+
+
 class EdgePiece:
     def __init__(self, face1, row1, col1, face2, row2, col2) -> None:
         self.face1 = face1
@@ -366,13 +369,13 @@ class Helper4x4:
                     front_index = self.faces_indices["Front"]
                     back_index = self.faces_indices["Back"]
                     bottom_index = self.faces_indices["Bottom"]
-                    print(f"{cube[top_index]=}")
-                    print(f"{self.colors_indices=}")
+                    debug("cube[top_index]=%r", cube[top_index])
+                    debug("self.colors_indices=%r", self.colors_indices)
 
                     for _ in range(self.n):
                         top.append(cube[top_index][_][col_idx])
                     
-                    print(f"{top=}")
+                    debug("top=%r", top)
 
                     for _ in range(self.n):
                         cube[top_index][_][col_idx] = cube[front_index][_][col_idx]
@@ -386,7 +389,7 @@ class Helper4x4:
                     for _ in range(self.n):
                         cube[back_index][_][col_idx] = top[_]
                     
-                    print(f"{top=}")
+                    debug("top=%r", top)
                     return
 
                 case "T" | "Bo" | "Top" | "Bottom":
@@ -752,39 +755,39 @@ class Helper4x4:
         This function checks whether pieces are side to each other or not
         If they are diagonal to each other, then bring them sideways
         """
-        print("Checking sideways....")
+        debug("Checking sideways....")
 
         # first check whether their exists a piece which is present at sideways
         if col == 1:
             # checking right side
             if cube[face_index][row][col+1] == color:
-                print("Sideways present.")
+                debug("Sideways present.")
                 return
             if row == 1:
                 # checking down side
                 if cube[face_index][row+1][col] == color:
-                    print("Downside present.")
+                    debug("Downside present.")
                     return
             else:
                 # checking upside
                 if cube[face_index][row-1][col] == color:
-                    print("Upside present.")
+                    debug("Upside present.")
                     return
         else:
             # checking left side
             if cube[face_index][row][col-1] == color:
-                print("Sideways present.")
+                debug("Sideways present.")
                 return
             
             if row == 1:
                 # checking down side
                 if cube[face_index][row+1][col] == color:
-                    print("Downside present.")
+                    debug("Downside present.")
                     return
             else:
                 # checking upside
                 if cube[face_index][row-1][col] == color:
-                    print("Upside present.")
+                    debug("Upside present.")
                     return
                 
 
@@ -799,12 +802,12 @@ class Helper4x4:
             if 1<=nrow<=2 and 1<=ncol<=2 and cube[face_index][nrow][ncol] == color:
                 side = "Right" if col == 2 else "Left"
                 # rotate this side clockwise
-                print(f"Got diagonal case! Rotating inner side: {side} to back.")
+                debug("Got diagonal case! Rotating inner side: %s to back.", side)
                 self.rotate_inner_sides(cube=cube, side=side, direction=1)
                 rotation_direction = 1 if row == 2 else -1
-                print(f"Rotating back face,  {rotation_direction=}")
+                debug("Rotating back face,  rotation_direction=%r", rotation_direction)
                 self.rotate_z(cube=cube, side="Back", direction=rotation_direction)
-                print("Bring that piece back.")
+                debug("Bring that piece back.")
                 self.rotate_inner_sides(cube=cube, side=side, direction=-1)
 
     def handle_Lcase_first_color(self, cube, pos: tuple, color: str):
@@ -826,29 +829,29 @@ class Helper4x4:
                 break
         
 
-        print(f"Vacant Row: {vac_row} and Vacant Col: {vac_col}")
+        debug("Vacant Row: %s and Vacant Col: %s", vac_row, vac_col)
         final_col = 1 if vac_col == 2 else 2
 
         # back face
         if face == 0:
-            print("Hey!! I am present at Back.")
+            debug("Hey!! I am present at Back.")
 
         # front
         elif face == 2:
-            print("Hey!! I am present at Front.")
+            debug("Hey!! I am present at Front.")
 
         # bottom
         elif face == 3:
-            print("Hey!! I am present at Bottom.")
+            debug("Hey!! I am present at Bottom.")
 
         # left
         elif face == 4:
-            print("Hey!! I am present at Left.")
+            debug("Hey!! I am present at Left.")
             if col == final_col:
-                print("Already at right col. No need to move")
+                debug("Already at right col. No need to move")
             
             else:
-                print("Bringing it to right column")
+                debug("Bringing it to right column")
                 if row == 1:
                     self.rotate_x(cube=cube, side="Left", direction=-1)
                 else:
@@ -859,9 +862,9 @@ class Helper4x4:
             final_row = col
             inner_side_to_rotate = None
             if final_row == 1:
-                print("Already at right row position. No need to move.")
+                debug("Already at right row position. No need to move.")
             else:
-                print("Rotating once in anti-clockwise left face to bring it at correct position.")
+                debug("Rotating once in anti-clockwise left face to bring it at correct position.")
                 self.rotate_x(cube=cube, side="Left", direction=-1)
 
             if vac_row == 1:
@@ -877,68 +880,68 @@ class Helper4x4:
 
         # right
         elif face == 5:
-            print("Hey!! I am present at Right.")
+            debug("Hey!! I am present at Right.")
 
         else:
             raise Exception(f"face {face} doesnot exist.")
 
     def make_center_pairs(self, cube, pos1, pos2):
-        print("Starting to make center pairs....")
-        print(f"{pos1=}")
-        print(f"{pos2=}")
+        debug("Starting to make center pairs....")
+        debug("pos1=%r", pos1)
+        debug("pos2=%r", pos2)
         face1, row1, col1 = pos1
         face2, row2, col2 = pos2
 
         if face1 == 0:
-            print("Piece 1 is at back.")
+            debug("Piece 1 is at back.")
             if face2 == 1:
-                print("Piece 2 is at top.")
+                debug("Piece 2 is at top.")
             elif face2 == 2:
-                print("Piece 2 is at front.")
+                debug("Piece 2 is at front.")
                 if row1 == self.n-1-row2:
-                    print("Already on same row.")
+                    debug("Already on same row.")
                     return
                 else:
                     side = "Top" if row1 == 2 else "Bottom"
-                    print("Rotating inner row.")
+                    debug("Rotating inner row.")
                     self.rotate_inner_sides(cube=cube, side=side, direction=1)
                     self.rotate_inner_sides(cube=cube, side=side, direction=1)
                     if col1 == col2:
-                        print("Already on same col.")
+                        debug("Already on same col.")
                     else:
                         if col1 != col2:
                             self.rotate_z(cube=cube, side="Back", direction=1)
-                    print("Done bringing to same loc.")
+                    debug("Done bringing to same loc.")
                     return face2, row2, col2
             elif face2 == 3:
-                print("Piece 2 is at bottom.")
+                debug("Piece 2 is at bottom.")
             elif face2 == 4:
-                print("Piece 2 is at left.")
+                debug("Piece 2 is at left.")
             elif face2 == 5:
-                print("Piece 2 is at right.")
+                debug("Piece 2 is at right.")
         elif face1 == 1:
-            print("Piece 1 is at top.")
+            debug("Piece 1 is at top.")
             if face2 == 0:
-                print("Piece 2 is at back.")
+                debug("Piece 2 is at back.")
             elif face2 == 2:
-                print("Piece 2 is at front.")
+                debug("Piece 2 is at front.")
             elif face2 == 3:
-                print("Piece 2 is at bottom.")
+                debug("Piece 2 is at bottom.")
             elif face2 == 4:
-                print("Piece 2 is at left.")
+                debug("Piece 2 is at left.")
             elif face2 == 5:
-                print("Piece 2 is at right.")
+                debug("Piece 2 is at right.")
 
         elif face1 == 2:
-            print("Piece 1 is at front.")
+            debug("Piece 1 is at front.")
             if face2 == 0:
-                print("Piece 2 is at back.")
+                debug("Piece 2 is at back.")
             elif face2 == 1:
-                print("Piece 2 is at top.")
+                debug("Piece 2 is at top.")
             elif face2 == 3:
-                print("Piece 2 is at bottom.")
+                debug("Piece 2 is at bottom.")
             elif face2 == 4:
-                print("Piece 2 is at left.")
+                debug("Piece 2 is at left.")
                 if row1 == row2:
                     if col1 == col2:
                         # move clockwise left face
@@ -947,28 +950,28 @@ class Helper4x4:
                         # first checking at right face
                         check_empty_front = self.check_for_empty_space(cube=cube, face_index=5, row=row1, color_number=color_number)
                         if check_empty_front == 4:
-                            print("All clear at right face")
+                            debug("All clear at right face")
                             # checking back face
                             check_empty_back = self.check_for_empty_space(cube=cube, row=abs(3-row1), face_index=0, color_number=color_number)
                             if check_empty_back == 4:
-                                print("All clear at back as well")
+                                debug("All clear at back as well")
                                 self.rotate_inner_sides(cube=cube, side="Bottom", direction=-1)
                             elif check_empty_back == 3:
-                                print("Colliding at col 2")
+                                debug("Colliding at col 2")
                             elif check_empty_back == 2:
-                                print("Colliding at col 1")
+                                debug("Colliding at col 1")
                             else:
-                                print("Colliding at same row")
+                                debug("Colliding at same row")
                     else:
                         pass
                 else:
                     if col1 == col2:
-                        print("Rows are different and cols are same.")
+                        debug("Rows are different and cols are same.")
                         color_number = cube[face1][row1][col1]
                         
                         face_index = self.fixed_color_positions[color_number]
                         check_empty_space = self.check_for_empty_space(cube=cube, row=row1, face_index=face_index, color_number=color_number)
-                        print(f"{check_empty_space=}")
+                        debug("check_empty_space=%r", check_empty_space)
                         if check_empty_space == 4:
                             # all clear
                             self.rotate_inner_sides(cube=cube, side="Top", direction=1)
@@ -984,43 +987,43 @@ class Helper4x4:
                     else:
                         pass
             elif face2 == 5:
-                print("Piece 2 is at right.")
+                debug("Piece 2 is at right.")
         elif face1 == 3:
-            print("Piece 1 is at bottom.")
+            debug("Piece 1 is at bottom.")
             if face2 == 0:
-                print("Piece 2 is at back.")
+                debug("Piece 2 is at back.")
             elif face2 == 1:
-                print("Piece 2 is at top.")
+                debug("Piece 2 is at top.")
             elif face2 == 2:
-                print("Piece 2 is at front.")
+                debug("Piece 2 is at front.")
             elif face2 == 4:
-                print("Piece 2 is at left.")
+                debug("Piece 2 is at left.")
             elif face2 == 5:
-                print("Piece 2 is at right.")
+                debug("Piece 2 is at right.")
         elif face1 == 4:
-            print("Piece 1 is at left.")
+            debug("Piece 1 is at left.")
             if face2 == 0:
-                print("Piece 2 is at back.")
+                debug("Piece 2 is at back.")
             elif face2 == 1:
-                print("Piece 2 is at top.")
+                debug("Piece 2 is at top.")
             elif face2 == 2:
-                print("Piece 2 is at front.")
+                debug("Piece 2 is at front.")
             elif face2 == 3:
-                print("Piece 2 is at bottom.")
+                debug("Piece 2 is at bottom.")
             elif face2 == 5:
-                print("Piece 2 is at right.")
+                debug("Piece 2 is at right.")
         elif face1 == 5:
-            print("Piece 1 is at right.")
+            debug("Piece 1 is at right.")
             if face2 == 0:
-                print("Piece 2 is at back.")
+                debug("Piece 2 is at back.")
             elif face2 == 1:
-                print("Piece 2 is at top.")
+                debug("Piece 2 is at top.")
             elif face2 == 2:
-                print("Piece 2 is at front.")
+                debug("Piece 2 is at front.")
             elif face2 == 3:
-                print("Piece 2 is at bottom.")
+                debug("Piece 2 is at bottom.")
             elif face2 == 4:
-                print("Piece 2 is at left.")
+                debug("Piece 2 is at left.")
         else:
             raise Exception("Invalid face indices.")
 
@@ -1039,32 +1042,32 @@ class Helper4x4:
         }
         def shifter(diff_actual_desired_piece, axis: str, side: str):
             diff_case = all_diff_cases[diff_actual_desired_piece]
-            print(f"{diff_case=}")
+            debug("diff_case=%r", diff_case)
             if diff_case == "default":
-                print("default case no rotation")
+                debug("default case no rotation")
             elif diff_case == "up":
-                print("move piece up by one")
+                debug("move piece up by one")
             elif diff_case == "down":
-                print("move piece down by one")
+                debug("move piece down by one")
             elif diff_case == "left":
-                print("Move piece to left")
+                debug("Move piece to left")
             elif diff_case == "right":
-                print("move piece to right ")
+                debug("move piece to right ")
                 if axis == "x":
-                    print("rotating x axis")
+                    debug("rotating x axis")
                 elif axis == "y":
-                    print("rotating y axis")
+                    debug("rotating y axis")
                 elif axis == "z":
-                    print("rotating z axis and face: ", side)
+                    debug("rotating z axis and face:  %s", side)
                     self.rotate_z(cube=cube, side=side, direction=-1)
             elif diff_case == "left up":
-                print("move piece left up")
+                debug("move piece left up")
             elif diff_case == "right up":
-                print("move piece right up")
+                debug("move piece right up")
             elif diff_case == "down left":
-                print("move piece down left")
+                debug("move piece down left")
             elif diff_case == "down right":
-                print("move piece to down right")
+                debug("move piece to down right")
         
         
         face, row, col = position_of_piece
@@ -1079,37 +1082,37 @@ class Helper4x4:
             if vac_col is not None:
                 break
 
-        print(f"{vac_row=} | {vac_col=}")
+        debug("vac_row=%r | vac_col=%r", vac_row, vac_col)
         desired_piece = (self.n-1-vac_row, self.n-1-vac_col)
 
         diff_actual_desired_piece = (row - desired_piece[0], col - desired_piece[1])
         
         if face == 0:
-            print("I am at back")
+            debug("I am at back")
         elif face == 1:
-            print("I am at top")
+            debug("I am at top")
         elif face == 2:
-            print("I am at front")
+            debug("I am at front")
             shifter(diff_actual_desired_piece=diff_actual_desired_piece, axis="z", side="Front")
             if desired_piece[1] == 2:
-                print("Rotate left inner side")
+                debug("Rotate left inner side")
                 self.rotate_inner_sides(cube=cube, side="Left", direction=1)
                 if cube[2][1][1] == cube[2][1][2]:
-                    print("verticle line is present at upper row")
+                    debug("verticle line is present at upper row")
                 else:
-                    print("Verticle line is present at bottom row")
+                    debug("Verticle line is present at bottom row")
                     self.rotate_z(cube=cube, side="Front", direction=1)
                     self.rotate_inner_sides(cube=cube, side="Left", direction=-1)
 
             else:
-                print("Rotate right inner side")
+                debug("Rotate right inner side")
                 self.rotate_inner_sides(cube=cube, side="Right", direction=1)
         elif face == 3:
-            print("I am at bottom")
+            debug("I am at bottom")
         elif face == 4:
-            print("I am at left")
+            debug("I am at left")
         else:
-            print("I am at right")
+            debug("I am at right")
 
     def make_second_center(self, cube, color: str, skip_face: list[int]=[3]):
 
@@ -1126,10 +1129,10 @@ class Helper4x4:
         # print(f"Making second color: {color}")
 
         all_pieces = self.collect_centre_pieces(cube=cube, color=color, skip_face=skip_face)
-        print(all_pieces)
+        debug("%s", all_pieces)
 
         if not all_pieces:
-            print("Second center is finished....")
+            debug("Second center is finished....")
             return
 
         while all_pieces:
@@ -1138,8 +1141,8 @@ class Helper4x4:
             location = None
             # back face
             if face == 0:
-                print("I am at back.")
-                print(f"{piece=}")
+                debug("I am at back.")
+                debug("piece=%r", piece)
                 # checking same color on sideways.
                 for i in range(8):
                     nrow = row + self.dx[i]
@@ -1148,36 +1151,36 @@ class Helper4x4:
                     if 1<=nrow<=2 and 1<=ncol<=2 and cube[face][nrow][ncol] == color_number:
                         location = (face, self.dx[i], self.dy[i])
                         break
-                print(f"{location=}")
+                debug("location=%r", location)
                 # no pieces of same color presents around
                 if location is None:
-                    print("No one around me, I am alone.")
+                    debug("No one around me, I am alone.")
                     count_at_bottom = count_pieces(face=cube[3], color=color_number)
                     if count_at_bottom == 4:
-                        print("Bottom is finished.")
+                        debug("Bottom is finished.")
                         return
 
                     if count_at_bottom == 3:
-                        print("L shape case at bottom.")
+                        debug("L shape case at bottom.")
                         self.handle_lshape_for_second_center(cube=cube, position_of_piece=piece, color_number=color_number)
                         # self.handle_Lcase_second_color(cube=cube, pos=piece, color=color)
                         break
                     
-                    print("Finding another piece to make pair.")
+                    debug("Finding another piece to make pair.")
                     new_piece = self.collect_centre_pieces(cube=cube, color=color, skip_face=[face, 3])
                     final_face, final_row, final_col = self.make_center_pairs(cube=cube, pos1=piece, pos2=new_piece)
-                    print(f"{final_face=} {final_row=} {final_col=}")
+                    debug("final_face=%r final_row=%r final_col=%r", final_face, final_row, final_col)
                     self.make_second_center(cube=cube, color=color)
                     return
                 # if a piece is present in surrounding.
                 else:
-                    print("So there are pieces surrounding.")
-                    print(f"{location=}")
+                    debug("So there are pieces surrounding.")
+                    debug("location=%r", location)
                     direction = self.directions[(location[1], location[2])]
-                    print(f"{direction=}")
+                    debug("direction=%r", direction)
                     match direction:
                         case "Right":
-                            print("Making right line to vertical line.")
+                            debug("Making right line to vertical line.")
                             # making that line vertical
                             if row == 1:
                                 self.rotate_z(cube=cube,side="Back", direction=1)
@@ -1193,45 +1196,45 @@ class Helper4x4:
                             self.rotate_inner_sides(cube=cube, side="Right", direction=-1)
                         
                         case "Left":
-                            print("Making left line vertical.")
+                            debug("Making left line vertical.")
 
                         case "Up":
-                            print("I am already vertical.")
+                            debug("I am already vertical.")
 
                         case "Down":
-                            print("I am already vertical.")
+                            debug("I am already vertical.")
                             if cube[3][1][col] == color_number or cube[3][2][col] == color_number:
-                                print("They are on same line")
+                                debug("They are on same line")
                                 side = "Right" if col == 2 else "Left"
                                 self.rotate_inner_sides(cube=cube, side=side, direction=1)
                                 self.rotate_y(cube=cube, side="Bottom", direction=1)
                                 self.rotate_y(cube=cube, side="Bottom", direction=1)
                                 self.rotate_inner_sides(cube=cube, side=side, direction=-1)
                             else:
-                                print("They are opposite")
+                                debug("They are opposite")
                                 break
 
                         case "Right Up":
-                            print("I am already at right up.")
+                            debug("I am already at right up.")
                             break
                         
                         case "Right Down":
-                            print("I am already at right down.")
+                            debug("I am already at right down.")
                             break
 
                         case "Left Up":
-                            print("I am already at left up.")
+                            debug("I am already at left up.")
                             break
 
                         case "Left Down":
-                            print("I am already at left down.")
+                            debug("I am already at left down.")
                             break
 
                 
 
             # front face
             elif face == 2:
-                print("I am at front.")
+                debug("I am at front.")
                 for i in range(8):
                     nrow = row + self.dx[i]
                     ncol = col + self.dy[i]
@@ -1239,87 +1242,87 @@ class Helper4x4:
                     if 1<=nrow<=2 and 1<=ncol<=2 and cube[face][nrow][ncol] == color_number:
                         location = (face, self.dx[i], self.dy[i])
                         break
-                print(f"{location=}")
+                debug("location=%r", location)
                 if location is None:
-                    print("No one arond me.")
+                    debug("No one arond me.")
                     count_of_pieces_at_bottom = count_pieces(face=cube[3], color=color_number)
-                    print(f"{count_of_pieces_at_bottom=}")
+                    debug("count_of_pieces_at_bottom=%r", count_of_pieces_at_bottom)
                     if count_of_pieces_at_bottom == 4:
-                        print("Second center is finished....")
+                        debug("Second center is finished....")
                         return
                     
                     elif count_of_pieces_at_bottom == 3:
-                        print("Handling L shaped for second center")
+                        debug("Handling L shaped for second center")
                         self.handle_lshape_for_second_center(cube=cube, position_of_piece=piece, color_number=color_number)
                         return
                     
-                    print("Making second center: ", count_of_pieces_at_bottom)
+                    debug("Making second center:  %s", count_of_pieces_at_bottom)
                     return
                 
                 else:
-                    print("I have a neighbour.")
+                    debug("I have a neighbour.")
                     direction = self.directions[(location[1], location[2])]
-                    print(f"{direction=}")
+                    debug("direction=%r", direction)
                     
                     match direction:
                         case "Right":
-                            print("I am alreadt at right")
+                            debug("I am alreadt at right")
 
                         case "Left":
-                            print("I am already at left")
+                            debug("I am already at left")
 
                         case "Up":
-                            print("I am already at up")
+                            debug("I am already at up")
 
                         case "Down":
-                            print("I am already at down.")
+                            debug("I am already at down.")
                             # checking horizontal or vertical line in bottom face
 
                             # case 1: checking horizontal line on same col
                             if cube[3][1][col] == color_number and cube[3][2][col] == color_number:
-                                print("I am vertical line on same col")
+                                debug("I am vertical line on same col")
                                 self.rotate_inner_sides(cube=cube, side="Left", direction=-1)
                                 self.rotate_y(cube=cube, side="Bottom", direction=1)
                                 self.rotate_y(cube=cube, side="Bottom", direction=1)
                                 self.rotate_inner_sides(cube=cube, side="Left", direction=1)
                             # case 2: checking horizontal line on different col
                             elif cube[3][1][abs(3-col)] == color_number and cube[3][2][abs(3-col)] == color_number:
-                                print("I am vertical line on diff col")
+                                debug("I am vertical line on diff col")
                             # case 3: checking vertical line on upper row
                             elif cube[3][1][1] == color_number and cube[3][1][2] == color_number:
-                                print("I am horizontal line on upper row")
+                                debug("I am horizontal line on upper row")
                             # case 4: checking vertical line on bottom row
                             elif cube[3][2][1] == color_number and cube[3][2][2] == color_number:
-                                print("I am horizontal line on bottom row")
+                                debug("I am horizontal line on bottom row")
 
 
                         case "Right Up":
-                            print("I am already at right up.")
+                            debug("I am already at right up.")
                         
                         case "Right Down":
-                            print("I am already at right down.")
+                            debug("I am already at right down.")
 
                         case "Left Up":
-                            print("I am already at left up.")
+                            debug("I am already at left up.")
 
                         case "Left Down":
-                            print("I am already at left down.") 
+                            debug("I am already at left down.") 
 
                     return
 
             # bottom face
             elif face == 3:
-                print("I am at bottom.")
+                debug("I am at bottom.")
                 return
 
             # left face
             elif face == 4:
-                print("I am at left.")
+                debug("I am at left.")
                 return
 
             # right face
             elif face == 5:
-                print("I am at right.")
+                debug("I am at right.")
                 return
 
             else:
@@ -1338,17 +1341,17 @@ class Helper4x4:
             return count
         
 
-        print(f"Making first color: {color}")
+        debug("Making first color: %s", color)
         color_number = self.colors_indices[color]
         # complete this color at top, i.e. at index 1
         top_index = self.faces_indices[face]
         count_of_white_pieces_at_top = count_pieces(face=cube[top_index], color=color_number)
         if count_of_white_pieces_at_top == 4:
-            print("White centre finished.")
+            debug("White centre finished.")
             return
         
         if count_of_white_pieces_at_top == 3:
-            print("Handling L case at top.")
+            debug("Handling L case at top.")
             # filtering only absent piece at top.
             all_pieces = [i for i in all_pieces if i[0] != top_index]
             self.handle_Lcase_first_color(cube=cube, pos=all_pieces, color=color)
@@ -1358,42 +1361,42 @@ class Helper4x4:
         all_pieces = self.collect_centre_pieces(cube=cube, color=color, skip_face=[1])
         while all_pieces:
             face, row, col = all_pieces
-            print(f"{all_pieces=}")
+            debug("all_pieces=%r", all_pieces)
             count_of_white_pieces_at_top = count_pieces(face=cube[top_index], color=color_number)
             if count_of_white_pieces_at_top == 4:
-                print("White centre finished.")
+                debug("White centre finished.")
                 break
             
             if count_of_white_pieces_at_top == 3:
-                print("L shape case.")
+                debug("L shape case.")
                 self.handle_Lcase_first_color(cube=cube, pos=(face, row, col), color=color)
                 break
             
             if face == top_index:
-                print("Hey!! I am at top.")
+                debug("Hey!! I am at top.")
                 # fixes if peices are diagonal
                 self.check_pieces_sideways(cube=cube, face_index=face, row=row, col=col, color=color_number)
 
             else:
                 # back face:
                 if face == 0:
-                    print("Hey! I am at back face, ready to come at top.")
+                    debug("Hey! I am at back face, ready to come at top.")
                     break
 
                 # front face
                 elif face == 2:
-                    print("Hey! I am at front face, ready to come at top.")
+                    debug("Hey! I am at front face, ready to come at top.")
                     # checking whether same color peice is in same col, at it's top or not
                     if cube[top_index][1][col] == color_number:
-                        print("Rotating top layer clockwise, to save same color pieces at the top.")
+                        debug("Rotating top layer clockwise, to save same color pieces at the top.")
                         self.rotate_y(cube=cube, side="Top", direction=1)
                     elif cube[top_index][2][col] == color_number:
-                        print("Rotating top layer to anti-clockwise, to save same color pieces at the top.")
+                        debug("Rotating top layer to anti-clockwise, to save same color pieces at the top.")
                         self.rotate_y(cube=cube, side="Top", direction=-1)
                     
                     # finally bringing white piece to top from front.
                     side = "Right" if col == 2 else "Left"
-                    print(f"Rotating inner side: {side}")
+                    debug("Rotating inner side: %s", side)
                     self.rotate_inner_sides(cube=cube, side=side, direction=1)
 
                     # checking whether we have sideways after merging or not?
@@ -1401,17 +1404,17 @@ class Helper4x4:
 
                 # bottom face
                 elif face == 3:
-                    print("Hey! I am at bottom face, ready to come at top.")
+                    debug("Hey! I am at bottom face, ready to come at top.")
                     break
 
                 # left face
                 elif face == 4:
-                    print("Hey! I am at left face, ready to come at top.")
+                    debug("Hey! I am at left face, ready to come at top.")
                     top_row = col
                     # if both pieces are on same col
                     if cube[top_index][top_row][1] == color_number and cube[top_index][top_row][2] == color_number:
-                        print("Both pieces on same level, rotating top face 2x")
-                        print(f"{count_of_white_pieces_at_top=}")
+                        debug("Both pieces on same level, rotating top face 2x")
+                        debug("count_of_white_pieces_at_top=%r", count_of_white_pieces_at_top)
                         self.rotate_y(cube=cube, side="Top", direction=1)
                         self.rotate_y(cube=cube, side="Top", direction=1)
                         # bringing left side piece to top
@@ -1419,48 +1422,48 @@ class Helper4x4:
                     elif top_row == 1:
                         if cube[top_index][top_row][1] == color_number and cube[top_index][top_row+1][1] == color_number:
                             # rotating top face anti-clockwise to make space for left piece
-                            print("There is vertical line in col 1.")
+                            debug("There is vertical line in col 1.")
                             self.rotate_y(cube=cube, side="Top", direction=-1)
                             self.rotate_inner_sides(cube=cube, side="Back", direction=-1)
                         elif cube[top_index][top_row][2] == color_number and cube[top_index][top_row+1][2] == color_number:
-                            print("There is vertical line in col 2.")
+                            debug("There is vertical line in col 2.")
                             self.rotate_y(cube=cube, side="Top", direction=1)
                             self.rotate_inner_sides(cube=cube, side="Back", direction=-1)
                         else:
-                            print("No need to adjust, already adjusted.")
+                            debug("No need to adjust, already adjusted.")
                             self.rotate_inner_sides(cube=cube, side="Back", direction=-1)
 
                     elif top_row == 2:
                         if cube[top_index][top_row][1] == color_number and cube[top_index][top_row-1][1] == color_number:
                             # rotating top face clockwise to make space for left piece
-                            print("There is vertical line on col 1.")
+                            debug("There is vertical line on col 1.")
                             self.rotate_y(cube=cube, side="Top", direction=1)
                             self.rotate_inner_sides(cube=cube, side="Front", direction=1)
                         elif cube[top_index][top_row][2] == color_number and cube[top_index][top_row-1][2] == color_number:
-                            print("There is a vertical line on col 2.")
+                            debug("There is a vertical line on col 2.")
                             self.rotate_y(cube=cube, side="Top", direction=-1)
                             self.rotate_inner_sides(cube=cube, side="Front", direction=1)
                         else:
-                            print("Already adjusted, no need to adjust")
+                            debug("Already adjusted, no need to adjust")
                             self.rotate_inner_sides(cube=cube, side="Front", direction=1)
 
 
                 # right face
                 elif face == 5:
-                    print("Hey! I am at right face, ready to come at top.")
+                    debug("Hey! I am at right face, ready to come at top.")
                     break
             
             all_pieces = self.collect_centre_pieces(cube=cube, color=color, skip_face=[1])
 
         opposite_color = self.opposite_color[color]
-        print(f"Making second color: {opposite_color}")
+        debug("Making second color: %s", opposite_color)
         self.make_second_center(cube=cube, color=opposite_color)
         self.make_other_4_centers(cube=cube)
 
     def __count_pieces(self,face, color):
             count = 0
             color_number = self.colors_indices[color]
-            print(f"{color_number=}")
+            debug("color_number=%r", color_number)
             for i in range(1, 3):
                 for j in range(1, 3):
                     if face[i][j] == color_number:
@@ -1473,15 +1476,15 @@ class Helper4x4:
             face_index, row, col = curr_pos
             match face:
                 case "Front" | "Back":
-                    print("I am rotating in z direction")
+                    debug("I am rotating in z direction")
                     self.rotate_z(cube=cube, side=face, direction=direction)
                     return col
                 case "Left" | "Right":
-                    print("I am rotating in x direction")
+                    debug("I am rotating in x direction")
                     self.rotate_x(cube=cube, side=face, direction=direction)
                     return 1 if col == 2 else 2
                 case "Top" | "Bottom":
-                    print("I am rotating in y direction")
+                    debug("I am rotating in y direction")
                     self.rotate_y(cube=cube, side=face, direction=direction)
                     return 1 if col == 2 else 2
 
@@ -1490,32 +1493,32 @@ class Helper4x4:
 
         match direction_of_neighbour:
             case "Right":
-                print("I am at right")
+                debug("I am at right")
                 return row
 
             case "Left":
-                print("I am at left")
+                debug("I am at left")
                 return row
 
             case "Up":
-                print("I am at up")
+                debug("I am at up")
                 return handle_directions_helper(cube=cube, face=face, direction=1)
 
             case "Down":
-                print("I am at down")
+                debug("I am at down")
                 return handle_directions_helper(cube=cube, face=face, direction=1)
 
             case "Right Up":
-                print("I am at right up")
+                debug("I am at right up")
 
             case "Right Down":
-                print("I am at right down")
+                debug("I am at right down")
 
             case "Left Up":
-                print("I am at left up")
+                debug("I am at left up")
 
             case "Left Down":
-                print("I am at left down")
+                debug("I am at left down")
     
     def check_for_empty_space(self, cube, row, face_index, color_number):
         """
@@ -1533,19 +1536,19 @@ class Helper4x4:
         """
         # case 1: check horizontally
         if cube[face_index][row][1] == color_number and cube[face_index][row][2] == color_number:
-            print("We are on same line")
+            debug("We are on same line")
             return 1
         
         if cube[face_index][row][1] == color_number:
-            print("Piece are present in col 1")
+            debug("Piece are present in col 1")
             return 2
         
         if cube[face_index][row][2] == color_number:
-            print("Piece are present in col 2")
+            debug("Piece are present in col 2")
             return 3
         
         else:
-            print("Pieces are nowhere on the way")
+            debug("Pieces are nowhere on the way")
             return 4
     
     def bring_center_pieces_to_correct_pos(self, cube, curr_pos, direction_of_neighbour):
@@ -1556,68 +1559,68 @@ class Helper4x4:
         color_number = self.colors_indices["Green"]
         if face_index == 0:
             # back face
-            print("I am at back..")
+            debug("I am at back..")
             face_to_rotate = "Top" if face_to_rotate == "Bottom" else "Bottom"
-            print(f"{face_to_rotate=}")
+            debug("face_to_rotate=%r", face_to_rotate)
             # before rotating directly, i need to check whether it disturbs other fixed piece or not.
             check_empty = self.check_for_empty_space(cube=cube, face_index=5, row=abs(3-final_row),color_number=color_number)
             
             if check_empty == 1:
                 # they are on same row
-                print("They are on the same row")
+                debug("They are on the same row")
                 self.rotate_inner_sides(cube=cube, side=face_to_rotate, direction=1)
                 self.rotate_x(cube=cube, side="Right", direction=1)
                 self.rotate_x(cube=cube, side="Right", direction=1)
                 self.rotate_inner_sides(cube=cube, side=face_to_rotate, direction=-1)
             elif check_empty == 2:
                 # they are colliding on col 1
-                print("They are colliding on col 1")
+                debug("They are colliding on col 1")
                 self.rotate_y(cube=cube, side="Back", direction=-1)
                 self.rotate_inner_sides(cube=cube, side=face_to_rotate, direction=1)
             elif check_empty == 3:
                 # they are colliding on col 2
-                print("They are colliding on col 1")
+                debug("They are colliding on col 1")
                 self.rotate_y(cube=cube, side="Back", direction=1)
                 self.rotate_inner_sides(cube=cube, side=face_to_rotate, direction=1)
             else:
                 # all clear
-                print("All clear")
+                debug("All clear")
                 self.rotate_inner_sides(cube=cube, side=face_to_rotate, direction=1)
 
 
         elif face_index == 1:
             # top face
-            print("I am at top..")
+            debug("I am at top..")
             return
 
         elif face_index == 2:
             # front face
-            print("I am at front..")
+            debug("I am at front..")
             return
 
         elif face_index == 3:
             # bottom face
-            print("I am at bottom..")
+            debug("I am at bottom..")
             return
 
         elif face_index == 4:
             # left face
-            print("I am at left..")
-            print(f"{face_to_rotate=}")
+            debug("I am at left..")
+            debug("face_to_rotate=%r", face_to_rotate)
             check_empty = self.check_for_empty_space(cube=cube, face_index=5, row=final_row,color_number=color_number)
-            print(f"{check_empty=}")
+            debug("check_empty=%r", check_empty)
             if check_empty == 4:
-                print("All clear")
+                debug("All clear")
                 self.rotate_inner_sides(cube=cube, side=face_to_rotate, direction=1)
                 self.rotate_inner_sides(cube=cube, side=face_to_rotate, direction=1)
             elif check_empty == 3:
-                print("Colliding on col 2")
+                debug("Colliding on col 2")
 
             elif check_empty == 2:
-                print("Colliding on col 1")
+                debug("Colliding on col 1")
 
             elif check_empty == 1:
-                print("we are on the same row.")
+                debug("we are on the same row.")
                 self.rotate_inner_sides(cube=cube,side=face_to_rotate, direction=1)
                 self.rotate_inner_sides(cube=cube,side=face_to_rotate, direction=1)
                 self.rotate_x(cube=cube, side="Right", direction=1)
@@ -1629,40 +1632,40 @@ class Helper4x4:
 
         elif face_index == 5:
             # right face
-            print("I am at right..") 
+            debug("I am at right..") 
             return
 
         else:
             raise Exception("Face index out of bound.")
 
     def make_third_color(self,cube, color, center_index):
-        print("==================\nMaking third color Green")
+        debug("==================\nMaking third color Green")
         count_of_pieces_at_center = self.__count_pieces(face=cube[center_index], color=color)  # collecting center pieces of matching color on that face
         if count_of_pieces_at_center == 4:
-            print("Third center is finished....")
+            debug("Third center is finished....")
             return
         
         if count_of_pieces_at_center == 3:
-            print("Handling L shape")
+            debug("Handling L shape")
             return
         
 
         color_number = self.colors_indices[color]
-        print(f"{color_number=}")
+        debug("color_number=%r", color_number)
         
         while True:
             count_of_pieces_at_center = self.__count_pieces(face=cube[center_index], color=color)
-            print(f"{count_of_pieces_at_center=}")
+            debug("count_of_pieces_at_center=%r", count_of_pieces_at_center)
             if count_of_pieces_at_center == 4:
-                print("Third center is finished....")
+                debug("Third center is finished....")
                 break
 
             if count_of_pieces_at_center == 3:
-                print("Handling L shape inside while loop")
+                debug("Handling L shape inside while loop")
                 break
             
             piece = self.collect_centre_pieces(cube=cube, color=color, skip_face=[center_index])
-            print(f"{piece=}")
+            debug("piece=%r", piece)
             face_index, row, col = piece
 
 
@@ -1677,23 +1680,23 @@ class Helper4x4:
             
             if surrounding_piece is None:
                 # No surrounding piece, lone piece
-                print("Lone warrier...")
+                debug("Lone warrier...")
                 # finding another piece
                 piece2 = self.collect_centre_pieces(cube=cube, color=color, skip_face=[center_index, face_index])
-                print(f"{piece2=}")
+                debug("piece2=%r", piece2)
                 self.make_center_pairs(cube=cube, pos1=piece, pos2=piece2)
             else:
                 # I have a neighbour
-                print("I have a neighbour...")
-                print(f"{surrounding_piece=}")
+                debug("I have a neighbour...")
+                debug("surrounding_piece=%r", surrounding_piece)
 
                 placement_of_neighbour = self.directions[surrounding_piece]
-                print(f"{placement_of_neighbour=}")
+                debug("placement_of_neighbour=%r", placement_of_neighbour)
 
                 self.bring_center_pieces_to_correct_pos(cube=cube, curr_pos=piece, direction_of_neighbour=placement_of_neighbour)
 
     def __check_adjacent_piece(self, piece, cube, color_number: int):
-        print(f"{piece=}")
+        debug("piece=%r", piece)
         face_index, row, col = piece
 
 
@@ -1723,15 +1726,15 @@ class Helper4x4:
         self.make_fifth_center(cube=cube, color="Blue", center_index=4)
 
     def make_forth_center(self, cube, color, center_index):
-        print("\n================= Completing fourth square..")
+        debug("\n================= Completing fourth square..")
         count_of_pieces_at_center = self.__count_pieces(face=cube[center_index], color=color)
-        print(f"{count_of_pieces_at_center=}")
+        debug("count_of_pieces_at_center=%r", count_of_pieces_at_center)
         if count_of_pieces_at_center == 4:
-            print("Fourth center finished: Orange")
+            debug("Fourth center finished: Orange")
             return
         
         if count_of_pieces_at_center == 3:
-            print("L shaped case for fourth color: Orange")
+            debug("L shaped case for fourth color: Orange")
             return
         
 
@@ -1739,29 +1742,29 @@ class Helper4x4:
         while count_of_pieces_at_center != 4:
             count_of_pieces_at_center = self.__count_pieces(face=cube[center_index], color=color)
             if count_of_pieces_at_center == 4:
-                print("Fourth center finished: Orange")
+                debug("Fourth center finished: Orange")
                 return
             
             piece = self.collect_centre_pieces(cube=cube, color=color, skip_face=[center_index])
             if piece is None or not piece:
-                print("Fourth center finished: Orange")
+                debug("Fourth center finished: Orange")
                 return
             
-            print(f"{piece=}")
+            debug("piece=%r", piece)
             face_index, row, col = piece
             if count_of_pieces_at_center == 3:
-                print("L shaped case for fourth color: Orange")
-                print(f"{piece=}")
+                debug("L shaped case for fourth color: Orange")
+                debug("piece=%r", piece)
                 # check if piece's row is 1 or 2
                 match face_index:
                     case 0:
-                        print("I m at back!")
+                        debug("I m at back!")
                     case 1:
-                        print("I m at top!")
+                        debug("I m at top!")
                     case 3:
-                        print("I m at bottom!")
+                        debug("I m at bottom!")
                     case 4:
-                        print("I m at left")
+                        debug("I m at left")
                         if row == 1:
                             # row = 1 meaning, non-paired piece is on the second row.
                             unpaired_piece = None
@@ -1770,106 +1773,106 @@ class Helper4x4:
                             else:
                                 unpaired_piece = (2, 2)
                             
-                            print(f"{unpaired_piece=}")
+                            debug("unpaired_piece=%r", unpaired_piece)
                             if cube[center_index][1][1] == color_number and cube[center_index][1][2] == color_number:
-                                print("We are on the same track")
+                                debug("We are on the same track")
                                 final_piece_should_come_at = (1, 2) if unpaired_piece == (2, 2) else (1, 1)
                                 rotation = -1 if (final_piece_should_come_at[0] - row) < 0 or (final_piece_should_come_at[1] - col) < 0 else 1
                                 if (row, col) != final_piece_should_come_at:
-                                    print("We need to rotate face")
+                                    debug("We need to rotate face")
                                     self.rotate_z(cube=cube, side="Front", direction=-1)
                                     self.rotate_inner_sides(cube=cube, side="Bottom", direction=1)
                                     if col == 1:
-                                        print("I am at column 1")
+                                        debug("I am at column 1")
                                         self.rotate_x(cube=cube, side="Left", direction=-1)
                                         self.rotate_inner_sides(cube=cube, side="Bottom", direction=-1)
                                     else:
-                                        print("I am at column 2")
+                                        debug("I am at column 2")
                                     return
                                 else:
-                                    print("Just bring it together")
+                                    debug("Just bring it together")
                                     self.rotate_inner_sides(cube=cube, side="Top", direction=-1)
                                     direction = -1 if unpaired_piece[1] == 1 else 1
                                     self.rotate_z(cube=cube, side="Front", direction=direction)
                                     self.rotate_inner_sides(cube=cube, side="Top", direction=1)
                             elif cube[center_index][2][1] == color and cube[center_index][2][2] == color_number:
-                                print("We are on opposite track")
+                                debug("We are on opposite track")
                             elif cube[center_index][1][1] == color_number and cube[center_index][2][1] == color_number:
-                                print("We are orthogonal upside")
+                                debug("We are orthogonal upside")
                             elif cube[center_index][1][2] == color_number and cube[center_index][2][2] == color_number:
-                                print("We are orthogonal downside")
+                                debug("We are orthogonal downside")
                         else:
                             pass
                     case 5:
-                        print("I m at right")
+                        debug("I m at right")
                 
             
             match face_index:
                 case 0:
-                    print("I am at back face")
+                    debug("I am at back face")
                     surrounding_piece = self.__check_adjacent_piece(piece=piece, cube=cube, color_number=color_number)
-                    print(f"{surrounding_piece=}")
+                    debug("surrounding_piece=%r", surrounding_piece)
 
                     if surrounding_piece is None:
-                        print("Lone warrier...")
+                        debug("Lone warrier...")
                         # either there are two colors at front face
                         if count_of_pieces_at_center == 2:
-                            print("We are couples at front face. Orange")
+                            debug("We are couples at front face. Orange")
                             # now there are 6 cases
                             # case 1: side ways
                             if cube[center_index][1][1] == color_number and cube[center_index][1][2] == color_number:
-                                print("Flipping first row.")
+                                debug("Flipping first row.")
                             elif cube[center_index][2][1] == color_number and cube[center_index][2][2] == color_number:
-                                print("Flipping second row.")
+                                debug("Flipping second row.")
                                 rotation = 1 if col == 1 else -1
-                                print(f"Rotating {"clockwise" if rotation == 1 else "anti-clockwise"}")
+                                debug("Rotating %s", 'clockwise' if rotation == 1 else 'anti-clockwise')
                                 self.rotate_z(cube=cube, side="Front", direction=rotation)
-                                print("Bring back piece to front")
+                                debug("Bring back piece to front")
                                 side = "Right" if col == 2 else "Left"
                                 self.rotate_inner_sides(cube=cube, side=side, direction=1)
                                 self.rotate_inner_sides(cube=cube, side=side, direction=1)
-                                print("Rotating front face twice")
+                                debug("Rotating front face twice")
                                 self.rotate_z(cube=cube, side="Front", direction=1)
                                 self.rotate_z(cube=cube, side="Front", direction=1)
-                                print("Bringing inner side back")
+                                debug("Bringing inner side back")
 
                                 self.rotate_inner_sides(cube=cube, side=side, direction=-1)
                                 self.rotate_inner_sides(cube=cube, side=side, direction=-1)
 
                             elif cube[center_index][1][col] == color_number and cube[center_index][2][col] == color_number:
-                                print("Flipping same column.")
+                                debug("Flipping same column.")
                             elif cube[center_index][1][1] == color_number and cube[center_index][2][2] == color_number:
-                                print("Left diagonal")
+                                debug("Left diagonal")
                             elif cube[center_index][1][2] == color_number and cube[center_index][2][1] == color_number:
-                                print("Right diagonal")
+                                debug("Right diagonal")
                         # or only one color
                         else:
-                            print("We are singles at front face. Orange")
+                            debug("We are singles at front face. Orange")
                     
                     else:
-                        print("Hey! I got a neighbour...")
+                        debug("Hey! I got a neighbour...")
                 case 1:
-                    print("I am at top")
+                    debug("I am at top")
                 case 3:
-                    print("I am at bottom")
+                    debug("I am at bottom")
                 case 4:
-                    print("I am at left")
+                    debug("I am at left")
                 case 5:
-                    print("I am at right")
+                    debug("I am at right")
                 case _:
                     pass              
     
     def make_fifth_center(self, cube, color, center_index):
-        print("\n================== Making fifth center\n")
+        debug("\n================== Making fifth center\n")
         count_of_pieces_at_center = self.__count_pieces(face=cube[center_index], color=color)
-        print(f"{count_of_pieces_at_center=}")
+        debug("count_of_pieces_at_center=%r", count_of_pieces_at_center)
 
         if count_of_pieces_at_center == 4:
-            print("Fifth center is finished: Blue")
+            debug("Fifth center is finished: Blue")
             return
 
         if count_of_pieces_at_center == 3:
-            print("Handling L shaped: Blue")
+            debug("Handling L shaped: Blue")
             return
         
         color_number = self.colors_indices[color]
@@ -1878,37 +1881,37 @@ class Helper4x4:
             piece = self.collect_centre_pieces(cube=cube, color=color, skip_face=[center_index])
 
             if piece is None or not piece:
-                print("Fifth center is finished: Blue")
+                debug("Fifth center is finished: Blue")
                 return
             
             if count_of_pieces_at_center == 4:
-                print("Fifth center is finished: Blue")
+                debug("Fifth center is finished: Blue")
                 return
             
             if count_of_pieces_at_center == 3:
-                print("L shaped case for Fifth center: Blue")
+                debug("L shaped case for Fifth center: Blue")
                 
                 return
             
             
             face_index, row, col = piece
             surrounding_piece = self.__check_adjacent_piece(piece=piece, cube=cube, color_number=color_number)
-            print(f"{surrounding_piece=}")
+            debug("surrounding_piece=%r", surrounding_piece)
 
             match face_index:
                 case 0:
-                    print("I am at back!")
+                    debug("I am at back!")
                     if surrounding_piece is not None:
-                        print("I have a neighbour!")
+                        debug("I have a neighbour!")
                         final_piece = (row+surrounding_piece[0], col+surrounding_piece[1])
                         position_of_surrounding_piece = self.directions[surrounding_piece]
                         match position_of_surrounding_piece:
                             case "Right":
-                                print("I am at right")
+                                debug("I am at right")
                                 if row == 1:
-                                    print("Check on row 2 on left side")
+                                    debug("Check on row 2 on left side")
                                     if cube[4][2][1] == color_number or cube[4][2][2] == color_number:
-                                        print("On same row")
+                                        debug("On same row")
                                         # self.rotate_z(cube=cube, side="Back", direction=1)
                                         # self.rotate_z(cube=cube, side="Back", direction=1)
                                         self.rotate_inner_sides(cube=cube, side="Bottom", direction=-1)
@@ -1919,62 +1922,62 @@ class Helper4x4:
                                         return
 
                                     else:
-                                        print("Not on same row")
+                                        debug("Not on same row")
                                 else:
-                                    print("Check on row 1 on left side")
+                                    debug("Check on row 1 on left side")
                                 return
                             case "Left":
-                                print("I am at left")
+                                debug("I am at left")
                                 return
                             case "Up":
-                                print("I am at up")
+                                debug("I am at up")
                                 return
                             case "Down":
-                                print("I am at down")
+                                debug("I am at down")
                                 if col == 1:
-                                    print("I am at col 1")
+                                    debug("I am at col 1")
                                     self.rotate_z(cube=cube, side="Back", direction=1)
                                 else:
-                                    print("I am at col 2")
+                                    debug("I am at col 2")
                                     self.rotate_z(cube=cube, side="Back", direction=-1) # this brings blue colors at top row
                                     if cube[center_index][1][1] == color_number and cube[center_index][1][2] == color_number:
-                                        print("I am on same row, bring it on.")
+                                        debug("I am on same row, bring it on.")
                                     elif cube[center_index][2][1] == color_number and cube[center_index][2][2] == color_number:
-                                        print("I am on opposite row, time to rotate me")
+                                        debug("I am on opposite row, time to rotate me")
                                     elif cube[center_index][1][1] == color_number and cube[center_index][2][1] == color_number:
-                                        print("I am orthogonal, at col 1")
+                                        debug("I am orthogonal, at col 1")
                                     elif cube[center_index][1][2] == color_number and cube[center_index][2][2] == color_number:
-                                        print("I am orthogonal, at col 2")
+                                        debug("I am orthogonal, at col 2")
                                         self.rotate_x(cube=cube, side="Left", direction=1)
                                         self.rotate_inner_sides(cube=cube, side="Bottom", direction=-1)
                                         self.rotate_x(cube=cube, side="Left", direction=1)
                                         self.rotate_x(cube=cube, side="Left", direction=1)
                                         self.rotate_inner_sides(cube=cube, side="Bottom", direction=1)
                             case "Right Down":
-                                print("I am at right down")
+                                debug("I am at right down")
                                 self.rotate_inner_sides(cube=cube, side="Bottom", direction=-1)
                                 self.rotate_x(cube=cube, side="Left", direction=1)
                                 self.rotate_inner_sides(cube=cube, side="Bottom", direction=1)
                             case "Left Down":
-                                print("I am at left down")
+                                debug("I am at left down")
                             case "Right Up":
-                                print("I am at right up")
+                                debug("I am at right up")
                             case "Left Up":
-                                print("I am at left up")
+                                debug("I am at left up")
                             
                     else:
-                        print("I am a lone warrier..")
+                        debug("I am a lone warrier..")
                 case 1:
-                    print("I am at top")
+                    debug("I am at top")
                     return
                 case 2:
-                    print("I am at front")
+                    debug("I am at front")
                     return
                 case 3:
-                    print("I am at bottom")
+                    debug("I am at bottom")
                     return
                 case 5:
-                    print("I am at right")
+                    debug("I am at right")
                     return
 
     def check_cross(self, piece1: EdgePiece, piece2: EdgePiece):
@@ -2016,31 +2019,31 @@ class Helper4x4:
             if self.check_if_edge_piece_complete_on_pos(cube=cube, face_idx=face_idx, position=position):
                 break
             if face == "Top":
-                print("Moving top piece")
+                debug("Moving top piece")
                 # self.rotate_y(cube=cube, side="Top", direction=-1)
             elif face == "Bottom":
-                print("Moving bottom piece")
+                debug("Moving bottom piece")
             elif face == "Left":
-                print("Moving left piece")
+                debug("Moving left piece")
             elif face == "Right":
-                print("Moving right piece")
+                debug("Moving right piece")
             elif face == "Front":
-                print("Moving front piece")
+                debug("Moving front piece")
             elif face == "Back":
-                print("Moving back piece")
+                debug("Moving back piece")
 
     def collect_top_edge_pieces(self, cube):
-        print("Making top level edge pieces")
+        debug("Making top level edge pieces")
         while len(self.list_of_edge_pieces_copy):
             edge_piece = self.list_of_edge_pieces_copy.pop()
-            print(f"Initial edge piece: {str(edge_piece)}")
+            debug("Initial edge piece: %s", str(edge_piece))
             colors = sorted([cube[edge_piece.face1][edge_piece.row1][edge_piece.col1], cube[edge_piece.face2][edge_piece.row2][edge_piece.col2]])
-            print(f"Initial colors: {colors}")
+            debug("Initial colors: %s", colors)
             matched_piece = None
             for piece in self.list_of_edge_pieces_copy:
                 colors1 = sorted([cube[piece.face1][piece.row1][piece.col1], cube[piece.face2][piece.row2][piece.col2]])
                 if colors == colors1:
-                    print(f"Match piece: {str(piece)}")
+                    debug("Match piece: %s", str(piece))
                     matched_piece = piece
                     break
             
@@ -2048,11 +2051,11 @@ class Helper4x4:
             # print(f"{colors1=}")
             first_faces = sorted([edge_piece.face1, edge_piece.face2])
             second_faces = sorted([matched_piece.face1, matched_piece.face2])
-            print(f"{first_faces=} | {second_faces=}")
+            debug("first_faces=%r | second_faces=%r", first_faces, second_faces)
             if 1 in second_faces or 3 in first_faces:
                 # Top / Bottom is present in second piece
                 # standarizeing, top/bottom color will be main color for inspection
-                print("Swapping pieces..")
+                debug("Swapping pieces..")
                 first_faces, second_faces = second_faces, first_faces
                 edge_piece, matched_piece = matched_piece, edge_piece
 
@@ -2080,23 +2083,23 @@ class Helper4x4:
             # now write all the cases for piece1 and piece2
             if piece1_pos == "Top":
                 if piece2_pos == "Top":
-                    print("Both edge pieces are at top")
+                    debug("Both edge pieces are at top")
                 elif piece2_pos == "Bottom":
-                    print("Piece 1 is at top and piece 2 is at bottom")
+                    debug("Piece 1 is at top and piece 2 is at bottom")
                     if 0 in first_faces:
-                        print("Piece 1 is facing back and top")
+                        debug("Piece 1 is facing back and top")
                         if 0 in second_faces:
-                            print("Piece 2 is facing back and bottom")
+                            debug("Piece 2 is facing back and bottom")
                         elif 2 in second_faces:
-                            print("Piece 2 is facing front and bottom")
+                            debug("Piece 2 is facing front and bottom")
                         elif 4 in second_faces:
-                            print("Piece 2 is facing left and bottom")
+                            debug("Piece 2 is facing left and bottom")
                         elif 5 in second_faces:
-                            print("Piece 2 is facing right and bottom")
+                            debug("Piece 2 is facing right and bottom")
                     elif 2 in first_faces:
-                        print("Piece 1 is facing front and top")
+                        debug("Piece 1 is facing front and top")
                         if 0 in second_faces:
-                            print("Piece 2 is facing back and bottom")
+                            debug("Piece 2 is facing back and bottom")
                             self.rotate_z(cube=cube, side="Back", direction=-1)
                             self.rotate_z(cube=cube, side="Back", direction=-1)
                             # self.rotate_inner_sides(cube=cube, side="Bottom", direction=-1)
@@ -2113,49 +2116,49 @@ class Helper4x4:
                             #     print("Parity is same")
 
                         elif 2 in second_faces:
-                            print("Piece 2 is facing front and bottom")
+                            debug("Piece 2 is facing front and bottom")
                         elif 4 in second_faces:
-                            print("Piece 2 is facing left and bottom")
+                            debug("Piece 2 is facing left and bottom")
                         elif 5 in second_faces:
-                            print("Piece 2 is facing right and bottom")
+                            debug("Piece 2 is facing right and bottom")
                     elif 4 in first_faces:
-                        print("Piece 1 is facing left and top")
+                        debug("Piece 1 is facing left and top")
                         if 0 in second_faces:
-                            print("Piece 2 is facing back and bottom")
+                            debug("Piece 2 is facing back and bottom")
                         elif 2 in second_faces:
-                            print("Piece 2 is facing front and bottom")
+                            debug("Piece 2 is facing front and bottom")
                         elif 4 in second_faces:
-                            print("Piece 2 is facing left and bottom")
+                            debug("Piece 2 is facing left and bottom")
                         elif 5 in second_faces:
-                            print("Piece 2 is facing right and bottom")
+                            debug("Piece 2 is facing right and bottom")
                     elif 5 in first_faces:
-                        print("Piece 1 is facing right and top")
+                        debug("Piece 1 is facing right and top")
                         if 0 in second_faces:
-                            print("Piece 2 is facing back and bottom")
+                            debug("Piece 2 is facing back and bottom")
                         elif 2 in second_faces:
-                            print("Piece 2 is facing front and bottom")
+                            debug("Piece 2 is facing front and bottom")
                         elif 4 in second_faces:
-                            print("Piece 2 is facing left and bottom")
+                            debug("Piece 2 is facing left and bottom")
                         elif 5 in second_faces:
-                            print("Piece 2 is facing right and bottom")
+                            debug("Piece 2 is facing right and bottom")
                 elif piece2_pos == "Middle":
-                    print("Piece 1 is at top and piece 2 is at middle")
+                    debug("Piece 1 is at top and piece 2 is at middle")
 
             elif piece1_pos == "Bottom":
                 if piece2_pos == "Top":
-                    print("Piece 1 is at bottom and piece 2 is at top")
+                    debug("Piece 1 is at bottom and piece 2 is at top")
                 elif piece2_pos == "Bottom":
-                    print("Both pieces are at bottom")
+                    debug("Both pieces are at bottom")
                 elif piece2_pos == "Middle":
-                    print("Piece 1 is at bottom and piece 2 is at top")
+                    debug("Piece 1 is at bottom and piece 2 is at top")
 
             elif piece1_pos == "Middle":
                 if piece2_pos == "Top":
-                    print("Piece 1 is at middle and piece 2 is at top")
+                    debug("Piece 1 is at middle and piece 2 is at top")
                 elif piece2_pos == "Bottom":
-                    print("Piece 1 is at middle and piece 2 is at bottom")
+                    debug("Piece 1 is at middle and piece 2 is at bottom")
                 elif piece2_pos == "Middle":
-                    print("bboth pieces are at middle.")
+                    debug("bboth pieces are at middle.")
             
             break
             # first_row, first_col, second_row, second_col = None, None, None, None
@@ -2231,7 +2234,7 @@ class Helper4x4:
             # break
 
     def make_edge_pieces(self, cube):
-        print("\n================================================\nCollecting edge pieces together")
+        debug("\n================================================\nCollecting edge pieces together")
         self.collect_top_edge_pieces(cube=cube)
 
     
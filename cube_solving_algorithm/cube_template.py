@@ -1,29 +1,129 @@
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from solver_log import TRACE, debug
+
+# The layer method as a state machine. Each stage is one step function on
+# Cube that makes some moves and returns 0 to be called again or anything
+# else once its stage is done. Some steps report done right after moves
+# that leave the stage unfinished, so run() only moves on once a step
+# reports done without turning anything; no step recurses any more.
+STAGES = [
+    ("level_one", lambda cube: cube.solve_level_one("Green")),
+    ("edges_to_bottom", lambda cube: cube.bring_edge_pieces_to_bottom("Green")),
+    ("corners", lambda cube: cube.handle_corner_pieces("Green")),
+    ("layer2", lambda cube: cube.hande_layer2("Green")),
+    ("top_cross", lambda cube: cube.handle_top_layer_figures("Green")),
+    ("top_edges", lambda cube: cube.handle_plus_on_top("Green")),
+    ("top_corners", lambda cube: cube.handle_twisted_pieces()),
+]
+
+# Solved cubes take at most ~200 moves and well under a second; a solve that
+# runs past either limit is stuck in a cycle and will never finish.
+MAX_MOVES = 400
+TIMEOUT = 5.0
+
+
+@dataclass
+class LayerResult:
+    solved: bool
+    moves: list
+    # The stage the solver was in when it stopped ("done" when it got
+    # through all of them).
+    stage: str
+    # Why it gave up: "move_budget", "deadline", "cancelled", "stuck" (a step
+    # asked to be called again without making a move) or "unsolved" (every
+    # stage finished but the cube is not solved). None when solved.
+    reason: Optional[str] = None
+    elapsed: float = 0.0
+
+
+class _GaveUp(Exception):
+    def __init__(self, reason):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class _BoundedMoves(list):
+    # Stands in for the helper's move log during a solve. Every turn is
+    # appended here, including the ones a step makes inside its own loops,
+    # so this is where the move budget and deadline are enforced.
+    def __init__(self, moves, max_moves, deadline, cancelled=None):
+        super().__init__(moves)
+        self.max_moves = max_moves
+        self.deadline = deadline
+        self.cancelled = cancelled
+        self.step = None
+
+    def check(self):
+        if len(self) >= self.max_moves:
+            raise _GaveUp("move_budget")
+        if time.perf_counter() > self.deadline:
+            raise _GaveUp("deadline")
+        if self.cancelled is not None and self.cancelled():
+            raise _GaveUp("cancelled")
+
+    def append(self, move):
+        self.check()
+        super().append(move)
+        if TRACE:
+            debug("move %s", move, step=self.step, move=move)
+
+    def extend(self, moves):
+        # Whole algorithms land here; each turn still counts on its own.
+        for move in moves:
+            self.append(move)
+
+
+def _is_solved(cube):
+    faces = np.asarray(cube.scrambled_cube).reshape(6, -1)
+    return bool((faces == faces[:, 4:5]).all())
+
+
 class CubeTemplate:
     def __init__(self, cube):
         self.Cube = cube
-        print(f"Cube: {self.Cube.scrambled_cube}")
-    
-    def handle_layer1(self):
-        while self.Cube.solve_level_one("Green") == 0:
-            self.Cube.solve_level_one("Green")
-        while self.Cube.bring_edge_pieces_to_bottom("Green") == 0:
-            self.Cube.bring_edge_pieces_to_bottom("Green")
-        while self.Cube.handle_corner_pieces("Green") == 0:
-            self.Cube.handle_corner_pieces("Green")
-
-    def handle_layer2(self):
-        while self.Cube.hande_layer2("Green") == 0:
-            self.Cube.hande_layer2("Green")
-
-
-    def handle_layer3(self):
-        self.Cube.handle_top_layer_figures("Green")
-
-    def run(self):
-        print("Let's start solving cube....")
-        
-        self.handle_layer1()
-        self.handle_layer2()
-        self.handle_layer3()
-        
-        print("Rubik cube is solved....")
+        debug("Cube: %s", self.Cube.scrambled_cube)
+
+    def run(self, max_moves=MAX_MOVES, timeout=TIMEOUT, cancelled=None):
+        debug("Let's start solving cube....")
+        started = time.perf_counter()
+        helper = self.Cube.cube_helper
+        log = _BoundedMoves(helper.moves, len(helper.moves) + max_moves, started + timeout, cancelled)
+        helper.moves = log
+        stage = 0
+        reason = None
+        try:
+            while stage < len(STAGES):
+                made = len(log)
+                log.step = STAGES[stage][0]
+                done = STAGES[stage][1](self.Cube) != 0
+                if TRACE:
+                    debug("step %s: %d moves", log.step, len(log) - made, step=log.step, done=done, moves=len(log) - made)
+                if len(log) > made:
+                    log.check()
+                elif done:
+                    stage += 1
+                else:
+                    raise _GaveUp("stuck")
+        except _GaveUp as exc:
+            reason = exc.reason
+        finally:
+            helper.moves = list(log)
+        if reason is None and not _is_solved(self.Cube):
+            reason = "unsolved"
+
+        if reason is None:
+            debug("Rubik cube is solved....")
+        else:
+            debug("Giving up in stage %s: %s", STAGES[min(stage, len(STAGES) - 1)][0], reason)
+        return LayerResult(
+            solved=reason is None,
+            moves=helper.moves,
+            stage=STAGES[stage][0] if stage < len(STAGES) else "done",
+            reason=reason,
+            elapsed=time.perf_counter() - started,
+        )
@@ -0,0 +1,351 @@
+from math import comb, factorial
+
+import numpy as np
+
+from move_tables import FACES, MOVE_PERMS, N_MOVES, SOLVED_STATE
+
+# Cubie-level cube: corner permutation/orientation and edge
+# permutation/orientation, using Kociemba's piece numbering. cp[i] is the
+# corner sitting at position i and co[i] its twist; likewise ep/eo for edges.
+CORNERS = ["URF", "UFL", "ULB", "UBR", "DFR", "DLF", "DBL", "DRB"]
+EDGES = ["UR", "UF", "UL", "UB", "DR", "DF", "DL", "DB", "FR", "FL", "BL", "BR"]
+
+# Sticker indices (see move_tables) of every corner and edge position. Corner
+# stickers start with the U/D sticker and go clockwise; edge stickers start
+# with the U/D sticker, or the F/B sticker for the four middle-slice edges.
+CORNER_FACELETS = [
+    (17, 45, 20),
+    (15, 18, 38),
+    (9, 36, 6),
+    (11, 8, 47),
+    (29, 26, 51),
+    (27, 44, 24),
+    (33, 0, 42),
+    (35, 53, 2),
+]
+EDGE_FACELETS = [
+    (14, 46),
+    (16, 19),
+    (12, 37),
+    (10, 7),
+    (32, 52),
+    (28, 25),
+    (30, 43),
+    (34, 1),
+    (23, 48),
+    (21, 41),
+    (3, 39),
+    (5, 50),
+]
+
+# Repo face index (Back, Top, Front, Bottom, Left, Right) of each face letter.
+FACE_SLOT = {"U": 1, "R": 5, "F": 2, "D": 3, "L": 4, "B": 0}
+CENTER_FACELETS = [FACE_SLOT[face] * 9 + 4 for face in FACES]
+
+# Colours of each piece as face indices into FACES.
+CORNER_COLORS = [tuple(FACES.index(c) for c in name) for name in CORNERS]
+EDGE_COLORS = [tuple(FACES.index(c) for c in name) for name in EDGES]
+
+N_TWIST = 3**7
+N_FLIP = 2**11
+N_SLICE = comb(12, 4)
+N_SLICE_SORTED = N_SLICE * 24
+N_CORNERS = factorial(8)
+N_UD_EDGES = factorial(8)
+N_EDGES = factorial(12)
+
+# Lookup tables for the facelet <-> cubie conversion. The colour triple read
+# from a corner position's stickers indexes _CORNER_LOOKUP, which holds
+# piece * 3 + twist (-1 for a triple no corner has); _EDGE_LOOKUP does the
+# same for edge pairs with piece * 2 + flip.
+_CORNER_STICKERS = np.array(CORNER_FACELETS, dtype=np.intp)
+_EDGE_STICKERS = np.array(EDGE_FACELETS, dtype=np.intp)
+_CORNER_LOOKUP = np.full(6 * 6 * 6, -1, dtype=np.int8)
+for _piece, (_a, _b, _c) in enumerate(CORNER_COLORS):
+    for _twist in range(3):
+        # With twist t the piece's U/D colour sits on sticker t of the position.
+        _turned = [None] * 3
+        for _k, _color in enumerate((_a, _b, _c)):
+            _turned[(_k + _twist) % 3] = _color
+        _CORNER_LOOKUP[36 * _turned[0] + 6 * _turned[1] + _turned[2]] = 3 * _piece + _twist
+_EDGE_LOOKUP = np.full(6 * 6, -1, dtype=np.int8)
+for _piece, (_a, _b) in enumerate(EDGE_COLORS):
+    _EDGE_LOOKUP[6 * _a + _b] = 2 * _piece
+    _EDGE_LOOKUP[6 * _b + _a] = 2 * _piece + 1
+_CORNER_COLOR_ARRAY = np.array(CORNER_COLORS, dtype=np.uint8)
+_EDGE_COLOR_ARRAY = np.array(EDGE_COLORS, dtype=np.uint8)
+_SLOT_OF_FACE = np.array([FACE_SLOT[face] for face in FACES], dtype=np.uint8)
+
+
+class CubieCube:
+    def __init__(self, cp=None, co=None, ep=None, eo=None):
+        self.cp = list(range(8)) if cp is None else list(cp)
+        self.co = [0] * 8 if co is None else list(co)
+        self.ep = list(range(12)) if ep is None else list(ep)
+        self.eo = [0] * 12 if eo is None else list(eo)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, CubieCube)
+            and self.cp == other.cp
+            and self.co == other.co
+            and self.ep == other.ep
+            and self.eo == other.eo
+        )
+
+    def __repr__(self):
+        return f"CubieCube(cp={self.cp}, co={self.co}, ep={self.ep}, eo={self.eo})"
+
+    def copy(self):
+        return CubieCube(self.cp, self.co, self.ep, self.eo)
+
+    @classmethod
+    def random(cls, rng=None):
+        # A uniformly random solvable cube. The last corner's twist and edge's
+        # flip make the totals work out, and swapping two edges fixes parity.
+        rng = np.random.default_rng(rng)
+        cp = rng.permutation(8).tolist()
+        ep = rng.permutation(12).tolist()
+        if _parity(cp) != _parity(ep):
+            ep[0], ep[1] = ep[1], ep[0]
+        co = rng.integers(0, 3, 8).tolist()
+        co[7] = (-sum(co[:7])) % 3
+        eo = rng.integers(0, 2, 12).tolist()
+        eo[11] = sum(eo[:11]) % 2
+        return cls(cp, co, ep, eo)
+
+    # Facelet conversion
+
+    @classmethod
+    def from_facelets(cls, facelets):
+        # `facelets` holds 54 face indices into FACES, laid out like
+        # Cube.scrambled_cube flattened.
+        facelets = np.asarray(facelets, dtype=np.intp).reshape(54)
+        corner_colors = facelets[_CORNER_STICKERS]
+        corners = _CORNER_LOOKUP[36 * corner_colors[:, 0] + 6 * corner_colors[:, 1] + corner_colors[:, 2]]
+        edge_colors = facelets[_EDGE_STICKERS]
+        edges = _EDGE_LOOKUP[6 * edge_colors[:, 0] + edge_colors[:, 1]]
+        if (corners < 0).any():
+            bad = int(np.flatnonzero(corners < 0)[0])
+            raise ValueError(f"corner at {CORNERS[bad]} has impossible colours")
+        if (edges < 0).any():
+            bad = int(np.flatnonzero(edges < 0)[0])
+            raise ValueError(f"edge at {EDGES[bad]} has impossible colours")
+        return cls(
+            (corners // 3).tolist(),
+            (corners % 3).tolist(),
+            (edges // 2).tolist(),
+            (edges % 2).tolist(),
+        )
+
+    def to_facelets(self):
+        # Inverse of from_facelets: 54 face indices into FACES.
+        facelets = np.empty(54, dtype=np.uint8)
+        facelets[CENTER_FACELETS] = np.arange(6)
+        positions = np.arange(8)[:, None]
+        turned = (np.arange(3)[None, :] + np.array(self.co)[:, None]) % 3
+        facelets[_CORNER_STICKERS[positions, turned]] = _CORNER_COLOR_ARRAY[self.cp]
+        positions = np.arange(12)[:, None]
+        turned = (np.arange(2)[None, :] + np.array(self.eo)[:, None]) % 2
+        facelets[_EDGE_STICKERS[positions, turned]] = _EDGE_COLOR_ARRAY[self.ep]
+        return facelets
+
+    @classmethod
+    def from_cube(cls, scrambled_cube):
+        # Cube.scrambled_cube layout with arbitrary colour numbers; each colour
+        # is named after the face whose centre carries it.
+        stickers = np.asarray(scrambled_cube, dtype=np.intp).reshape(54)
+        centers = stickers[CENTER_FACELETS]
+        if len(set(centers.tolist())) != 6:
+            raise ValueError("the six centre stickers must have different colours")
+        if stickers.min() < 0 or stickers.max() > 255:
+            raise ValueError("sticker colours must be between 0 and 255")
+        face_of = np.full(256, -1, dtype=np.intp)
+        face_of[centers] = np.arange(6)
+        facelets = face_of[stickers]
+        if (facelets < 0).any():
+            bad = int(stickers[np.flatnonzero(facelets < 0)[0]])
+            raise ValueError(f"colour {bad} is not on any centre")
+        return cls.from_facelets(facelets)
+
+    def to_cube(self, colors=None):
+        # Nested [Back, Top, Front, Bottom, Left, Right] lists as used by Cube.
+        # `colors` gives the sticker value of each of those six faces; the
+        # default is the face index 0..5.
+        slot_facelets = _SLOT_OF_FACE[self.to_facelets()]
+        if colors is not None:
+            slot_facelets = np.asarray(colors)[slot_facelets]
+        return slot_facelets.reshape(6, 3, 3).tolist()
+
+    # Group operations
+
+    def multiply(self, other):
+        # self followed by other.
+        cp = [self.cp[other.cp[i]] for i in range(8)]
+        co = [(self.co[other.cp[i]] + other.co[i]) % 3 for i in range(8)]
+        ep = [self.ep[other.ep[i]] for i in range(12)]
+        eo = [(self.eo[other.ep[i]] + other.eo[i]) % 2 for i in range(12)]
+        return CubieCube(cp, co, ep, eo)
+
+    def inverse(self):
+        inv = CubieCube()
+        for i in range(8):
+            inv.cp[self.cp[i]] = i
+        for i in range(8):
+            inv.co[i] = -self.co[inv.cp[i]] % 3
+        for i in range(12):
+            inv.ep[self.ep[i]] = i
+        for i in range(12):
+            inv.eo[i] = self.eo[inv.ep[i]]
+        return inv
+
+    def apply_move(self, move):
+        return self.multiply(MOVE_CUBES[move])
+
+    def corner_position(self, piece):
+        # Where a corner (index into CORNERS) currently sits, and its twist.
+        pos = self.cp.index(piece)
+        return pos, self.co[pos]
+
+    def edge_position(self, piece):
+        pos = self.ep.index(piece)
+        return pos, self.eo[pos]
+
+    def corner_parity(self):
+        return _parity(self.cp)
+
+    def edge_parity(self):
+        return _parity(self.ep)
+
+    def is_solvable(self):
+        return (
+            sum(self.co) % 3 == 0
+            and sum(self.eo) % 2 == 0
+            and self.corner_parity() == self.edge_parity()
+        )
+
+    # Coordinates. Every getter has a setter, and the solved cube is 0 for all.
+
+    def twist(self):
+        # Corner orientation, 0..2186.
+        t = 0
+        for i in range(7):
+            t = 3 * t + self.co[i]
+        return t
+
+    def set_twist(self, twist):
+        total = 0
+        for i in range(6, -1, -1):
+            self.co[i] = twist % 3
+            total += self.co[i]
+            twist //= 3
+        self.co[7] = -total % 3
+
+    def flip(self):
+        # Edge orientation, 0..2047.
+        f = 0
+        for i in range(11):
+            f = 2 * f + self.eo[i]
+        return f
+
+    def set_flip(self, flip):
+        total = 0
+        for i in range(10, -1, -1):
+            self.eo[i] = flip % 2
+            total += self.eo[i]
+            flip //= 2
+        self.eo[11] = total % 2
+
+    def slice_sorted(self):
+        # Positions and order of the FR, FL, BL, BR edges, 0..11879. The value
+        # is below 24 exactly when all four sit in the middle slice.
+        a = x = 0
+        edge4 = []
+        for j in range(11, -1, -1):
+            if self.ep[j] >= 8:
+                a += comb(11 - j, x + 1)
+                edge4.insert(0, self.ep[j])
+                x += 1
+        return 24 * a + _perm_rank([e - 8 for e in edge4])
+
+    def set_slice_sorted(self, idx):
+        # The other eight edges are filled in their natural order.
+        a, b = divmod(idx, 24)
+        edge4 = [e + 8 for e in _perm_unrank(b, 4)]
+        positions = []
+        x = 4
+        for j in range(12):
+            if x and a >= comb(11 - j, x):
+                positions.append(j)
+                a -= comb(11 - j, x)
+                x -= 1
+        others = iter(range(8))
+        slice_edges = iter(edge4)
+        self.ep = [next(slice_edges) if j in positions else next(others) for j in range(12)]
+
+    def slice(self):
+        # Which four positions hold the middle-slice edges, 0..494 (UD-slice).
+        return self.slice_sorted() // 24
+
+    def corners(self):
+        # Corner permutation, 0..40319.
+        return _perm_rank(self.cp)
+
+    def set_corners(self, idx):
+        self.cp = _perm_unrank(idx, 8)
+
+    def ud_edges(self):
+        # Permutation of the eight U/D edges, 0..40319. Only meaningful when
+        # they are all in the U and D layers, i.e. inside phase 2.
+        return _perm_rank(self.ep[:8])
+
+    def set_ud_edges(self, idx):
+        self.ep[:8] = _perm_unrank(idx, 8)
+
+    def edges(self):
+        # Full edge permutation, 0..479001599.
+        return _perm_rank(self.ep)
+
+    def set_edges(self, idx):
+        self.ep = _perm_unrank(idx, 12)
+
+
+def _perm_rank(perm):
+    # Lehmer-style rank of a permutation of 0..n-1, identity -> 0.
+    rank = 0
+    for j in range(len(perm) - 1, 0, -1):
+        rank = (j + 1) * rank + sum(1 for k in range(j) if perm[k] > perm[j])
+    return rank
+
+
+def _perm_unrank(rank, n):
+    # Inverse of _perm_rank: peel off the digits, then rebuild the
+    # permutation from the right, each entry being the k-th largest unused.
+    counts = [0] * n
+    for j in range(1, n):
+        rank, counts[j] = divmod(rank, j + 1)
+    perm = [0] * n
+    unused = list(range(n))
+    for j in range(n - 1, -1, -1):
+        perm[j] = unused.pop(len(unused) - 1 - counts[j])
+    return perm
+
+
+def _parity(perm):
+    inversions = 0
+    for i in range(len(perm)):
+        for j in range(i + 1, len(perm)):
+            if perm[i] > perm[j]:
+                inversions += 1
+    return inversions % 2
+
+
+def _build_move_cubes():
+    cubes = []
+    for m in range(N_MOVES):
+        cubes.append(CubieCube.from_cube(SOLVED_STATE[MOVE_PERMS[m]]))
+    return cubes
+
+
+# The cubie-level effect of every move in move_tables.MOVE_NAMES.
+MOVE_CUBES = _build_move_cubes()
@@ -0,0 +1,191 @@
+import time
+from dataclasses import dataclass
+
+from cube import Cube
+from cube_template import MAX_MOVES, TIMEOUT, CubeTemplate
+from move_optimizer import optimize
+from solver_log import debug
+from validator import is_valid_cube, validate_cube
+import bidirectional
+import optimal
+import two_by_two
+import two_phase
+
+# The colour numbers the layer method works with (Cube.colors) paired up the
+# way they sit on opposite faces (Cube.opposite_color). It cannot solve a
+# cube coloured any other way.
+LAYER_COLOR_PAIRS = [(4, 2), (6, 5), (3, 1)]
+
+
+class SolveGaveUp(RuntimeError):
+    # An engine stopped without a solution. `reason` says why ("move_budget",
+    # "deadline", ...), `stage` where it was.
+    def __init__(self, engine, reason, stage=None):
+        super().__init__(engine, reason, stage)
+        self.engine = engine
+        self.reason = reason
+        self.stage = stage
+
+    def __str__(self):
+        where = f" in stage {self.stage}" if self.stage else ""
+        return f"{self.engine} solver gave up{where}: {self.reason}"
+
+
+@dataclass
+class EngineResult:
+    moves: list
+    # The engine that found `moves`. Not always the one asked for:
+    # two_phase falls back to "layer".
+    engine: str
+
+
+# Every 3x3 engine takes `cancelled`: an optional callable polled while it
+# works, which makes it give up with reason "cancelled" once it returns True.
+
+
+def solve_layer(cube, max_moves=MAX_MOVES, timeout=TIMEOUT, cancelled=None):
+    result = CubeTemplate(cube).run(max_moves=max_moves, timeout=timeout, cancelled=cancelled)
+    if not result.solved:
+        raise SolveGaveUp("layer", result.reason, result.stage)
+    return EngineResult(cube.get_moves(), "layer")
+
+
+def solve_two_phase(cube, max_length=22, timeout=10.0, cancelled=None):
+    # Falls back to the layer method while the tables are being built or if
+    # nothing short enough turns up in time, provided the colours suit it.
+    # The fallback only gets whatever is left of `timeout`.
+    started = time.monotonic()
+    layer_ok = is_valid_cube(cube.scrambled_cube, LAYER_COLOR_PAIRS)
+    tables = two_phase.get_tables(block=not layer_ok)
+    if tables is None:
+        return solve_layer(cube, timeout=min(TIMEOUT, timeout), cancelled=cancelled)
+    solver = two_phase.TwoPhaseSolver(tables)
+    moves = solver.solve(cube.scrambled_cube, max_length=max_length, timeout=timeout, cancelled=cancelled)
+    if moves is None:
+        if cancelled is not None and cancelled():
+            raise SolveGaveUp("two_phase", "cancelled")
+        remaining = timeout - (time.monotonic() - started)
+        if not layer_ok or remaining <= 0:
+            raise SolveGaveUp("two_phase", "deadline")
+        return solve_layer(cube, timeout=min(TIMEOUT, remaining), cancelled=cancelled)
+    cube.apply_moves(moves)
+    return EngineResult(cube.get_moves(), "two_phase")
+
+
+def solve_optimal(cube, node_budget=None, timeout=30.0, workers=None, cancelled=None):
+    # Shortest solutions, for offline analysis; optimal.py has the details.
+    # The pattern databases are too big to build inside a request, so this
+    # gives up until `python optimal.py --build` has been run.
+    tables = optimal.get_tables(block=False)
+    if tables is None:
+        raise SolveGaveUp("optimal", "tables_missing")
+    result = optimal.OptimalSolver(tables).solve(
+        cube.scrambled_cube, node_budget=node_budget, timeout=timeout, workers=workers, cancelled=cancelled
+    )
+    if result.moves is None:
+        debug("optimal: no solution shorter than %d moves", result.depth, depth=result.depth, nodes=result.nodes)
+        raise SolveGaveUp("optimal", result.reason)
+    debug("optimal: %d moves, %d nodes", result.depth, result.nodes, depth=result.depth, nodes=result.nodes)
+    cube.apply_moves(result.moves)
+    return EngineResult(cube.get_moves(), "optimal")
+
+
+def solve_bidirectional(cube, side_depth=bidirectional.MAX_SIDE_DEPTH, timeout=10.0, cancelled=None):
+    # Shortest solutions for scrambles of up to 2 * side_depth moves.
+    moves = bidirectional.solve(cube.scrambled_cube, side_depth=side_depth, timeout=timeout, cancelled=cancelled)
+    if moves is None:
+        if cancelled is not None and cancelled():
+            raise SolveGaveUp("bidirectional", "cancelled")
+        raise SolveGaveUp("bidirectional", "too_deep")
+    cube.apply_moves(moves)
+    return EngineResult(cube.get_moves(), "bidirectional")
+
+
+def solve_two_by_two(scrambled_cube):
+    # Always a shortest solution; two_by_two.py has the details.
+    return EngineResult(two_by_two.TwoByTwoSolver().solve(scrambled_cube), "optimal")
+
+
+ENGINES = {
+    "layer": solve_layer,
+    "two_phase": solve_two_phase,
+    "optimal": solve_optimal,
+    "bidirectional": solve_bidirectional,
+}
+
+TWO_BY_TWO_ENGINES = {
+    "optimal": solve_two_by_two,
+}
+
+# Engines for each cube size, and the one used when none is asked for.
+ENGINES_BY_SIZE = {3: ENGINES, 2: TWO_BY_TWO_ENGINES}
+DEFAULT_ENGINE = {3: "layer", 2: "optimal"}
+
+
+@dataclass
+class AnytimeResult:
+    moves: list
+    # The engine that found `moves`.
+    engine: str
+    elapsed_ms: float
+
+
+def solve_anytime(scrambled_cube, deadline):
+    # Best solution found before `deadline` (a time.monotonic() value). The
+    # layer method answers within a few milliseconds when the colours suit
+    # it; then two-phase keeps searching for something shorter, each round
+    # capped one move below the best so far, until it runs out of time or
+    # proves nothing shorter exists.
+    started = time.monotonic()
+    validate_cube(scrambled_cube)
+    best, engine = None, None
+    if is_valid_cube(scrambled_cube, LAYER_COLOR_PAIRS):
+        cube = Cube(scrambled_cube)
+        result = CubeTemplate(cube).run(timeout=max(0.0, deadline - started))
+        if result.solved:
+            best, engine = optimize(cube.get_moves()).moves, "layer"
+    # Without a fallback, wait for the tables rather than answer nothing.
+    tables = two_phase.get_tables(block=best is None)
+    if tables is not None:
+        solver = two_phase.TwoPhaseSolver(tables)
+        max_length = 22 if best is None else min(22, len(best) - 1)
+        while max_length >= 0 and deadline > time.monotonic():
+            moves = solver.solve(scrambled_cube, max_length=max_length, timeout=deadline - time.monotonic())
+            if moves is None:
+                break
+            best, engine = moves, "two_phase"
+            max_length = len(moves) - 1
+    if best is None:
+        raise SolveGaveUp("anytime", "deadline")
+    debug("anytime: %d moves from %s", len(best), engine, engine=engine, moves=len(best))
+    return AnytimeResult(best, engine, (time.monotonic() - started) * 1000)
+
+
+def validate(scrambled_cube, engine="layer", size=3):
+    # Raises validator.InvalidCubeError for cubes the engine cannot solve.
+    if size == 2:
+        return two_by_two.validate(scrambled_cube)
+    return validate_cube(scrambled_cube, LAYER_COLOR_PAIRS if engine == "layer" else None)
+
+
+def solve(cube, engine="layer", **options):
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine}")
+    validate(cube.scrambled_cube, engine)
+    found = ENGINES[engine](cube, **options)
+    result = optimize(found.moves)
+    debug("%s: %d moves, %d after optimizing", found.engine, result.before, result.after, before=result.before, after=result.after)
+    return EngineResult(result.moves, found.engine)
+
+
+def solve_state(scrambled_cube, engine=None, size=3, **options):
+    # Entry point for nested-list cubes of any supported size; returns an
+    # EngineResult. `options` go to the 3x3 engine.
+    if size not in ENGINES_BY_SIZE:
+        raise ValueError(f"Unsupported cube size: {size}")
+    engine = engine or DEFAULT_ENGINE[size]
+    if size == 2:
+        if engine not in TWO_BY_TWO_ENGINES:
+            raise ValueError(f"Unknown engine for a 2x2 cube: {engine}")
+        return TWO_BY_TWO_ENGINES[engine](scrambled_cube)
+    return solve(Cube(scrambled_cube), engine, **options)
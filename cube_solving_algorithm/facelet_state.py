@@ -0,0 +1,84 @@
+import numpy as np
+
+from helper import CubeHelper
+from move_tables import HELPER_CALLS, MOVE_INDEX, MOVE_PERMS
+
+FACE_ORDER = ["Back", "Top", "Front", "Bottom", "Left", "Right"]
+
+
+class FaceletState:
+    # One contiguous uint8 buffer of 6 * n * n stickers (54 bytes for a 3x3,
+    # 96 for a 4x4) in [Back, Top, Front, Bottom, Left, Right] order.
+    # `faces` is a (6, n, n) view into the same memory, so code written
+    # against the nested-list layout (cube[face][row][col]) works unchanged.
+    def __init__(self, n=3, data=None):
+        self.n = n
+        if data is None:
+            data = np.zeros(6 * n * n, dtype=np.uint8)
+        if data.dtype != np.uint8 or data.shape != (6 * n * n,):
+            raise ValueError(f"expected {6 * n * n} uint8 stickers, got {data.shape} {data.dtype}")
+        self.data = data
+        self.faces = data.reshape(6, n, n)
+
+    @classmethod
+    def from_nested(cls, cube):
+        arr = np.asarray(cube, dtype=np.uint8)
+        if arr.ndim != 3 or arr.shape[0] != 6 or arr.shape[1] != arr.shape[2]:
+            raise ValueError(f"expected a 6xNxN cube, got shape {arr.shape}")
+        return cls(arr.shape[1], np.ascontiguousarray(arr).reshape(-1).copy())
+
+    def to_nested(self):
+        return self.faces.tolist()
+
+    def face(self, name):
+        return self.faces[FACE_ORDER.index(name)]
+
+    def copy(self):
+        return FaceletState(self.n, self.data.copy())
+
+    def __len__(self):
+        return 6
+
+    def __getitem__(self, idx):
+        return self.faces[idx]
+
+    def __eq__(self, other):
+        if not isinstance(other, FaceletState):
+            return NotImplemented
+        return self.n == other.n and np.array_equal(self.data, other.data)
+
+    def __repr__(self):
+        return f"FaceletState(n={self.n}, {self.to_nested()})"
+
+
+class FaceletCubeHelper(CubeHelper):
+    # Drop-in replacement for CubeHelper that works on the (6, 3, 3) face view
+    # of a FaceletState. Each quarter turn is one gather from the move tables
+    # into a preallocated scratch buffer and a copy back, so solving does no
+    # per-move allocation.
+    _turns = {
+        (method[-1], direction, layer): (name, MOVE_PERMS[MOVE_INDEX[name]])
+        for name, (method, direction, layer) in HELPER_CALLS.items()
+    }
+
+    def __init__(self, dirs):
+        super().__init__(dirs)
+        self._scratch = np.empty(54, dtype=np.uint8)
+
+    def _turn(self, scrambled_cube, key):
+        name, perm = self._turns[key]
+        self.moves.append(name)
+        flat = scrambled_cube.reshape(-1)
+        np.take(flat, perm, out=self._scratch)
+        flat[:] = self._scratch
+
+    # The layer checks mirror CubeHelper: anything but col 0 is R, anything
+    # but row 0 is D, anything but row 2 is B.
+    def rotate_X(self, scrambled_cube, dir, col):
+        self._turn(scrambled_cube, ("X", 1 if dir == 1 else -1, 0 if col == 0 else 2))
+
+    def rotate_Y(self, scramble_cube, dir, row):
+        self._turn(scramble_cube, ("Y", -1 if dir == -1 else 1, 0 if row == 0 else 2))
+
+    def rotate_Z(self, scramble_cube, dir, row):
+        self._turn(scramble_cube, ("Z", 1 if dir == 1 else -1, 2 if row == 2 else 0))
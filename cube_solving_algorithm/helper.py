@@ -1,4 +1,4 @@
-import pandas as pd
+from solver_log import TRACE, debug
 class CubeHelper:
     def __init__(self, dirs):
         self.dirs = dirs
@@ -340,10 +340,19 @@ class CubeHelper:
                 scramble_cube[self.dirs["Back"]] = new_back
 
     def getmoves(self):
-        m = ["F", "F'", "B", "B'", "L", "L'", "R", "R'", "U", "U'", "D", "D'"]
-        names = ["Move front face clockwise", "Move front face anti-clockwise", "Move back face clockwise", "Move back face anti-clockwise", "Move left face clockwise", "Move left face anti-clockwise", "Move right face clockwise", "Move right face anti-clockwise", "Move up face clockwise", "Move up face anti-clockwise", "Move down face clockwise", "Move down face anti-clockwise"]
-        d = {"Moves Names": m, "Moves Def.": names}
-        df = pd.DataFrame(d)
-        print(df)
-        print()
-        return self.moves
\ No newline at end of file
+        if TRACE:
+            debug("%s", move_legend())
+        return self.moves
+
+
+def move_legend():
+    # What each move name means, for traces. A pandas DataFrame when pandas
+    # is installed; it is optional and only imported here, so the solver
+    # itself never loads it.
+    m = ["F", "F'", "B", "B'", "L", "L'", "R", "R'", "U", "U'", "D", "D'"]
+    names = ["Move front face clockwise", "Move front face anti-clockwise", "Move back face clockwise", "Move back face anti-clockwise", "Move left face clockwise", "Move left face anti-clockwise", "Move right face clockwise", "Move right face anti-clockwise", "Move up face clockwise", "Move up face anti-clockwise", "Move down face clockwise", "Move down face anti-clockwise"]
+    try:
+        import pandas as pd
+    except ImportError:
+        return "\n".join(f"{move:<3} {name}" for move, name in zip(m, names))
+    return pd.DataFrame({"Moves Names": m, "Moves Def.": names})
\ No newline at end of file
@@ -1,21 +1,302 @@
-from fastapi import FastAPI
-from cube_template import CubeTemplate
-from cube import Cube
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Optional, Union
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
+from admission import AdmissionQueue, QueueFull
+import cube_format
+import engines
+from portfolio import Portfolio
+from single_flight import SingleFlight
+from solution_cache import SolutionCache
+from solver import Solution
+from validator import InvalidCubeError
+from solver_pool import SolverPool
+
+try:
+    import orjson
+except ImportError:  # optional; the json module gives the same output, slower
+    orjson = None
+
+# Size it with SOLVER_WORKERS (defaults to the number of cores).
+pool = SolverPool.from_env()
+# Size it with SOLUTION_CACHE_SIZE and SOLUTION_CACHE_TTL (seconds).
+cache = SolutionCache.from_env()
+# Identical solves in flight at the same time share one.
+inflight = SingleFlight()
+# One running solve per worker (a portfolio race takes one per engine),
+# SOLVER_QUEUE_SIZE more waiting; beyond that requests get a 503.
+admission = AdmissionQueue.from_env(pool.workers)
+# Seconds a request may take, queueing included, unless it sets timeout_ms.
+# Unset leaves each engine its own time limit.
+SOLVE_TIMEOUT = float(os.environ["SOLVE_TIMEOUT"]) if os.environ.get("SOLVE_TIMEOUT") else None
+# engine="portfolio" races several engines in the pool.
+portfolio = Portfolio(pool)
+PORTFOLIO = "portfolio"
+# Most cubes one batch request may send; more get a 413.
+MAX_BATCH = int(os.environ.get("SOLVER_MAX_BATCH", 256))
+
+
+@asynccontextmanager
+async def lifespan(app):
+    await pool.warm_up()
+    yield
+    pool.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+def _dumps(content):
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, separators=(",", ":")).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    # Solutions are returned as these directly, which skips FastAPI's
+    # jsonable_encoder pass; orjson does the encoding when installed.
+    def render(self, content):
+        return _dumps(content)
 
-app = FastAPI()
 
 class CubeInput(BaseModel):
-    scrambled_cube: list
+    # Nested 6x3x3 lists, or a 3x3 cube as a facelet or packed string
+    # (see cube_format.py).
+    scrambled_cube: Union[list, str]
+    engine: Optional[str] = None
+    size: int = 3
+    # Anytime mode: return the best solution found within this many ms.
+    deadline_ms: Optional[int] = None
+    # Also send the moves as one string, e.g. "RU'F2".
+    compact: bool = False
+    # Time allowed for the whole request, waiting for a solver included.
+    timeout_ms: Optional[int] = None
+
+class BatchInput(BaseModel):
+    # Each cube in any form CubeInput takes.
+    scrambled_cubes: list
+    engine: Optional[str] = None
+    size: int = 3
+    compact: bool = False
+    # For the whole batch.
+    timeout_ms: Optional[int] = None
 
 @app.get("/")
 async def read_root():
     return {"message": "Hello, World!"}
 
 
+@app.get("/metrics")
+async def metrics():
+    return {
+        "cache": cache.stats(),
+        "coalescing": inflight.stats(),
+        "queue": admission.stats(),
+        "portfolio": portfolio.stats(),
+    }
+
+
+def _pick_engine(engine, size):
+    if size not in engines.ENGINES_BY_SIZE:
+        raise HTTPException(status_code=400, detail=f"Unsupported cube size: {size}")
+    engine = engine or engines.DEFAULT_ENGINE[size]
+    if engine == PORTFOLIO and size == 3:
+        return engine
+    if engine not in engines.ENGINES_BY_SIZE[size]:
+        raise HTTPException(status_code=400, detail=f"Unknown engine for a {size}x{size} cube: {engine}")
+    return engine
+
+
+def _deadline(timeout_ms):
+    # time.monotonic() value the request has to be answered by, or None.
+    if timeout_ms is not None:
+        if timeout_ms <= 0:
+            raise HTTPException(status_code=400, detail="timeout_ms must be positive")
+        return time.monotonic() + timeout_ms / 1000
+    if SOLVE_TIMEOUT is not None:
+        return time.monotonic() + SOLVE_TIMEOUT
+    return None
+
+
+def _overloaded(exc):
+    return HTTPException(
+        status_code=503,
+        detail={"reason": exc.reason, "message": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+async def _solve(scrambled_cube, engine, size=3, deadline=None, bulk=False):
+    # (moves, engine that found them). Moves as CubeHelper names, which is
+    # what the cache keeps.
+    scrambled_cube = cube_format.decode(scrambled_cube, size=size)
+    # Reject unsolvable cubes here, before they reach a worker.
+    engines.validate(scrambled_cube, engine, size)
+    cached = cache.get(scrambled_cube, engine)
+    if cached is not None:
+        return cached
+    solve = partial(_solve_uncached, scrambled_cube, engine, size, deadline, bulk)
+    try:
+        return await inflight.run(scrambled_cube, engine, solve, deadline)
+    except asyncio.TimeoutError:
+        # Waited on another request's solve past our own deadline.
+        raise engines.SolveGaveUp(engine, "deadline") from None
+
+
+def _places(scrambled_cube, engine):
+    # Workers the solve keeps busy, which is what it is charged in the queue.
+    if engine == PORTFOLIO:
+        return len(portfolio.engines_for(scrambled_cube))
+    return 1
+
+
+def _settled(token, future):
+    # The worker is done with the token, so it can be handed out again.
+    if not future.cancelled():
+        # Mostly a "cancelled" give-up nobody waits for any more.
+        future.exception()
+    if token is not None:
+        pool.release_token(token)
+
+
+async def _pool_solve(scrambled_cube, engine, size, timeout, busy):
+    # pool.solve() with a cancel token of its own, so that cancelling this
+    # (single_flight does once nobody waits for the answer) stops the
+    # worker's search too, not just the wait for it. The worker call goes
+    # in `busy`, which keeps its admission places until it has returned.
+    token = pool.take_token()
+    future = asyncio.ensure_future(pool.solve(scrambled_cube, engine, size, token, timeout))
+    future.add_done_callback(partial(_settled, token))
+    busy.append(future)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        if token is not None:
+            pool.cancel(token)
+        raise
+
+
+async def _solve_uncached(scrambled_cube, engine, size, deadline, bulk):
+    async with admission.slot(deadline, _places(scrambled_cube, engine), bulk) as busy:
+        # Whatever time the queue left is the solver's limit.
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        if engine == PORTFOLIO:
+            result = await portfolio.race(scrambled_cube, timeout=timeout, busy=busy)
+        else:
+            result = await _pool_solve(scrambled_cube, engine, size, timeout, busy)
+    moves = list(result.moves)
+    # A fallback answer (two_phase's layer method) is not what the engine
+    # would give once it can, so it is not kept. Any portfolio winner is.
+    if result.engine == engine or engine == PORTFOLIO:
+        cache.put(scrambled_cube, engine, moves, result.engine)
+    return moves, result.engine
+
+
+async def _solve_anytime(scrambled_cube, deadline_ms, engine=None, request_deadline=None):
+    deadline = time.monotonic() + deadline_ms / 1000
+    if request_deadline is not None:
+        deadline = min(deadline, request_deadline)
+    scrambled_cube = cube_format.decode(scrambled_cube)
+    engines.validate(scrambled_cube, "anytime")
+    async with admission.slot(deadline, _places(scrambled_cube, engine)) as busy:
+        if engine == PORTFOLIO:
+            result = await portfolio.race(scrambled_cube, deadline, busy=busy)
+        else:
+            # Stops at the deadline by itself; until then the worker is busy
+            # even if the request goes away.
+            future = asyncio.ensure_future(pool.solve_anytime(scrambled_cube, deadline))
+            future.add_done_callback(partial(_settled, None))
+            busy.append(future)
+            result = await asyncio.shield(future)
+    return Solution(tuple(result.moves), result.engine, 3, result.elapsed_ms)
+
+
+async def _solution(scrambled_cube, engine, size=3, deadline=None, bulk=False):
+    started = time.perf_counter()
+    moves, used = await _solve(scrambled_cube, engine, size, deadline, bulk)
+    return Solution(tuple(moves), used, size, (time.perf_counter() - started) * 1000, engine)
+
+
 @app.post("/solve_cube")
-def solve_cube(scrambled_cube: CubeInput):
-    c = Cube(scrambled_cube.scrambled_cube)
-    ctemplate = CubeTemplate(c)
-    ctemplate.run()
-    return c.get_moves()
+async def solve_cube(scrambled_cube: CubeInput):
+    anytime = scrambled_cube.deadline_ms is not None
+    if anytime:
+        if scrambled_cube.size != 3:
+            raise HTTPException(status_code=400, detail="deadline_ms is only supported for 3x3 cubes")
+        if scrambled_cube.deadline_ms <= 0:
+            raise HTTPException(status_code=400, detail="deadline_ms must be positive")
+        if scrambled_cube.engine not in (None, PORTFOLIO):
+            raise HTTPException(
+                status_code=400, detail=f"Unknown engine for deadline_ms (only {PORTFOLIO} or none): {scrambled_cube.engine}"
+            )
+    else:
+        engine = _pick_engine(scrambled_cube.engine, scrambled_cube.size)
+    deadline = _deadline(scrambled_cube.timeout_ms)
+    try:
+        if anytime:
+            solution = await _solve_anytime(
+                scrambled_cube.scrambled_cube, scrambled_cube.deadline_ms, scrambled_cube.engine, deadline
+            )
+        else:
+            solution = await _solution(scrambled_cube.scrambled_cube, engine, scrambled_cube.size, deadline)
+    except InvalidCubeError as exc:
+        raise HTTPException(status_code=400, detail={"reason": exc.reason, "message": str(exc)})
+    except QueueFull as exc:
+        raise _overloaded(exc)
+    except engines.SolveGaveUp as exc:
+        raise HTTPException(
+            status_code=422,
+            detail={"status": "gave_up", "engine": exc.engine, "reason": exc.reason, "stage": exc.stage},
+        )
+    return FastJSONResponse(solution.to_payload(scrambled_cube.compact))
+
+
+async def _solve_indexed(index, cube, engine, size, compact=False, deadline=None):
+    try:
+        # The batch was let in as a whole, so its cubes wait their turn in
+        # the batch line, behind single requests.
+        solution = await _solution(cube, engine, size, deadline, bulk=True)
+        return {"index": index, **solution.to_payload(compact)}
+    except InvalidCubeError as exc:
+        return {"index": index, "error": str(exc), "reason": exc.reason}
+    except QueueFull as exc:
+        return {"index": index, "error": str(exc), "reason": exc.reason, "retry_after": exc.retry_after}
+    except engines.SolveGaveUp as exc:
+        return {"index": index, "error": str(exc), "status": "gave_up", "reason": exc.reason, "stage": exc.stage}
+    except Exception as exc:
+        # One bad cube should not end the stream for the rest.
+        return {"index": index, "error": str(exc) or type(exc).__name__}
+
+
+@app.post("/solve_cube/batch")
+async def solve_cube_batch(batch: BatchInput):
+    # Streams one JSON line per cube as soon as it is solved, so the lines
+    # come out of order; "index" says which input cube each one belongs to.
+    engine = _pick_engine(batch.engine, batch.size)
+    deadline = _deadline(batch.timeout_ms)
+    if len(batch.scrambled_cubes) > MAX_BATCH:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH} cubes per batch")
+    if admission.full() or admission.full(bulk=True):
+        raise _overloaded(QueueFull("queue_full", admission.retry_after(bulk=True)))
+
+    async def results():
+        tasks = [
+            asyncio.ensure_future(_solve_indexed(i, cube, engine, batch.size, batch.compact, deadline))
+            for i, cube in enumerate(batch.scrambled_cubes)
+        ]
+        try:
+            for done in asyncio.as_completed(tasks):
+                yield _dumps(await done) + b"\n"
+        finally:
+            # The client went away; don't leave queued solves behind.
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+
+from move_tables import FACES, MOVE_INDEX, MOVE_NAMES
+
+# Shortens a move sequence without changing what it does to the cube:
+# consecutive turns of one face merge (U U -> U2, U U U -> U', R R' -> -),
+# and since opposite faces commute (U D == D U) a turn also merges with a
+# turn of its face sitting just behind one opposite-face turn (U D U -> U2 D).
+OPPOSITE = [FACES.index(face) for face in "DLBURF"]
+
+
+@dataclass
+class Optimized:
+    moves: list
+    before: int
+    after: int
+
+
+def _push(out, face, turns):
+    # `out` holds (face, quarter turns) pairs. No two turns of one face are
+    # next to each other or separated only by an opposite-face turn, so a new
+    # turn can merge with at most the last or the second-to-last entry.
+    for back in (1, 2):
+        if len(out) < back:
+            break
+        prev_face, prev_turns = out[-back]
+        if prev_face == face:
+            total = (prev_turns + turns) % 4
+            if total:
+                out[-back] = (face, total)
+            else:
+                del out[-back]
+            return
+        if prev_face != OPPOSITE[face]:
+            break
+    out.append((face, turns))
+
+
+def optimize(moves):
+    # `moves` are names as in move_tables.MOVE_NAMES ("U", "U2", "U'", ...).
+    out = []
+    for name in moves:
+        m = MOVE_INDEX[name]
+        _push(out, m // 3, m % 3 + 1)
+    optimized = [MOVE_NAMES[3 * face + turns - 1] for face, turns in out]
+    return Optimized(optimized, len(moves), len(optimized))
+
+
+def quarter_turns(moves):
+    # Spells half turns out as two quarter turns, for clients that only
+    # animate quarter turns.
+    out = []
+    for name in moves:
+        if name.endswith("2"):
+            out += [name[0], name[0]]
+        else:
+            out.append(name)
+    return out
@@ -0,0 +1,132 @@
+import numpy as np
+
+from helper import CubeHelper
+
+# Sticker indices follow Cube.scrambled_cube flattened: Back 0-8, Top 9-17,
+# Front 18-26, Bottom 27-35, Left 36-44, Right 45-53 (row-major per face).
+#
+# Move names are the ones CubeHelper records. Like the Ursina viewer they are
+# axis based: L, D and B turn the same way as R, U and F around their axis.
+FACES = ["U", "R", "F", "D", "L", "B"]
+
+# Sticker cycles of one quarter turn: (a, b, c, d) moves the sticker at a to
+# b, b to c, c to d and d back to a.
+QUARTER_TURN_CYCLES = {
+    "U": [(6, 47, 20, 38), (7, 46, 19, 37), (8, 45, 18, 36), (9, 11, 17, 15), (10, 14, 16, 12)],
+    "R": [(2, 29, 20, 11), (5, 32, 23, 14), (8, 35, 26, 17), (45, 47, 53, 51), (46, 50, 52, 48)],
+    "F": [(15, 45, 29, 44), (16, 48, 28, 41), (17, 51, 27, 38), (18, 20, 26, 24), (19, 23, 25, 21)],
+    "D": [(0, 53, 26, 44), (1, 52, 25, 43), (2, 51, 24, 42), (27, 33, 35, 29), (28, 30, 34, 32)],
+    "L": [(0, 27, 18, 9), (3, 30, 21, 12), (6, 33, 24, 15), (36, 42, 44, 38), (37, 39, 43, 41)],
+    "B": [(0, 6, 8, 2), (1, 3, 7, 5), (9, 47, 35, 42), (10, 50, 34, 39), (11, 53, 33, 36)],
+}
+
+# The CubeHelper call (method, dir, row/col) that records each quarter turn.
+HELPER_CALLS = {
+    "U": ("rotate_Y", -1, 0),
+    "U'": ("rotate_Y", 1, 0),
+    "D": ("rotate_Y", -1, 2),
+    "D'": ("rotate_Y", 1, 2),
+    "L": ("rotate_X", 1, 0),
+    "L'": ("rotate_X", -1, 0),
+    "R": ("rotate_X", 1, 2),
+    "R'": ("rotate_X", -1, 2),
+    "F": ("rotate_Z", 1, 2),
+    "F'": ("rotate_Z", -1, 2),
+    "B": ("rotate_Z", 1, 0),
+    "B'": ("rotate_Z", -1, 0),
+}
+
+# Move m is face FACES[m // 3] turned m % 3 + 1 quarter turns: U, U2, U', R, ...
+MOVE_NAMES = [face + suffix for face in FACES for suffix in ("", "2", "'")]
+MOVE_INDEX = {name: idx for idx, name in enumerate(MOVE_NAMES)}
+N_MOVES = len(MOVE_NAMES)
+INVERSE_MOVE = np.array([3 * (m // 3) + 2 - m % 3 for m in range(N_MOVES)], dtype=np.intp)
+
+IDENTITY = np.arange(54, dtype=np.intp)
+SOLVED_STATE = np.repeat(np.arange(6, dtype=np.uint8), 9)
+
+
+def compose(first, second):
+    # Gather index for applying `first` and then `second`.
+    return first[second]
+
+
+def _build_move_perms():
+    perms = np.empty((N_MOVES, 54), dtype=np.intp)
+    for f, face in enumerate(FACES):
+        quarter = IDENTITY.copy()
+        for cycle in QUARTER_TURN_CYCLES[face]:
+            for src, dst in zip(cycle, cycle[1:] + cycle[:1]):
+                quarter[dst] = src
+        perm = quarter
+        for power in range(3):
+            perms[3 * f + power] = perm
+            perm = compose(perm, quarter)
+    perms.setflags(write=False)
+    return perms
+
+
+MOVE_PERMS = _build_move_perms()
+
+
+def parse_moves(moves):
+    # Accepts "R U R' U'" or an iterable of move names / indices.
+    if isinstance(moves, str):
+        moves = moves.split()
+    return [m if isinstance(m, (int, np.integer)) else MOVE_INDEX[m] for m in moves]
+
+
+def move_names(moves):
+    return [MOVE_NAMES[m] for m in moves]
+
+
+# Standard (Singmaster) notation turns every face clockwise as seen from
+# that face, so its L, D and B are the inverses of the ones here. The
+# mapping is its own inverse and works both ways.
+_STANDARD = {face + a: face + b for face in "LDB" for a, b in (("", "'"), ("'", ""))}
+
+
+def to_standard(moves):
+    return [_STANDARD.get(m, m) for m in moves]
+
+
+def from_standard(moves):
+    return [_STANDARD.get(m, m) for m in moves]
+
+
+def apply_move(state, move):
+    return state[MOVE_PERMS[move]]
+
+
+def apply_moves(state, moves):
+    for m in parse_moves(moves):
+        state = state[MOVE_PERMS[m]]
+    return state
+
+
+def sequence_perm(moves):
+    perm = IDENTITY
+    for m in parse_moves(moves):
+        perm = compose(perm, MOVE_PERMS[m])
+    return perm
+
+
+def verify_against_helper():
+    # Checks every table entry against the loop-based CubeHelper. Quarter
+    # turns are compared directly, doubles and primes through repeated
+    # helper calls. Returns the names of the moves that disagree.
+    mismatches = []
+    dirs = {"Back": 0, "Top": 1, "Face": 2, "Bottom": 3, "Left": 4, "Right": 5}
+    for name in MOVE_NAMES:
+        if name.endswith("2"):
+            calls = [HELPER_CALLS[name[0]]] * 2
+        else:
+            calls = [HELPER_CALLS[name]]
+        labelled = [[[f * 9 + r * 3 + c for c in range(3)] for r in range(3)] for f in range(6)]
+        helper = CubeHelper(dirs)
+        for method, direction, layer in calls:
+            getattr(helper, method)(labelled, direction, layer)
+        expected = [x for face in labelled for row in face for x in row]
+        if list(MOVE_PERMS[MOVE_INDEX[name]]) != expected:
+            mismatches.append(name)
+    return mismatches
@@ -0,0 +1,410 @@
+import argparse
+import itertools
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from math import perm
+from typing import Optional
+
+import numpy as np
+
+from cubie import MOVE_CUBES, N_CORNERS, N_TWIST, CubieCube
+from move_tables import MOVE_NAMES, N_MOVES
+from table_store import LazyTables
+import two_phase
+
+# Optimal 3x3 solver for offline analysis: IDA* over the full move set with
+# Korf's pattern databases as the heuristic. Each database holds the exact
+# number of moves needed to solve one part of the cube, so the largest of
+# them never overestimates:
+#   corners  all 8 corners, 8! * 3^7 = 88,179,840 states
+#   edges_a  edges UR..DB (the first six), 12!/6! * 2^6 = 42,577,920 states
+#   edges_b  the other six edges, same size
+# Distances fit in 4 bits, so two states share a byte: 87 MB for the three.
+# With the move tables for the edge coordinates (60 MB) and the corners
+# (3 MB) the table file comes to 150 MB, memory-mapped from tables_dir().
+# Building it takes about half a minute and peaks at about 1.7 GB of
+# memory, far more than a server worker should use, so nothing builds it
+# on demand: run `python optimal.py --build` once ahead of time. Until
+# then get_tables(block=False) returns None.
+#
+# Random cubes take 18 moves on average and IDA* in Python visits tens of
+# thousands of nodes a second, so past ~14 moves a search needs a node
+# budget or a timeout. A search that runs out still reports the depth it
+# had cleared: no solution is shorter than that.
+EDGE_GROUPS = [list(range(6)), list(range(6, 12))]
+N_EDGE_POSITIONS = perm(12, 6)
+N_EDGE_STATES = N_EDGE_POSITIONS * 64
+
+# OPTIMAL_WORKERS sets how many processes share a search by default.
+DEFAULT_WORKERS = int(os.environ.get("OPTIMAL_WORKERS") or 1)
+# Most nodes a search visits between checks of its budget and deadline.
+CHECK_EVERY = 1024
+
+# Where each move sends an edge sitting at position j, and whether it flips.
+_EDGE_DEST = np.empty((N_MOVES, 12), dtype=np.intp)
+_EDGE_FLIP = np.empty((N_MOVES, 12), dtype=np.uint8)
+for _m, _move in enumerate(MOVE_CUBES):
+    for _i, _j in enumerate(_move.ep):
+        _EDGE_DEST[_m, _j] = _i
+        _EDGE_FLIP[_m, _j] = _move.eo[_i]
+
+
+def edge_positions_rank(positions):
+    # Rank of six distinct positions 0..11 in itertools.permutations order.
+    rank = 0
+    used = []
+    for k, p in enumerate(positions):
+        rank += (p - sum(1 for u in used if u < p)) * perm(11 - k, 5 - k)
+        used.append(p)
+    return rank
+
+
+def edge_state(cube, group):
+    # Positions of the group's edges (in group order) and their flips, one
+    # bit per edge.
+    positions = [cube.ep.index(e) for e in group]
+    flips = sum(cube.eo[p] << k for k, p in enumerate(positions))
+    return edge_positions_rank(positions) * 64 + flips
+
+
+def _edge_move_tables():
+    positions = np.array(list(itertools.permutations(range(12), 6)), dtype=np.intp)
+    weights = 12 ** np.arange(5, -1, -1)
+    rank_of = np.zeros(12**6, dtype=np.int32)
+    rank_of[positions @ weights] = np.arange(N_EDGE_POSITIONS)
+    position_move = np.empty((N_EDGE_POSITIONS, N_MOVES), dtype=np.int32)
+    flip_move = np.empty((N_EDGE_POSITIONS, N_MOVES), dtype=np.uint8)
+    bits = 1 << np.arange(6)
+    for m in range(N_MOVES):
+        position_move[:, m] = rank_of[_EDGE_DEST[m][positions] @ weights]
+        flip_move[:, m] = _EDGE_FLIP[m][positions] @ bits
+    return position_move, flip_move
+
+
+def _bfs(size, start, step):
+    # Exact distances from `start`. step(states, m) gives the states one move
+    # away. Once fewer states are left unreached than sit on the frontier,
+    # it searches backwards from the unreached ones instead, which works
+    # because every move's inverse is a move too.
+    dist = np.full(size, -1, dtype=np.int8)
+    dist[start] = 0
+    depth = 0
+    chunk = 1 << 21
+    while True:
+        frontier = np.flatnonzero(dist == depth)
+        if not len(frontier):
+            break
+        unreached = np.flatnonzero(dist < 0)
+        if len(unreached) < len(frontier):
+            for lo in range(0, len(unreached), chunk):
+                part = unreached[lo : lo + chunk]
+                found = np.zeros(len(part), dtype=bool)
+                for m in range(N_MOVES):
+                    found |= dist[step(part, m)] == depth
+                dist[part[found]] = depth + 1
+        else:
+            for lo in range(0, len(frontier), chunk):
+                part = frontier[lo : lo + chunk]
+                for m in range(N_MOVES):
+                    nxt = step(part, m)
+                    dist[nxt[dist[nxt] < 0]] = depth + 1
+        depth += 1
+    return dist
+
+
+def _pack(dist):
+    # Two 4-bit distances per byte, the even state in the low nibble.
+    dist = dist.astype(np.uint8)
+    if len(dist) % 2:
+        dist = np.append(dist, 0)
+    return dist[0::2] | dist[1::2] << 4
+
+
+def build_tables():
+    coords = two_phase.get_tables()
+    corners_move = np.asarray(coords["corners_move"], dtype=np.int64)
+    twist_move = np.asarray(coords["twist_move"], dtype=np.int64)
+
+    def corner_step(states, m):
+        c, t = np.divmod(states, N_TWIST)
+        return corners_move[c, m] * N_TWIST + twist_move[t, m]
+
+    position_move, flip_move = _edge_move_tables()
+
+    def edge_step(states, m):
+        p, f = np.divmod(states, 64)
+        return position_move[p, m].astype(np.int64) * 64 + (f ^ flip_move[p, m])
+
+    tables = {
+        "corners_move": corners_move.astype(np.int32),
+        "twist_move": twist_move.astype(np.int16),
+        "edge_position_move": position_move,
+        "edge_flip_move": flip_move,
+        "corners_prun": _pack(_bfs(N_CORNERS * N_TWIST, 0, corner_step)),
+    }
+    for name, group in zip(("edges_a_prun", "edges_b_prun"), EDGE_GROUPS):
+        tables[name] = _pack(_bfs(N_EDGE_STATES, edge_state(CubieCube(), group), edge_step))
+    return tables
+
+
+# Bump the version whenever build_tables() changes its output.
+TABLES = LazyTables("optimal", "optimal-1", build_tables, background=False)
+
+
+def get_tables(block=True):
+    return TABLES.get(block=block)
+
+
+@dataclass
+class OptimalResult:
+    # `moves` is None when the search gave up; `depth` is then the length
+    # below which no solution exists, otherwise the solution's length.
+    moves: Optional[list]
+    depth: int
+    nodes: int
+    reason: Optional[str] = None  # "node_budget", "deadline" or "cancelled"
+    elapsed: float = 0.0
+
+
+class _GaveUp(Exception):
+    def __init__(self, reason):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def _check_every(node_budget, workers=1):
+    # A power of two, so the workers together overshoot the budget by at
+    # most about the budget itself.
+    if node_budget is None:
+        return CHECK_EVERY
+    share = max(1, node_budget // workers)
+    return min(CHECK_EVERY, 1 << (share.bit_length() - 1))
+
+
+class _Search:
+    # One IDA* pass. Counts nodes and checks the budget and deadline every
+    # `check_every` nodes; with `shared` (a node counter and a stop event)
+    # those checks cover every process working on the same cube.
+    def __init__(self, tables, deadline, node_budget, shared=None, cancelled=None, check_every=CHECK_EVERY):
+        flat = {name: memoryview(np.ascontiguousarray(arr).reshape(-1)) for name, arr in tables.items()}
+        self.corners_move = flat["corners_move"]
+        self.twist_move = flat["twist_move"]
+        self.edge_position_move = flat["edge_position_move"]
+        self.edge_flip_move = flat["edge_flip_move"]
+        self.corners_prun = flat["corners_prun"]
+        self.edges_a_prun = flat["edges_a_prun"]
+        self.edges_b_prun = flat["edges_b_prun"]
+        self.deadline = deadline
+        self.node_budget = node_budget
+        self.shared = shared
+        self.cancelled = cancelled
+        self.check_every = check_every
+        self._check_mask = check_every - 1
+        self.nodes = 0
+        self.path = []
+
+    def _check(self):
+        total = self.nodes
+        if self.shared is not None:
+            counter, stop = self.shared
+            with counter.get_lock():
+                counter.value += self.check_every
+                total = counter.value
+            if stop.is_set():
+                raise _GaveUp("stopped")
+        if self.node_budget is not None and total > self.node_budget:
+            raise _GaveUp("node_budget")
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise _GaveUp("deadline")
+        if self.cancelled is not None and self.cancelled():
+            raise _GaveUp("cancelled")
+
+    def heuristic(self, corners, twist, edges_a, edges_b):
+        c = corners * N_TWIST + twist
+        return max(
+            self.corners_prun[c >> 1] >> ((c & 1) << 2) & 15,
+            self.edges_a_prun[edges_a >> 1] >> ((edges_a & 1) << 2) & 15,
+            self.edges_b_prun[edges_b >> 1] >> ((edges_b & 1) << 2) & 15,
+        )
+
+    def _edge_move(self, edges, m):
+        p = (edges >> 6) * N_MOVES + m
+        return self.edge_position_move[p] << 6 | ((edges & 63) ^ self.edge_flip_move[p])
+
+    def search(self, corners, twist, edges_a, edges_b, togo):
+        # Depth-first search for a solution of exactly `togo` more moves;
+        # True leaves it in self.path.
+        self.nodes += 1
+        if self.nodes & self._check_mask == 0:
+            self._check()
+        if togo == 0:
+            return True
+        path = self.path
+        last = path[-1] // 3 if path else -1
+        for m in range(N_MOVES):
+            face = m // 3
+            # Skip turning the same face twice and order commuting opposite faces.
+            if face == last or face == last - 3:
+                continue
+            c = self.corners_move[corners * N_MOVES + m]
+            t = self.twist_move[twist * N_MOVES + m]
+            a = self._edge_move(edges_a, m)
+            b = self._edge_move(edges_b, m)
+            # Every state with h == 0 is solved, so this also stops a path
+            # from reaching solved before its last move.
+            if self.heuristic(c, t, a, b) >= togo:
+                continue
+            path.append(m)
+            if self.search(c, t, a, b, togo - 1):
+                return True
+            path.pop()
+        return False
+
+
+_worker_tables = None
+_worker_shared = None
+
+
+def _init_worker(counter, stop):
+    global _worker_tables, _worker_shared
+    _worker_tables = get_tables()
+    _worker_shared = (counter, stop)
+
+
+def _search_branch(state, first, togo, deadline, node_budget, check_every):
+    # Searches below one root move. Returns (path or None, reason or None).
+    if _worker_shared[1].is_set():
+        return None, "stopped"
+    search = _Search(_worker_tables, deadline, node_budget, _worker_shared, check_every=check_every)
+    search.path = [first]
+    try:
+        if search.search(*state, togo):
+            _worker_shared[1].set()
+            return search.path, None
+    except _GaveUp as exc:
+        return None, exc.reason
+    finally:
+        # _check() only counts whole batches of check_every nodes.
+        counter = _worker_shared[0]
+        with counter.get_lock():
+            counter.value += search.nodes & search._check_mask
+    return None, None
+
+
+# The process pool parallel searches run in, kept for the life of this
+# process so its workers map the tables once rather than once per solve.
+# It is replaced when a search asks for a different number of workers.
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor(workers):
+    # (executor, node counter, stop event); call with _executor_lock held.
+    global _executor
+    if _executor is None or _executor[1] != workers:
+        if _executor is not None:
+            _executor[0].shutdown()
+        ctx = multiprocessing.get_context("spawn")
+        counter, stop = ctx.Value("q", 0), ctx.Event()
+        pool = ProcessPoolExecutor(workers, mp_context=ctx, initializer=_init_worker, initargs=(counter, stop))
+        _executor = (pool, workers, counter, stop)
+    pool, _, counter, stop = _executor
+    return pool, counter, stop
+
+
+class OptimalSolver:
+    def __init__(self, tables=None):
+        self.tables = get_tables() if tables is None else tables
+
+    def solve(self, scrambled_cube, max_length=20, node_budget=None, timeout=None, workers=None, cancelled=None):
+        # Returns an OptimalResult whose moves are a shortest solution as move
+        # names, or None if the node budget or timeout ran out first. With
+        # workers > 1, each depth is split across processes by first move.
+        started = time.perf_counter()
+        deadline = None if timeout is None else started + timeout
+        workers = DEFAULT_WORKERS if workers is None else workers
+        cube = CubieCube.from_cube(scrambled_cube)
+        state = (cube.corners(), cube.twist(), edge_state(cube, EDGE_GROUPS[0]), edge_state(cube, EDGE_GROUPS[1]))
+        search = _Search(self.tables, deadline, node_budget, cancelled=cancelled, check_every=_check_every(node_budget))
+        depth = search.heuristic(*state)
+        if workers > 1 and depth > 1:
+            return self._solve_parallel(search, state, depth, max_length, node_budget, deadline, workers, started, cancelled)
+
+        moves, reason = None, None
+        try:
+            while depth <= max_length:
+                if search.search(*state, depth):
+                    moves = [MOVE_NAMES[m] for m in search.path]
+                    break
+                depth += 1
+        except _GaveUp as exc:
+            reason = exc.reason
+        return OptimalResult(moves, depth, search.nodes, reason, time.perf_counter() - started)
+
+    def _solve_parallel(self, search, state, depth, max_length, node_budget, deadline, workers, started, cancelled):
+        roots = []
+        for m in range(N_MOVES):
+            child = (
+                search.corners_move[state[0] * N_MOVES + m],
+                search.twist_move[state[1] * N_MOVES + m],
+                search._edge_move(state[2], m),
+                search._edge_move(state[3], m),
+            )
+            roots.append((m, child, search.heuristic(*child)))
+        check_every = _check_every(node_budget, workers)
+
+        moves, reason = None, None
+        # One search at a time per executor: they share its node counter and
+        # stop event. Every branch has finished by the end of the loop, so
+        # the next search starts from a quiet pool.
+        with _executor_lock:
+            pool, counter, stop = _get_executor(workers)
+            counter.value = 0
+            stop.clear()
+            while depth <= max_length and moves is None and reason is None:
+                pending = {
+                    pool.submit(_search_branch, child, m, depth - 1, deadline, node_budget, check_every)
+                    for m, child, h in roots
+                    if h < depth
+                }
+                while pending:
+                    done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                    if cancelled is not None and reason is None and cancelled():
+                        reason = "cancelled"
+                        stop.set()
+                    for future in done:
+                        path, why = future.result()
+                        if path is not None and moves is None:
+                            moves = [MOVE_NAMES[m] for m in path]
+                        elif why not in (None, "stopped") and reason is None:
+                            reason = why
+                            stop.set()
+                    # Branches too small to reach a check still count.
+                    if node_budget is not None and moves is None and reason is None and counter.value > node_budget:
+                        reason = "node_budget"
+                        stop.set()
+                if moves is None and reason is None:
+                    depth += 1
+            nodes = counter.value
+        if moves is not None:
+            reason = None
+        return OptimalResult(moves, depth, nodes, reason, time.perf_counter() - started)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the optimal solver's pattern databases ahead of time.")
+    parser.add_argument("--build", action="store_true", help="build the tables unless they are already there")
+    args = parser.parse_args(argv)
+    if args.build:
+        get_tables()
+    ready = get_tables(block=False) is not None
+    print(f"{TABLES.path}: {'ready' if ready else 'not built; run with --build'}")
+    return 0 if ready else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+from validator import is_valid_cube
+import engines
+
+# Races several 3x3 engines on the same cube in the solver pool's worker
+# processes. Without a deadline the first acceptable solution wins: one of
+# at most ACCEPT_LENGTH moves from an engine whose betters, the engines
+# listed before it, have all finished. With a deadline, the shortest
+# solution in by then does. The losers are stopped
+# through the pool's cancel tokens. Wins are counted per engine and logged
+# after every race, to show which engines are worth their core.
+#
+# The default line-up: bidirectional search finds a shortest solution for
+# scrambles of up to ten moves, two-phase gets any cube to 22 moves or
+# fewer, and the layer method is the fallback that answers in milliseconds.
+DEFAULT_ENGINES = ["bidirectional", "two_phase", "layer"]
+# Solutions at most this long end the race straight away.
+ACCEPT_LENGTH = 22
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class PortfolioResult:
+    moves: list
+    engine: str
+    elapsed_ms: float
+
+
+class Portfolio:
+    def __init__(self, pool, engine_names=None, accept_length=ACCEPT_LENGTH):
+        self.pool = pool
+        self.engine_names = list(engine_names or DEFAULT_ENGINES)
+        self.accept_length = accept_length
+        self.races = 0
+        self.wins = Counter()
+
+    def engines_for(self, scrambled_cube):
+        # The layer method cannot take cubes coloured any other way than
+        # Cube.colors, so it sits those out.
+        if is_valid_cube(scrambled_cube, engines.LAYER_COLOR_PAIRS):
+            return self.engine_names
+        return [name for name in self.engine_names if name != "layer"]
+
+    async def race(self, scrambled_cube, deadline=None, timeout=None, busy=None):
+        # `deadline` is a time.monotonic() value. Raises engines.SolveGaveUp
+        # if no engine solved the cube (in time); an engine that fails any
+        # other way just loses. `timeout` (seconds) is passed on to every
+        # engine as its time limit. The worker calls are added to `busy`
+        # (see AdmissionQueue.slot).
+        started = time.monotonic()
+        token = self.pool.take_token()
+        tasks = {
+            asyncio.ensure_future(self.pool.solve(scrambled_cube, name, 3, token, timeout)): name
+            for name in self.engines_for(scrambled_cube)
+        }
+        if busy is not None:
+            busy.extend(tasks)
+        pending = set(tasks)
+        best = None
+        try:
+            while pending:
+                wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+                done, pending = await asyncio.wait(pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+                for task in done:
+                    try:
+                        solution = task.result()
+                    except Exception as exc:
+                        if not isinstance(exc, engines.SolveGaveUp):
+                            log.warning("portfolio: %s failed: %r", tasks[task], exc)
+                        continue
+                    # The engine that answered, which for two-phase may have
+                    # been its layer fallback.
+                    if best is None or solution.count < len(best[0]):
+                        best = (list(solution.moves), tasks[task], solution.engine)
+                if deadline is None and best is not None and len(best[0]) <= self.accept_length:
+                    rank = self.engine_names.index(best[1])
+                    if all(self.engine_names.index(tasks[task]) > rank for task in pending):
+                        break
+        finally:
+            # Tasks already running in a worker cannot be dropped, so stop
+            # them through the token and hand it back once they are done.
+            if token is not None:
+                self.pool.cancel(token)
+            asyncio.ensure_future(self._release_when_done(token, pending))
+
+        if best is None:
+            raise engines.SolveGaveUp("portfolio", "deadline" if pending else "all_gave_up")
+        best = PortfolioResult(best[0], best[2], (time.monotonic() - started) * 1000)
+        self.races += 1
+        self.wins[best.engine] += 1
+        log.info(
+            "portfolio: %s won with %d moves in %.0f ms; win rates %s",
+            best.engine,
+            len(best.moves),
+            best.elapsed_ms,
+            ", ".join(f"{name} {rate:.0%}" for name, rate in self.win_rates().items()),
+        )
+        return best
+
+    async def _release_when_done(self, token, tasks):
+        if tasks:
+            await asyncio.wait(tasks)
+        for task in tasks:
+            # Mostly "cancelled" give-ups; fetched so asyncio does not warn.
+            if not task.cancelled():
+                task.exception()
+        if token is not None:
+            self.pool.release_token(token)
+
+    def win_rates(self):
+        return {name: self.wins[name] / self.races if self.races else 0.0 for name in self.engine_names}
+
+    def stats(self):
+        return {"races": self.races, "wins": dict(self.wins), "win_rates": self.win_rates()}
@@ -3,6 +3,8 @@ import time
 
 from ursina import *
 
+from move_optimizer import optimize, quarter_turns
+
 app = Ursina(fullscreen=True)
 cube_model, cube_texture = "models/custom_cube.obj", "textures/rrr.jpeg"
 
@@ -272,6 +274,11 @@ moves = [
     "l",
     "l",
 ]
+# The moves are Ursina keys, one quarter turn each (see input()); merging
+# and cancelling them first saves the viewer some turns.
+KEY_MOVES = dict(zip("asdwqepoilkj", ["L", "D", "R", "U", "F", "B", "L'", "D'", "R'", "U'", "F'", "B'"]))
+MOVE_KEYS = {move: key for key, move in KEY_MOVES.items()}
+moves = [MOVE_KEYS[m] for m in quarter_turns(optimize([KEY_MOVES[k] for k in moves]).moves)]
 current_move = 0
 
 
@@ -0,0 +1,101 @@
+import asyncio
+import math
+import time
+
+import numpy as np
+
+from move_tables import MOVE_INDEX, move_names
+import symmetry
+
+# Requests only share a solve if their deadlines fall in the same slice of
+# this many seconds, so nobody waits on a solve allowed much longer than
+# they are (or gets one cut short much sooner).
+DEADLINE_BUCKET = 0.1
+
+
+class _Flight:
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    # Coalesces identical solves that are running at the same time: the
+    # first request for a cube starts the solve, and requests for the same
+    # cube arriving before it finishes wait for that one instead of starting
+    # their own. Cubes are matched like SolutionCache matches them (engine
+    # and canonical state, so a rotated or recoloured copy counts as the
+    # same cube) and the moves are mapped through each request's symmetry.
+    # Cubes without a canonical form (2x2s) match only exact copies, and
+    # requests only match if their deadlines do (DEADLINE_BUCKET).
+    #
+    # The solve runs in a task of its own, so one waiter going away does not
+    # cancel it for the others; it is cancelled once all of them have gone,
+    # and main.py passes that on to the worker through a cancel token.
+    # The solve is bounded by the first request's deadline; the others stop
+    # waiting at their own, which raises asyncio.TimeoutError.
+    # Only for use from the event loop's thread.
+    def __init__(self):
+        self._flights = {}
+        self.solves = 0
+        self.coalesced = 0
+        self.timed_out = 0
+
+    def _key(self, scrambled_cube, engine, deadline):
+        bucket = None if deadline is None else math.ceil(deadline / DEADLINE_BUCKET)
+        try:
+            key, k = symmetry.canonical_form(scrambled_cube)
+        except ValueError:
+            return (engine, bucket, np.asarray(scrambled_cube).tobytes()), None
+        return (engine, bucket, key), k
+
+    async def run(self, scrambled_cube, engine, solve, deadline=None):
+        # `solve` is a coroutine function returning (moves, engine used) for
+        # this cube, and so does this. `deadline` is a time.monotonic() value.
+        key, k = self._key(scrambled_cube, engine, deadline)
+        flight = self._flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _Flight(asyncio.ensure_future(self._lead(solve, k)))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._land(key, flight))
+            self.solves += 1
+        else:
+            self.coalesced += 1
+        flight.waiters += 1
+        try:
+            answer = asyncio.shield(flight.task)
+            if not leader and deadline is not None:
+                answer = asyncio.wait_for(answer, max(0.0, deadline - time.monotonic()))
+            (moves, used), lead_k = await answer
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            raise
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Nobody is left to take the answer.
+                self._land(key, flight)
+                flight.task.cancel()
+        if lead_k == k or lead_k is None or any(m not in MOVE_INDEX for m in moves):
+            return list(moves), used
+        canonical = symmetry.to_canonical_moves([MOVE_INDEX[m] for m in moves], lead_k)
+        return move_names(symmetry.from_canonical_moves(canonical, k)), used
+
+    async def _lead(self, solve, k):
+        return await solve(), k
+
+    def _land(self, key, flight):
+        # A later flight for the same cube may already have taken the slot.
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def stats(self):
+        requests = self.solves + self.coalesced
+        return {
+            "in_flight": len(self._flights),
+            "solves": self.solves,
+            "coalesced": self.coalesced,
+            "timed_out": self.timed_out,
+            "coalesced_rate": self.coalesced / requests if requests else 0.0,
+        }
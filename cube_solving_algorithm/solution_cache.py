@@ -0,0 +1,91 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from move_tables import MOVE_INDEX, move_names
+import symmetry
+
+
+class SolutionCache:
+    # Bounded LRU of solutions keyed by (engine, canonical state), so every
+    # rotation, reflection and recolouring of a cube shares one entry.
+    # Solutions are stored for the canonical image and mapped back through
+    # the symmetry on the way out, together with the engine that found them.
+    # ttl=None keeps entries until evicted.
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @classmethod
+    def from_env(cls):
+        ttl = os.environ.get("SOLUTION_CACHE_TTL")
+        return cls(
+            maxsize=int(os.environ.get("SOLUTION_CACHE_SIZE", 1024)),
+            ttl=float(ttl) if ttl else None,
+        )
+
+    def _key(self, scrambled_cube, engine):
+        # None for cubes that have no canonical form (wrong size, bad
+        # centres); those are simply not cached.
+        try:
+            key, k = symmetry.canonical_form(scrambled_cube)
+        except ValueError:
+            return None, None
+        return (engine, key), k
+
+    def get(self, scrambled_cube, engine):
+        # (moves, engine that found them), or None.
+        key, k = self._key(scrambled_cube, engine)
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[2] > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return move_names(symmetry.from_canonical_moves(entry[0], k)), entry[1]
+
+    def put(self, scrambled_cube, engine, moves, solved_by=None):
+        # `solved_by` is the engine that found the moves, if not `engine`.
+        if self.maxsize <= 0 or any(m not in MOVE_INDEX for m in moves):
+            return
+        key, k = self._key(scrambled_cube, engine)
+        if key is None:
+            return
+        canonical = symmetry.to_canonical_moves([MOVE_INDEX[m] for m in moves], k)
+        with self._lock:
+            self._entries[key] = (canonical, solved_by or engine, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -0,0 +1,85 @@
+import copy
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
+
+from move_tables import to_standard
+import cube_format
+import engines
+
+# The solver as a pure function: solve(state, options) -> Solution. Nothing
+# passed in is modified and nothing is kept between calls (apart from the
+# read-only tables), so one process can run any number of solves at once
+# from any number of threads. The Cube and CubeTemplate objects the layer
+# method works on are created inside each call and dropped at the end.
+
+
+@dataclass(frozen=True)
+class SolveOptions:
+    # None picks the size's default engine (engines.DEFAULT_ENGINE).
+    engine: Optional[str] = None
+    size: int = 3
+    # Seconds; None leaves each engine's own default.
+    timeout: Optional[float] = None
+    # Polled while a 3x3 engine works; it gives up once this returns True.
+    cancelled: Optional[Callable[[], bool]] = None
+    # Any other keyword arguments of the engine, e.g. {"max_length": 20}.
+    engine_options: Mapping = field(default_factory=lambda: MappingProxyType({}))
+
+
+@dataclass(frozen=True)
+class Solution:
+    # CubeHelper names (see move_tables.py), as the engines return them.
+    moves: tuple
+    # The engine that found the moves, which can differ from the one asked
+    # for (engines.EngineResult).
+    engine: str
+    size: int
+    elapsed_ms: float = 0.0
+    # The engine asked for, when that was not the one that answered.
+    requested_engine: Optional[str] = None
+
+    @property
+    def count(self):
+        return len(self.moves)
+
+    def standard_moves(self):
+        return to_standard(self.moves)
+
+    def to_payload(self, compact=False):
+        # What the API sends back: standard notation, plus with `compact`
+        # the moves run together ("RU'F2"), which still parses since every
+        # move starts with its face letter.
+        moves = self.standard_moves()
+        payload = {"moves": moves, "count": len(moves), "engine": self.engine, "elapsed_ms": round(self.elapsed_ms, 1)}
+        if self.requested_engine is not None and self.requested_engine != self.engine:
+            payload["requested_engine"] = self.requested_engine
+        if compact:
+            payload["compact"] = "".join(moves)
+        return payload
+
+
+DEFAULT_OPTIONS = SolveOptions()
+
+
+def solve(state, options=DEFAULT_OPTIONS):
+    # `state` is a cube in any form main.py accepts: nested lists (6xNxN) or,
+    # for a 3x3, a cube_format string. Raises validator.InvalidCubeError,
+    # engines.SolveGaveUp or ValueError for an unknown engine or size.
+    started = time.perf_counter()
+    engine = options.engine or engines.DEFAULT_ENGINE.get(options.size)
+    # The engines leave their input alone, but the caller still owns it.
+    if isinstance(state, str):
+        scrambled_cube = cube_format.decode(state, size=options.size)
+    else:
+        scrambled_cube = copy.deepcopy(state)
+    kwargs = dict(options.engine_options)
+    if options.size == 3:
+        if options.timeout is not None:
+            kwargs["timeout"] = options.timeout
+        if options.cancelled is not None:
+            kwargs["cancelled"] = options.cancelled
+    result = engines.solve_state(scrambled_cube, engine, options.size, **kwargs)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return Solution(tuple(result.moves), result.engine, options.size, elapsed_ms, engine)
@@ -0,0 +1,23 @@
+import logging
+import os
+
+# Step-by-step tracing for the layer solvers. Whether it is on is decided
+# once, at import, from CUBE_SOLVER_TRACE. When it is off, debug() is a
+# function that does nothing, so the solvers never build a message. When
+# it is on, debug() logs at DEBUG level on the "cube_solver" logger. Any
+# keyword fields (step, piece, move, ...) are attached to the log record
+# as `event`, for structured formatters.
+TRACE = os.environ.get("CUBE_SOLVER_TRACE", "") not in ("", "0")
+
+log = logging.getLogger("cube_solver")
+
+
+def _debug(msg, *args, **fields):
+    log.debug(msg, *args, extra={"event": fields} if fields else None)
+
+
+def _quiet(msg, *args, **fields):
+    pass
+
+
+debug = _debug if TRACE else _quiet
@@ -0,0 +1,112 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import bidirectional
+import engines
+import solver
+import two_by_two
+import two_phase
+
+
+# Shared flags that stop solves already running in a worker: a solve given
+# token t gives up once flag t is set (see engines' `cancelled`).
+N_CANCEL_TOKENS = 256
+_cancel_flags = None
+
+
+def _use_cancel_flags(flags):
+    global _cancel_flags
+    _cancel_flags = flags
+
+
+def _is_cancelled(token):
+    return _cancel_flags[token] != 0
+
+
+def _init_worker(cancel_flags):
+    _use_cancel_flags(cancel_flags)
+    # Map the solver tables (or kick off their one-time build) as soon as the
+    # worker starts, so the first real solve does not pay for it.
+    two_phase.get_tables(block=False)
+    two_by_two.get_tables(block=False)
+    bidirectional.warm_up()
+
+
+def _ping():
+    return os.getpid()
+
+
+def solve_in_worker(scrambled_cube, engine=None, size=3, token=None, timeout=None):
+    cancelled = None if token is None else partial(_is_cancelled, token)
+    options = solver.SolveOptions(engine, size, timeout=timeout, cancelled=cancelled)
+    return solver.solve(scrambled_cube, options)
+
+
+class SolverPool:
+    # Runs solves in a pool of worker processes so CPU-bound searches neither
+    # hold the event loop nor contend on one GIL. workers=0 solves in a thread
+    # of the serving process instead (handy for development).
+    def __init__(self, workers=None):
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self._executor = None
+        self._cancel_flags = multiprocessing.get_context("spawn").RawArray("b", N_CANCEL_TOKENS)
+        self._free_tokens = list(range(N_CANCEL_TOKENS))
+        if self.workers == 0:
+            # Solves run in this process's threads and read the flags here.
+            _use_cancel_flags(self._cancel_flags)
+
+    @classmethod
+    def from_env(cls):
+        workers = os.environ.get("SOLVER_WORKERS")
+        return cls(int(workers) if workers else None)
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._cancel_flags,),
+            )
+        return self._executor
+
+    async def run(self, fn, *args):
+        if self.workers == 0:
+            return await asyncio.to_thread(fn, *args)
+        return await asyncio.wrap_future(self._get_executor().submit(fn, *args))
+
+    async def warm_up(self):
+        # One task per worker makes the executor start all of them now.
+        if self.workers:
+            await asyncio.gather(*(self.run(_ping) for _ in range(self.workers)))
+
+    async def solve(self, scrambled_cube, engine=None, size=3, token=None, timeout=None):
+        # A solver.Solution. `timeout` (seconds) replaces the engine's own
+        # time limit.
+        return await self.run(solve_in_worker, scrambled_cube, engine, size, token, timeout)
+
+    def take_token(self):
+        # A cancel token for solve(), or None if all of them are in use.
+        if not self._free_tokens:
+            return None
+        token = self._free_tokens.pop()
+        self._cancel_flags[token] = 0
+        return token
+
+    def cancel(self, token):
+        self._cancel_flags[token] = 1
+
+    def release_token(self, token):
+        # Only once every solve given the token has finished.
+        self._free_tokens.append(token)
+
+    async def solve_anytime(self, scrambled_cube, deadline):
+        return await self.run(engines.solve_anytime, scrambled_cube, deadline)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,88 @@
+import itertools
+
+import numpy as np
+
+from move_tables import IDENTITY, MOVE_PERMS, N_MOVES, QUARTER_TURN_CYCLES
+
+# The 48 symmetries of the cube (24 rotations, each with and without a
+# mirror) as sticker permutations, plus what each one does to the moves.
+#
+# A sticker's position is read off the move cycles: it lies on the +x layer
+# if an R turn moves it, on the -x layer if an L turn does, and so on; its
+# own face pushes it out to +-2 along that axis. Every signed permutation of
+# the axes then maps positions to positions.
+_AXIS = {"R": (0, 1), "L": (0, -1), "U": (1, 1), "D": (1, -1), "F": (2, 1), "B": (2, -1)}
+_FACE_OF_SLOT = ["B", "U", "F", "D", "L", "R"]
+
+
+def _sticker_positions():
+    pos = np.zeros((54, 3), dtype=np.int64)
+    for face, cycles in QUARTER_TURN_CYCLES.items():
+        axis, sign = _AXIS[face]
+        for cycle in cycles:
+            pos[list(cycle), axis] = sign
+    for idx in range(54):
+        axis, sign = _AXIS[_FACE_OF_SLOT[idx // 9]]
+        pos[idx, axis] = 2 * sign
+    return pos
+
+
+def _build_symmetries():
+    pos = _sticker_positions()
+    where = {tuple(p): i for i, p in enumerate(pos)}
+    perms = []
+    for axes in itertools.permutations(range(3)):
+        for signs in itertools.product((1, -1), repeat=3):
+            moved = pos[:, axes] * signs
+            perms.append([where[tuple(p)] for p in moved])
+    perms = np.array(perms, dtype=np.intp)
+    # Keep the identity first so an unsymmetric lookup maps moves unchanged.
+    perms = perms[np.argsort([not np.array_equal(p, IDENTITY) for p in perms], kind="stable")]
+
+    # Conjugating a turn by a symmetry gives another turn (of the opposite
+    # direction under a mirror): sym_moves[k][m] is the move that does to a
+    # cube what m does to its image under symmetry k.
+    move_of = {p.tobytes(): m for m, p in enumerate(MOVE_PERMS)}
+    sym_moves = np.empty((len(perms), N_MOVES), dtype=np.intp)
+    for k, sym in enumerate(perms):
+        inverse = np.argsort(sym)
+        for m in range(N_MOVES):
+            sym_moves[k, m] = move_of[sym[MOVE_PERMS[m]][inverse].tobytes()]
+    perms.setflags(write=False)
+    sym_moves.setflags(write=False)
+    return perms, sym_moves
+
+
+SYMMETRY_PERMS, SYMMETRY_MOVES = _build_symmetries()
+N_SYMMETRIES = len(SYMMETRY_PERMS)
+_CENTERS = np.array([slot * 9 + 4 for slot in range(6)], dtype=np.intp)
+
+
+def canonical_form(scrambled_cube):
+    # Returns (key, k): key is the same bytes for every cube that differs
+    # from this one only by a whole-cube rotation, reflection or relabelling
+    # of the colours; k is the symmetry that took this cube there. Raises
+    # ValueError for anything that is not a 3x3 with six distinct centres.
+    state = np.asarray(scrambled_cube).reshape(-1)
+    if state.size != 54:
+        raise ValueError(f"expected a 3x3 cube with 54 stickers, got {state.size}")
+    images = state[SYMMETRY_PERMS]
+    centers = images[:, _CENTERS]
+    if len(np.unique(centers[0])) != 6:
+        raise ValueError("the six centres must have distinct colours")
+    # Recolour each image so the centre of slot i has colour i.
+    images = (images[:, :, None] == centers[:, None, :]).argmax(axis=2).astype(np.uint8)
+    keys = [row.tobytes() for row in images]
+    k = min(range(N_SYMMETRIES), key=keys.__getitem__)
+    return keys[k], k
+
+
+def to_canonical_moves(moves, k):
+    # Moves solving the cube -> moves solving its canonical image.
+    inverse = np.argsort(SYMMETRY_MOVES[k])
+    return [int(inverse[m]) for m in moves]
+
+
+def from_canonical_moves(moves, k):
+    # Moves solving the canonical image -> moves solving the cube.
+    return [int(SYMMETRY_MOVES[k][m]) for m in moves]
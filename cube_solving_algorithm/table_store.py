@@ -0,0 +1,211 @@
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+
+import numpy as np
+
+# On-disk format for solver tables, shared between processes with np.memmap:
+#
+#   8 bytes   magic b"RUBIKTBL"
+#   4 bytes   format version (little-endian uint32)
+#   4 bytes   header length
+#   header    JSON: table-set version, crc32 of the payload and, per array,
+#             its name, dtype, shape and payload offset
+#   payload   the raw arrays, each starting on a 64-byte boundary
+MAGIC = b"RUBIKTBL"
+FORMAT_VERSION = 1
+ALIGN = 64
+# A builder writes its pid into the lock file right after creating it, so a
+# lock that stays empty or unreadable this long (seconds) belongs to one
+# that died in between.
+EMPTY_LOCK_TIMEOUT = 10.0
+# The checksum is verified once, by the process that built the file. Set
+# CUBE_TABLES_VERIFY=1 to verify it on every load too, at the cost of
+# reading every page of the file up front.
+VERIFY_ON_LOAD = os.environ.get("CUBE_TABLES_VERIFY", "") not in ("", "0")
+
+log = logging.getLogger(__name__)
+
+
+class TableFileError(Exception):
+    pass
+
+
+def tables_dir():
+    return os.environ.get("CUBE_TABLES_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "tables"))
+
+
+def _align(n):
+    return -(-n // ALIGN) * ALIGN
+
+
+def save_tables(path, arrays, version):
+    # Writes to a temporary file first so readers never see a partial table.
+    entries = []
+    offset = 0
+    crc = 0
+    for name, arr in arrays.items():
+        arr = np.ascontiguousarray(arr)
+        entries.append({"name": name, "dtype": arr.dtype.str, "shape": list(arr.shape), "offset": offset})
+        offset = _align(offset + arr.nbytes)
+        crc = zlib.crc32(arr.data, crc)
+    header = json.dumps({"version": version, "crc32": crc, "arrays": entries}).encode()
+    prefix = MAGIC + FORMAT_VERSION.to_bytes(4, "little") + len(header).to_bytes(4, "little") + header
+    start = _align(len(prefix))
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(prefix.ljust(start, b"\0"))
+        for entry, arr in zip(entries, arrays.values()):
+            fh.seek(start + entry["offset"])
+            fh.write(np.ascontiguousarray(arr).data)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+def load_tables(path, version, verify=False):
+    # Returns {name: read-only np.memmap}. Raises FileNotFoundError when the
+    # file is missing and TableFileError when it is stale, truncated or (with
+    # verify, which reads the whole payload) corrupt.
+    with open(path, "rb") as fh:
+        fixed = fh.read(16)
+        if len(fixed) < 16 or fixed[:8] != MAGIC:
+            raise TableFileError(f"{path}: not a table file")
+        if int.from_bytes(fixed[8:12], "little") != FORMAT_VERSION:
+            raise TableFileError(f"{path}: unsupported format version")
+        header_len = int.from_bytes(fixed[12:16], "little")
+        try:
+            header = json.loads(fh.read(header_len))
+        except ValueError:
+            raise TableFileError(f"{path}: unreadable header") from None
+    if header.get("version") != version:
+        raise TableFileError(f"{path}: table version {header.get('version')!r}, expected {version!r}")
+    start = _align(16 + header_len)
+    size = os.path.getsize(path)
+    arrays = {}
+    crc = 0
+    for entry in header["arrays"]:
+        dtype = np.dtype(entry["dtype"])
+        shape = tuple(entry["shape"])
+        offset = start + entry["offset"]
+        if offset + dtype.itemsize * int(np.prod(shape)) > size:
+            raise TableFileError(f"{path}: truncated")
+        arr = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+        if verify:
+            crc = zlib.crc32(arr.data, crc)
+        arrays[entry["name"]] = arr
+    if verify and crc != header["crc32"]:
+        raise TableFileError(f"{path}: checksum mismatch")
+    return arrays
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class LazyTables:
+    # A table set that lives in tables_dir()/<name>.tbl. get() memory-maps the
+    # file if it exists; otherwise it starts one background build (guarded by
+    # a lock file, so only one process builds) and returns None until the
+    # file is there. get(block=True) waits for or runs the build instead.
+    # With background=False, get() never builds: tables too big to build
+    # inside a server are built ahead of time with get(block=True).
+    def __init__(self, name, version, builder, background=True):
+        self.name = name
+        self.version = version
+        self.builder = builder
+        self.background = background
+        self._tables = None
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def path(self):
+        return os.path.join(tables_dir(), f"{self.name}.tbl")
+
+    def ready(self):
+        return self.get() is not None
+
+    def get(self, block=False):
+        if self._tables is not None:
+            return self._tables
+        with self._lock:
+            if self._tables is None:
+                self._tables = self._load()
+            if self._tables is None:
+                if block:
+                    self._build()
+                    self._tables = self._load()
+                elif self.background and (self._thread is None or not self._thread.is_alive()):
+                    self._thread = threading.Thread(target=self._build, name=f"build-{self.name}", daemon=True)
+                    self._thread.start()
+            return self._tables
+
+    def _load(self):
+        try:
+            return load_tables(self.path, self.version, VERIFY_ON_LOAD)
+        except FileNotFoundError:
+            return None
+        except TableFileError as exc:
+            log.warning("discarding table file: %s", exc)
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            return None
+
+    def _build(self):
+        lock_path = self.path + ".lock"
+        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                # Someone else is building; wait for them unless they died.
+                try:
+                    with open(lock_path) as fh:
+                        owner = int(fh.read() or 0)
+                    age = time.time() - os.path.getmtime(lock_path)
+                except FileNotFoundError:
+                    continue
+                except ValueError:
+                    owner = 0
+                    age = time.time() - os.path.getmtime(lock_path)
+                if (owner and not _pid_alive(owner)) or (not owner and age > EMPTY_LOCK_TIMEOUT):
+                    try:
+                        os.remove(lock_path)
+                    except FileNotFoundError:
+                        pass
+                    continue
+                if os.path.exists(self.path):
+                    return
+                time.sleep(0.2)
+                continue
+            break
+        try:
+            os.write(fd, str(os.getpid()).encode())
+            os.close(fd)
+            if os.path.exists(self.path):
+                return
+            log.info("building %s tables", self.name)
+            started = time.perf_counter()
+            save_tables(self.path, self.builder(), self.version)
+            try:
+                load_tables(self.path, self.version, verify=True)
+            except TableFileError:
+                os.remove(self.path)
+                raise
+            log.info("built %s tables in %.1fs", self.name, time.perf_counter() - started)
+        finally:
+            os.remove(lock_path)
@@ -0,0 +1,153 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Solve in threads, so importing main starts no worker processes.
+os.environ.setdefault("SOLVER_WORKERS", "0")
+
+from fastapi.testclient import TestClient
+
+from admission import AdmissionQueue, QueueFull
+from cubie import CubieCube
+from solver import Solution
+import main
+
+# The admission queue: places, shedding with 503s and Retry-After, and
+# places staying taken while a worker is still busy. Runs under pytest, or
+# as `python tests/test_admission.py`.
+
+COLORS = [5, 1, 6, 3, 2, 4]
+
+
+class BlockingPool:
+    # Stands in for SolverPool: every solve blocks its "worker" until
+    # `finish` is set, whatever happens to the request.
+    workers = 1
+
+    def __init__(self):
+        self.finish = threading.Event()
+        self.cancelled = []
+
+    def take_token(self):
+        return 7
+
+    def cancel(self, token):
+        self.cancelled.append(token)
+
+    def release_token(self, token):
+        pass
+
+    async def solve(self, scrambled_cube, engine=None, size=3, token=None, timeout=None):
+        await asyncio.to_thread(self.finish.wait, 5)
+        return Solution((), engine, size)
+
+
+def test_queue_full_is_shed_with_retry_after():
+    async def run():
+        queue = AdmissionQueue(1, max_waiting=1)
+        async with queue.slot():
+            waiter = asyncio.ensure_future(queue._acquire(None, 1, False))
+            await asyncio.sleep(0)
+            assert queue.depth == 1
+            try:
+                async with queue.slot():
+                    raise AssertionError("admitted past a full queue")
+            except QueueFull as exc:
+                assert exc.reason == "queue_full"
+                assert exc.retry_after >= 1
+            waiter.cancel()
+        assert queue.stats()["rejected"] == 1
+
+    asyncio.run(run())
+
+
+def test_deadline_passes_while_waiting():
+    async def run():
+        queue = AdmissionQueue(1)
+        async with queue.slot():
+            try:
+                async with queue.slot(deadline=time.monotonic() + 0.01):
+                    raise AssertionError("admitted while the place was taken")
+            except QueueFull as exc:
+                assert exc.reason == "deadline"
+        assert queue.stats()["timed_out"] == 1
+        assert queue.stats()["running"] == 0
+
+    asyncio.run(run())
+
+
+def test_batch_line_waits_for_single_requests():
+    async def run():
+        queue = AdmissionQueue(1)
+        order = []
+
+        async def solve(name, bulk):
+            async with queue.slot(bulk=bulk):
+                order.append(name)
+                await asyncio.sleep(0.01)
+
+        async with queue.slot():
+            tasks = [asyncio.ensure_future(solve("batch", True))]
+            await asyncio.sleep(0)
+            tasks.append(asyncio.ensure_future(solve("single", False)))
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        assert order == ["single", "batch"]
+
+    asyncio.run(run())
+
+
+def test_cancelled_solve_keeps_its_place_until_the_worker_returns():
+    async def run():
+        pool = BlockingPool()
+        queue = AdmissionQueue(pool.workers)
+        cube = CubieCube.random(1).to_cube(COLORS)
+        with mock.patch.object(main, "pool", pool), mock.patch.object(main, "admission", queue):
+            task = asyncio.ensure_future(main._solve(cube, "two_phase"))
+            await asyncio.sleep(0.05)
+            assert queue.stats()["running"] == 1
+            task.cancel()
+            await asyncio.sleep(0.05)
+            assert task.cancelled()
+            # The worker was told to stop but has not returned yet.
+            assert pool.cancelled == [7]
+            assert queue.stats()["running"] == 1
+            pool.finish.set()
+            for _ in range(100):
+                if queue.stats()["running"] == 0:
+                    break
+                await asyncio.sleep(0.01)
+            assert queue.stats()["running"] == 0
+
+    asyncio.run(run())
+
+
+def test_full_queue_gets_503():
+    queue = AdmissionQueue(1, max_waiting=0)
+    asyncio.run(queue._acquire(None, 1, False))
+    cube = CubieCube.random(2).to_cube(COLORS)
+    with mock.patch.object(main, "admission", queue):
+        client = TestClient(main.app)
+        resp = client.post("/solve_cube", json={"scrambled_cube": cube, "engine": "two_phase"})
+        assert resp.status_code == 503
+        assert resp.json()["detail"]["reason"] == "queue_full"
+        assert int(resp.headers["Retry-After"]) >= 1
+        resp = client.post("/solve_cube/batch", json={"scrambled_cubes": [cube]})
+        assert resp.status_code == 503
+
+
+def test_oversized_batch_gets_413():
+    with mock.patch.object(main, "MAX_BATCH", 2):
+        resp = TestClient(main.app).post("/solve_cube/batch", json={"scrambled_cubes": [[]] * 3})
+        assert resp.status_code == 413
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
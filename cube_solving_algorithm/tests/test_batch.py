@@ -0,0 +1,68 @@
+import json
+import os
+import sys
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Solve in threads, so importing main starts no worker processes.
+os.environ.setdefault("SOLVER_WORKERS", "0")
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from cubie import CubieCube
+from move_tables import apply_moves, from_standard
+from solution_cache import SolutionCache
+import main
+
+# The batch endpoint's NDJSON stream. Runs under pytest, or as
+# `python tests/test_batch.py`.
+
+COLORS = [5, 1, 6, 3, 2, 4]
+
+
+def stream(body):
+    # A fresh cache each time, so every cube is really solved.
+    with mock.patch.object(main, "cache", SolutionCache(0)):
+        resp = TestClient(main.app).post("/solve_cube/batch", json=body)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in resp.text.splitlines()]
+
+
+def solves(cube, moves):
+    state = apply_moves(np.asarray(cube).reshape(54), from_standard(moves))
+    return (state.reshape(6, 9) == state.reshape(6, 9)[:, 4:5]).all()
+
+
+def test_one_line_per_cube():
+    cubes = [CubieCube.random(seed).to_cube(COLORS) for seed in range(4)]
+    lines = stream({"scrambled_cubes": cubes, "engine": "two_phase", "compact": True})
+    assert sorted(line["index"] for line in lines) == list(range(len(cubes)))
+    for line in lines:
+        assert line["engine"] == "two_phase"
+        assert line["count"] == len(line["moves"])
+        assert line["compact"] == "".join(line["moves"])
+        assert solves(cubes[line["index"]], line["moves"])
+
+
+def test_bad_cube_does_not_stop_the_rest():
+    good = CubieCube.random(5).to_cube(COLORS)
+    bad = [[[1] * 3] * 3] * 6
+    lines = {line["index"]: line for line in stream({"scrambled_cubes": [good, bad, good], "engine": "two_phase"})}
+    assert sorted(lines) == [0, 1, 2]
+    assert lines[1]["reason"] == "colors"
+    assert "moves" not in lines[1]
+    assert solves(good, lines[0]["moves"])
+    assert solves(good, lines[2]["moves"])
+
+
+def test_empty_batch():
+    assert stream({"scrambled_cubes": []}) == []
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,73 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from cubie import CubieCube
+from validator import InvalidCubeError
+import cube_format
+
+# The facelet and packed wire formats. Runs under pytest, or as
+# `python tests/test_cube_format.py`.
+
+# cube_format.DEFAULT_COLORS in Cube.scrambled_cube slot order.
+COLORS = [5, 1, 6, 3, 2, 4]
+SOLVED = "U" * 9 + "R" * 9 + "F" * 9 + "D" * 9 + "L" * 9 + "B" * 9
+
+
+def reason(fn, *args):
+    try:
+        fn(*args)
+    except InvalidCubeError as exc:
+        return exc.reason
+    return None
+
+
+def test_solved_cube():
+    solved = CubieCube().to_cube(COLORS)
+    assert cube_format.to_facelets(solved) == SOLVED
+    assert cube_format.from_facelets(SOLVED) == solved
+
+
+def test_round_trips():
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        cube = CubieCube.random(rng).to_cube(COLORS)
+        facelets = cube_format.to_facelets(cube)
+        packed = cube_format.to_packed(cube)
+        assert len(facelets) == cube_format.FACELETS_LENGTH
+        assert len(packed) == cube_format.PACKED_LENGTH
+        assert cube_format.from_facelets(facelets) == cube
+        assert cube_format.from_packed(packed) == cube
+        assert cube_format.decode(facelets) == cube_format.decode(packed) == cube
+
+
+def test_other_colours():
+    colors = {"U": 0, "R": 1, "F": 2, "D": 3, "L": 4, "B": 5}
+    cube = cube_format.from_facelets(SOLVED, colors)
+    assert cube_format.to_facelets(cube) == SOLVED
+
+
+def test_lists_pass_through():
+    cube = CubieCube().to_cube(COLORS)
+    assert cube_format.decode(cube) is cube
+
+
+def test_bad_strings():
+    assert reason(cube_format.from_facelets, SOLVED[:-1]) == "format"
+    assert reason(cube_format.from_facelets, SOLVED[:-1] + "X") == "format"
+    assert reason(cube_format.from_packed, "!" * 28) == "format"
+    assert reason(cube_format.from_packed, "A" * 24) == "format"
+    # 0b111 in every sticker: a face value above 5.
+    assert reason(cube_format.from_packed, "/" * 28) == "format"
+    assert reason(cube_format.decode, "UUU") == "format"
+    assert reason(cube_format.decode, SOLVED, None, 2) == "format"
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,65 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from move_optimizer import optimize, quarter_turns
+from move_tables import MOVE_NAMES, sequence_perm
+
+# The move-sequence optimizer. Runs under pytest, or as
+# `python tests/test_move_optimizer.py`.
+
+
+def shortened(moves):
+    return optimize(moves.split()).moves
+
+
+def test_merges_turns_of_one_face():
+    assert shortened("U U") == ["U2"]
+    assert shortened("U U U") == ["U'"]
+    assert shortened("U2 U") == ["U'"]
+
+
+def test_drops_turns_that_cancel():
+    assert shortened("R R'") == []
+    assert shortened("U2 U2") == []
+    assert shortened("F R R' F'") == []
+
+
+def test_merges_across_the_opposite_face():
+    assert shortened("U D U") == ["U2", "D"]
+    assert shortened("R L R'") == ["L"]
+
+
+def test_leaves_other_faces_alone():
+    assert shortened("U R U") == ["U", "R", "U"]
+    assert shortened("U D F U") == ["U", "D", "F", "U"]
+
+
+def test_counts():
+    result = optimize("U U R R'".split())
+    assert (result.before, result.after) == (4, 1)
+
+
+def test_random_sequences_keep_their_effect():
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        moves = [MOVE_NAMES[m] for m in rng.integers(0, len(MOVE_NAMES), 40)]
+        result = optimize(moves)
+        assert (sequence_perm(result.moves) == sequence_perm(moves)).all()
+        assert result.after <= result.before
+        # Nothing left to merge.
+        assert optimize(result.moves).moves == result.moves
+
+
+def test_quarter_turns():
+    assert quarter_turns(["U2", "R'", "F"]) == ["U", "U", "R'", "F"]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
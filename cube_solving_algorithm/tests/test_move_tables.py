@@ -0,0 +1,61 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from move_tables import (
+    IDENTITY,
+    INVERSE_MOVE,
+    MOVE_NAMES,
+    MOVE_PERMS,
+    N_MOVES,
+    SOLVED_STATE,
+    apply_moves,
+    from_standard,
+    sequence_perm,
+    to_standard,
+    verify_against_helper,
+)
+
+# The precomputed move permutations. Runs under pytest, or as
+# `python tests/test_move_tables.py`.
+
+
+def test_tables_match_helper():
+    assert verify_against_helper() == []
+
+
+def test_moves_are_permutations():
+    for perm in MOVE_PERMS:
+        assert sorted(perm.tolist()) == list(range(54))
+
+
+def test_inverse_undoes_each_move():
+    for m in range(N_MOVES):
+        assert (apply_moves(SOLVED_STATE, [m, INVERSE_MOVE[m]]) == SOLVED_STATE).all()
+
+
+def test_quarter_turn_has_order_four():
+    for face in "URFDLB":
+        assert (sequence_perm([face] * 4) == IDENTITY).all()
+        assert (sequence_perm([face, face]) == sequence_perm([face + "2"])).all()
+
+
+def test_sequence_perm_matches_apply_moves():
+    rng = np.random.default_rng(0)
+    moves = rng.integers(0, N_MOVES, 30).tolist()
+    assert (SOLVED_STATE[sequence_perm(moves)] == apply_moves(SOLVED_STATE, moves)).all()
+
+
+def test_standard_notation_round_trip():
+    assert to_standard(["L", "D'", "B2", "R"]) == ["L'", "D", "B2", "R"]
+    assert from_standard(to_standard(MOVE_NAMES)) == MOVE_NAMES
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,147 @@
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cubie import CubieCube
+from engines import SolveGaveUp
+from portfolio import Portfolio
+from solver import Solution
+
+# The engine portfolio, raced on a fake pool. Runs under pytest, or as
+# `python tests/test_portfolio.py`.
+
+COLORS = [5, 1, 6, 3, 2, 4]
+CUBE = CubieCube.random(3).to_cube(COLORS)
+
+
+class FakePool:
+    # Each engine answers after `delay` seconds with `answer`: a number of
+    # moves, or an exception to raise. Cancelling the token makes the
+    # engines still running give up, as in the real pool.
+    def __init__(self, **answers):
+        self.answers = answers
+        self.asked = []
+        self.cancelled = []
+        self.released = []
+
+    def take_token(self):
+        return 3
+
+    def cancel(self, token):
+        self.cancelled.append(token)
+
+    def release_token(self, token):
+        self.released.append(token)
+
+    async def solve(self, scrambled_cube, engine=None, size=3, token=None, timeout=None):
+        self.asked.append(engine)
+        delay, answer = self.answers[engine]
+        stop = time.monotonic() + delay
+        while time.monotonic() < stop:
+            if token in self.cancelled:
+                raise SolveGaveUp(engine, "cancelled")
+            await asyncio.sleep(0.005)
+        if isinstance(answer, Exception):
+            raise answer
+        return Solution(("R",) * answer, engine, size)
+
+
+def race(pool, **kwargs):
+    async def run():
+        result = await Portfolio(pool).race(CUBE, **kwargs)
+        # Let the token go back once the losers are done.
+        await asyncio.sleep(0.1)
+        return result
+
+    return asyncio.run(run())
+
+
+def test_waits_for_better_ranked_engines():
+    # Layer and two-phase answer first, but bidirectional ranks above both.
+    pool = FakePool(bidirectional=(0.05, 12), two_phase=(0.02, 20), layer=(0.0, 90))
+    result = race(pool)
+    assert result.engine == "bidirectional"
+    assert len(result.moves) == 12
+
+
+def test_best_ranked_acceptable_answer_ends_the_race():
+    pool = FakePool(bidirectional=(0.0, 10), two_phase=(5, 20), layer=(5, 90))
+    started = time.monotonic()
+    result = race(pool)
+    assert time.monotonic() - started < 1
+    assert result.engine == "bidirectional"
+    # The losers were stopped and the token handed back.
+    assert pool.cancelled == [3]
+    assert pool.released == [3]
+
+
+def test_failing_engine_loses():
+    pool = FakePool(
+        bidirectional=(0.0, SolveGaveUp("bidirectional", "move_budget")),
+        two_phase=(0.0, RuntimeError("worker died")),
+        layer=(0.01, 90),
+    )
+    assert race(pool).engine == "layer"
+
+
+def test_all_giving_up_raises():
+    pool = FakePool(**{name: (0.0, SolveGaveUp(name, "deadline")) for name in ("bidirectional", "two_phase", "layer")})
+    try:
+        race(pool)
+        raise AssertionError("no engine solved the cube")
+    except SolveGaveUp as exc:
+        assert exc.engine == "portfolio"
+        assert exc.reason == "all_gave_up"
+
+
+def test_deadline_takes_the_shortest_in_by_then():
+    pool = FakePool(bidirectional=(5, 8), two_phase=(0.02, 20), layer=(0.0, 90))
+    result = race(pool, deadline=time.monotonic() + 0.2)
+    assert result.engine == "two_phase"
+    pool = FakePool(bidirectional=(5, 8), two_phase=(5, 20), layer=(5, 90))
+    try:
+        race(pool, deadline=time.monotonic() + 0.05)
+        raise AssertionError("answered with nothing in")
+    except SolveGaveUp as exc:
+        assert exc.reason == "deadline"
+
+
+def test_layer_sits_out_other_colourings():
+    pool = FakePool(bidirectional=(0.0, 10), two_phase=(0.0, 20), layer=(0.0, 90))
+    portfolio = Portfolio(pool)
+    assert "layer" in portfolio.engines_for(CUBE)
+    odd = CubieCube.random(3).to_cube([10, 11, 12, 13, 14, 15])
+    assert portfolio.engines_for(odd) == ["bidirectional", "two_phase"]
+    asyncio.run(portfolio.race(odd))
+    assert "layer" not in pool.asked
+
+
+def test_worker_calls_go_in_busy():
+    pool = FakePool(bidirectional=(0.0, 10), two_phase=(0.0, 20), layer=(0.0, 90))
+    busy = []
+    race(pool, busy=busy)
+    assert len(busy) == 3
+    assert all(task.done() for task in busy)
+
+
+def test_wins_are_counted():
+    pool = FakePool(bidirectional=(0.0, 10), two_phase=(0.0, 20), layer=(0.0, 90))
+    portfolio = Portfolio(pool)
+
+    async def run():
+        for _ in range(2):
+            await portfolio.race(CUBE)
+
+    asyncio.run(run())
+    assert portfolio.stats()["wins"] == {"bidirectional": 2}
+    assert portfolio.win_rates()["bidirectional"] == 1.0
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
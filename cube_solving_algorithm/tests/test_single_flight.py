@@ -0,0 +1,141 @@
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from move_tables import apply_moves
+from single_flight import SingleFlight
+import symmetry
+
+# Coalescing of identical in-flight solves. Runs under pytest, or as
+# `python tests/test_single_flight.py`.
+
+COLORS = [5, 1, 6, 3, 2, 4]
+SCRAMBLE = "R U F' L2 D B'"
+SOLUTION = ["B", "D'", "L2", "F", "U'", "R'"]
+
+
+def scrambled():
+    return apply_moves(np.repeat(COLORS, 9), SCRAMBLE)
+
+
+def solves(cube, moves):
+    state = apply_moves(np.asarray(cube).reshape(54), moves)
+    return all(len(set(face)) == 1 for face in state.reshape(6, 9).tolist())
+
+
+class Solve:
+    # A solve that takes `delay` seconds and counts how often it ran.
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = 0
+        self.cancelled = False
+
+    async def __call__(self):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return SOLUTION, "two_phase"
+
+
+def test_identical_requests_share_one_solve():
+    async def run():
+        flights, solve = SingleFlight(), Solve()
+        cubes = [scrambled()] * 3 + [scrambled()[perm] for perm in symmetry.SYMMETRY_PERMS[1:4]]
+        results = await asyncio.gather(*(flights.run(cube, "two_phase", solve) for cube in cubes))
+        assert solve.calls == 1
+        assert flights.stats()["solves"] == 1 and flights.stats()["coalesced"] == 5
+        for cube, (moves, engine) in zip(cubes, results):
+            assert engine == "two_phase"
+            assert solves(cube, moves)
+        assert flights.stats()["in_flight"] == 0
+
+    asyncio.run(run())
+
+
+def test_other_engines_and_later_requests_solve_again():
+    async def run():
+        flights, solve = SingleFlight(), Solve(0)
+        await asyncio.gather(flights.run(scrambled(), "two_phase", solve), flights.run(scrambled(), "layer", solve))
+        await flights.run(scrambled(), "two_phase", solve)
+        assert solve.calls == 3
+
+    asyncio.run(run())
+
+
+def test_one_waiter_leaving_does_not_cancel_the_others():
+    async def run():
+        flights, solve = SingleFlight(), Solve()
+        first = asyncio.ensure_future(flights.run(scrambled(), "two_phase", solve))
+        second = asyncio.ensure_future(flights.run(scrambled(), "two_phase", solve))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        moves, _ = await second
+        assert solves(scrambled(), moves)
+        assert not solve.cancelled
+
+    asyncio.run(run())
+
+
+def test_solve_is_cancelled_once_every_waiter_has_gone():
+    async def run():
+        flights, solve = SingleFlight(), Solve()
+        tasks = [asyncio.ensure_future(flights.run(scrambled(), "two_phase", solve)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        for task in tasks:
+            task.cancel()
+        await asyncio.sleep(0.01)
+        assert solve.cancelled
+        assert flights.stats()["in_flight"] == 0
+
+    asyncio.run(run())
+
+
+def test_follower_stops_at_its_own_deadline():
+    async def run():
+        flights, solve = SingleFlight(), Solve(0.2)
+        # Both deadlines in the same bucket, the follower's a little earlier.
+        lead = time.monotonic() + 0.15
+        lead = (int(lead * 10) + 1) / 10 - 0.001
+        leader = asyncio.ensure_future(flights.run(scrambled(), "two_phase", solve, lead))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flights.run(scrambled(), "two_phase", solve, lead - 0.05))
+        try:
+            await follower
+            raise AssertionError("the follower waited past its deadline")
+        except asyncio.TimeoutError:
+            pass
+        assert not leader.done()
+        await leader
+        assert solve.calls == 1
+        assert flights.stats()["timed_out"] == 1
+
+    asyncio.run(run())
+
+
+def test_different_deadlines_do_not_share():
+    async def run():
+        flights, solve = SingleFlight(), Solve(0.01)
+        now = time.monotonic()
+        await asyncio.gather(
+            flights.run(scrambled(), "two_phase", solve, now + 1),
+            flights.run(scrambled(), "two_phase", solve, now + 5),
+            flights.run(scrambled(), "two_phase", solve),
+        )
+        assert solve.calls == 3
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
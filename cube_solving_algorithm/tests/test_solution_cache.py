@@ -0,0 +1,96 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from move_tables import apply_moves
+from solution_cache import SolutionCache
+import symmetry
+
+# The symmetry-aware solution cache. Runs under pytest, or as
+# `python tests/test_solution_cache.py`.
+
+COLORS = [5, 1, 6, 3, 2, 4]
+SCRAMBLE = "R U F' L2 D B'"
+# Undoes SCRAMBLE.
+SOLUTION = ["B", "D'", "L2", "F", "U'", "R'"]
+
+
+def scrambled():
+    return apply_moves(np.repeat(COLORS, 9), SCRAMBLE)
+
+
+def solves(cube, moves):
+    state = apply_moves(np.asarray(cube).reshape(54), moves)
+    return all(len(set(face)) == 1 for face in state.reshape(6, 9).tolist())
+
+
+def test_hit_returns_the_moves_and_engine():
+    cache = SolutionCache()
+    cube = scrambled()
+    assert solves(cube, SOLUTION)
+    assert cache.get(cube, "two_phase") is None
+    cache.put(cube, "two_phase", SOLUTION)
+    moves, engine = cache.get(cube, "two_phase")
+    assert engine == "two_phase"
+    assert solves(cube, moves)
+    assert cache.get(cube, "layer") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+
+def test_every_symmetric_copy_shares_the_entry():
+    cache = SolutionCache()
+    cache.put(scrambled(), "two_phase", SOLUTION)
+    for perm in symmetry.SYMMETRY_PERMS:
+        copy = scrambled()[perm]
+        moves, _ = cache.get(copy, "two_phase")
+        assert solves(copy, moves)
+
+
+def test_recoloured_copy_shares_the_entry():
+    cache = SolutionCache()
+    cache.put(scrambled(), "two_phase", SOLUTION)
+    recolour = {c: n for c, n in zip(COLORS, [10, 11, 12, 13, 14, 15])}
+    copy = np.array([recolour[int(c)] for c in scrambled()])
+    moves, _ = cache.get(copy, "two_phase")
+    assert solves(copy, moves)
+
+
+def test_solved_by_is_kept():
+    cache = SolutionCache()
+    cache.put(scrambled(), "portfolio", SOLUTION, "bidirectional")
+    assert cache.get(scrambled(), "portfolio")[1] == "bidirectional"
+
+
+def test_lru_eviction():
+    cache = SolutionCache(maxsize=2)
+    cubes = [apply_moves(np.repeat(COLORS, 9), moves) for moves in ("R", "R U", "R U F")]
+    for cube in cubes:
+        cache.put(cube, "layer", [])
+    assert cache.get(cubes[0], "layer") is None
+    assert cache.get(cubes[2], "layer") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry():
+    cache = SolutionCache(ttl=0.01)
+    cache.put(scrambled(), "layer", SOLUTION)
+    time.sleep(0.02)
+    assert cache.get(scrambled(), "layer") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_disabled():
+    cache = SolutionCache(maxsize=0)
+    cache.put(scrambled(), "layer", SOLUTION)
+    assert cache.get(scrambled(), "layer") is None
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
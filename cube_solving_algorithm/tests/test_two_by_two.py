@@ -0,0 +1,79 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from cubie import CubieCube
+from move_tables import apply_moves
+from validator import InvalidCubeError
+import two_by_two
+
+# The optimal 2x2 solver. Runs under pytest, or as
+# `python tests/test_two_by_two.py`. Its table is built on the first run,
+# which takes a few seconds.
+
+COLORS = [5, 1, 6, 3, 2, 4]
+
+
+def corners_of(stickers):
+    # The 2x2 made of a 3x3's corner stickers.
+    faces = np.asarray(stickers).reshape(6, 3, 3).tolist()
+    return [[[face[r][0], face[r][2]] for r in (0, 2)] for face in faces]
+
+
+def corners_solved(stickers):
+    return all(len({c for row in face for c in row}) == 1 for face in corners_of(stickers))
+
+
+def reason(scrambled_cube):
+    try:
+        two_by_two.validate(scrambled_cube)
+    except InvalidCubeError as exc:
+        return exc.reason
+    return None
+
+
+def test_solved_cube_needs_no_moves():
+    assert two_by_two.TwoByTwoSolver().solve(corners_of(np.repeat(COLORS, 9))) == []
+
+
+def test_random_cubes_within_11_moves():
+    solver = two_by_two.TwoByTwoSolver()
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        stickers = np.asarray(CubieCube.random(rng).to_cube(COLORS)).reshape(54)
+        moves = solver.solve(corners_of(stickers))
+        assert len(moves) <= 11
+        assert set(m[0] for m in moves) <= set("URF")
+        assert corners_solved(apply_moves(stickers, moves))
+
+
+def test_short_scrambles_get_shortest_solutions():
+    solver = two_by_two.TwoByTwoSolver()
+    for scramble, length in (("R", 1), ("R U", 2), ("R U F'", 3), ("R U R' U'", 4), ("L", 1), ("U D'", 1)):
+        stickers = apply_moves(np.repeat(COLORS, 9), scramble)
+        moves = solver.solve(corners_of(stickers))
+        assert len(moves) == length, (scramble, moves)
+        assert corners_solved(apply_moves(stickers, moves))
+
+
+def test_validation():
+    solved = corners_of(np.repeat(COLORS, 9))
+    assert reason(solved) is None
+    assert reason([[1, 2]]) == "shape"
+    bad = [[row[:] for row in face] for face in solved]
+    bad[0][0][0] = 9
+    assert reason(bad) == "colors"
+    co = [1, 2, 0, 0, 0, 0, 0, 0]
+    assert reason(corners_of(CubieCube(co=co).to_cube(COLORS))) is None
+    co[1] = 0
+    assert reason(corners_of(CubieCube(co=co).to_cube(COLORS))) == "twist"
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
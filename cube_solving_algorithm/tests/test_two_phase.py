@@ -0,0 +1,53 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from cubie import CubieCube
+from move_tables import apply_moves
+import engines
+import two_phase
+
+# Two-phase solves random cubes in at most 22 moves. Runs under pytest, or
+# as `python tests/test_two_phase.py`. The tables are built on the first
+# run, which takes a few seconds.
+
+COLORS = [5, 1, 6, 3, 2, 4]
+SEED = 2024
+SCRAMBLES = 5
+
+
+def is_solved(stickers):
+    return all(len(set(face)) == 1 for face in stickers.reshape(6, 9).tolist())
+
+
+def test_within_22_moves():
+    two_phase.get_tables()
+    rng = np.random.default_rng(SEED)
+    for _ in range(SCRAMBLES):
+        cube = CubieCube.random(rng).to_cube(COLORS)
+        result = engines.solve_state(cube, "two_phase")
+        assert result.engine == "two_phase"
+        assert len(result.moves) <= 22
+        assert is_solved(apply_moves(np.asarray(cube).reshape(54), result.moves))
+
+
+def test_solved_cube_needs_no_moves():
+    assert two_phase.TwoPhaseSolver().solve(CubieCube().to_cube(COLORS)) == []
+
+
+def test_max_length_too_short():
+    # R U F is three moves from solved, so nothing of two moves or fewer exists.
+    scrambled = apply_moves(np.repeat(COLORS, 9), "R U F").reshape(6, 3, 3).tolist()
+    solver = two_phase.TwoPhaseSolver()
+    assert solver.solve(scrambled, max_length=2) is None
+    assert len(solver.solve(scrambled, max_length=3)) == 3
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,95 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cubie import CubieCube
+from engines import LAYER_COLOR_PAIRS
+from validator import InvalidCubeError, validate_cube
+
+# Hand-built cubes that cannot be solved, each of which should be turned
+# away with its own reason. Runs under pytest, or as `python tests/test_validator.py`.
+
+# Back, Top, Front, Bottom, Left, Right, as in the README set-up.
+COLORS = [5, 1, 6, 3, 2, 4]
+
+
+def reason(scrambled_cube, color_pairs=None):
+    try:
+        validate_cube(scrambled_cube, color_pairs)
+    except InvalidCubeError as exc:
+        return exc.reason
+    return None
+
+
+def solved():
+    return CubieCube().to_cube(COLORS)
+
+
+def test_solved_cube_is_valid():
+    assert reason(solved(), LAYER_COLOR_PAIRS) is None
+    assert reason(CubieCube.random(0).to_cube(COLORS)) is None
+
+
+def test_shape():
+    assert reason([[1, 2, 3]]) == "shape"
+    assert reason("not a cube") == "shape"
+
+
+def test_colors():
+    cube = solved()
+    cube[0][0][0] = 7
+    assert reason(cube) == "colors"
+
+
+def test_colors_out_of_range():
+    assert reason(CubieCube().to_cube([-1, 1, 6, 3, 2, 4])) == "colors"
+    assert reason(CubieCube().to_cube([500, 1, 6, 3, 2, 4])) == "colors"
+    assert reason(CubieCube().to_cube([0, 1, 6, 3, 2, 255])) is None
+
+
+def test_centers():
+    # Swapping a centre with a sticker of another face keeps the counts
+    # but leaves two centres the same colour.
+    cube = solved()
+    cube[0][1][1], cube[1][0][0] = cube[1][0][0], cube[0][1][1]
+    assert reason(cube) == "centers"
+
+
+def test_scheme():
+    # Face numbers 0..5 instead of the colours the layer method knows.
+    assert reason(CubieCube().to_cube()) is None
+    assert reason(CubieCube().to_cube(), LAYER_COLOR_PAIRS) == "scheme"
+
+
+def test_pieces():
+    # A Top corner sticker swapped with a Bottom edge sticker: the counts
+    # still add up, but neither piece exists.
+    cube = solved()
+    cube[1][0][0], cube[3][0][1] = cube[3][0][1], cube[1][0][0]
+    assert reason(cube) == "pieces"
+
+
+def test_twist():
+    co = [0] * 8
+    co[0] = 1
+    assert reason(CubieCube(co=co).to_cube(COLORS)) == "twist"
+
+
+def test_flip():
+    eo = [0] * 12
+    eo[0] = 1
+    assert reason(CubieCube(eo=eo).to_cube(COLORS)) == "flip"
+
+
+def test_parity():
+    cp = list(range(8))
+    cp[0], cp[1] = cp[1], cp[0]
+    assert reason(CubieCube(cp=cp).to_cube(COLORS)) == "parity"
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
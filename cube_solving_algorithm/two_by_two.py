@@ -0,0 +1,160 @@
+import itertools
+
+import numpy as np
+
+from cubie import CORNER_COLORS, CORNER_FACELETS, CORNERS, FACE_SLOT, CubieCube
+from move_tables import FACES, MOVE_NAMES
+from table_store import LazyTables
+from two_phase import pruning_table
+from validator import InvalidCubeError
+
+# Optimal solver for the 2x2x2 cube. Holding the DBL corner still, every
+# position is a permutation of the other seven corners plus their twists:
+# 7! * 3^6 = 3,674,160 states, reached with U, R and F turns alone. One BFS
+# stores every state's distance mod 3 in 2 bits (under 1 MB); that is enough
+# to walk a shortest path (at most 11 moves) back to solved, since every
+# move changes the distance by exactly -1, 0 or +1.
+#
+# A 2x2 cube comes as 6x2x2 lists laid out like the 3x3 Cube.scrambled_cube
+# (Back, Top, Front, Bottom, Left, Right; Back seen the same way), and turns
+# have the same names and directions.
+N_PERM = 5040
+N_TWIST = 729
+N_STATES = N_PERM * N_TWIST
+MOVES = list(range(9))  # U, U2, U', R, ..., F' in move_tables order
+
+_FIXED = CORNERS.index("DBL")
+_FREE = [i for i in range(8) if i != _FIXED]
+_PERMS = list(itertools.permutations(range(7)))
+_PERM_INDEX = {p: i for i, p in enumerate(_PERMS)}
+# Sticker index on the 2x2 of every 3x3 corner sticker.
+_STICKER = {f * 9 + 3 * r + c: f * 4 + r + c // 2 for f in range(6) for r in (0, 2) for c in (0, 2)}
+_FACE_OF_SLOT = [FACES.index(face) for face, _ in sorted(FACE_SLOT.items(), key=lambda item: item[1])]
+
+
+def _free_perm(cp):
+    # cp over all eight corners (DBL in place) -> index of the other seven.
+    return _PERM_INDEX[tuple(_FREE.index(cp[i]) for i in _FREE)]
+
+
+def _twist(co):
+    twist = 0
+    for i in _FREE[:6]:
+        twist = 3 * twist + co[i]
+    return twist
+
+
+def _set_twist(twist):
+    co = [0] * 8
+    for i in reversed(_FREE[:6]):
+        co[i] = twist % 3
+        twist //= 3
+    co[_FREE[6]] = -sum(co) % 3
+    return co
+
+
+def build_tables():
+    perm_move = np.empty((N_PERM, len(MOVES)), dtype=np.int16)
+    twist_move = np.empty((N_TWIST, len(MOVES)), dtype=np.int16)
+    for p, perm in enumerate(_PERMS):
+        cp = [_FIXED] * 8
+        for i, k in zip(_FREE, perm):
+            cp[i] = _FREE[k]
+        for m in MOVES:
+            perm_move[p, m] = _free_perm(CubieCube(cp=cp).apply_move(m).cp)
+    for t in range(N_TWIST):
+        cube = CubieCube(co=_set_twist(t))
+        for m in MOVES:
+            twist_move[t, m] = _twist(cube.apply_move(m).co)
+    # Distances mod 3, four states to a byte.
+    dist = pruning_table(perm_move, twist_move, MOVES).astype(np.uint8) % 3
+    dist = np.concatenate([dist, np.zeros(-len(dist) % 4, dtype=np.uint8)]).reshape(-1, 4)
+    packed = dist[:, 0] | dist[:, 1] << 2 | dist[:, 2] << 4 | dist[:, 3] << 6
+    return {"perm_move": perm_move, "twist_move": twist_move, "distance_mod3": packed}
+
+
+# Bump the version whenever build_tables() changes its output.
+TABLES = LazyTables("two_by_two", "two_by_two-1", build_tables)
+
+
+def get_tables(block=True):
+    return TABLES.get(block=block)
+
+
+def to_cubie(scrambled_cube):
+    # Reads a 6x2x2 cube into a CubieCube with DBL solved, naming each colour
+    # after the face it belongs on. Raises InvalidCubeError if no sequence of
+    # turns can solve it.
+    stickers = np.asarray(scrambled_cube)
+    if stickers.shape != (6, 2, 2) and stickers.shape != (24,):
+        raise InvalidCubeError("shape", f"expected a 6x2x2 cube, got shape {stickers.shape}")
+    if not np.issubdtype(stickers.dtype, np.integer):
+        raise InvalidCubeError("shape", "sticker colours must be integers")
+    stickers = stickers.reshape(24).tolist()
+    counts = {c: stickers.count(c) for c in set(stickers)}
+    if len(counts) != 6 or any(n != 4 for n in counts.values()):
+        raise InvalidCubeError("colors", f"expected six colours with 4 stickers each, got {counts}")
+
+    corners = [[stickers[_STICKER[s]] for s in facelets] for facelets in CORNER_FACELETS]
+    # DBL names three colours outright; each of the others is the third
+    # colour of the one other corner sharing two of them.
+    face_of = {color: face for color, face in zip(corners[_FIXED], CORNER_COLORS[_FIXED])}
+    if len(face_of) != 3:
+        raise InvalidCubeError("pieces", "the DBL corner has a repeated colour")
+    D, B, L = (FACES.index(f) for f in "DBL")
+    color_of = {face: color for color, face in face_of.items()}
+    for pair, face in (((D, L), "F"), ((D, B), "R"), ((L, B), "U")):
+        want = {color_of[pair[0]], color_of[pair[1]]}
+        others = [c for i, c in enumerate(corners) if i != _FIXED and want <= set(c)]
+        if len(others) != 1 or len(set(others[0]) - want) != 1:
+            raise InvalidCubeError("pieces", "the corners do not fit together")
+        face_of[(set(others[0]) - want).pop()] = FACES.index(face)
+    if len(face_of) != 6:
+        raise InvalidCubeError("pieces", "the corners do not fit together")
+
+    facelets = np.array([_FACE_OF_SLOT[i // 9] for i in range(54)], dtype=np.intp)
+    for big, small in _STICKER.items():
+        facelets[big] = face_of[stickers[small]]
+    try:
+        cube = CubieCube.from_facelets(facelets)
+    except ValueError as exc:
+        raise InvalidCubeError("pieces", str(exc)) from None
+    if len(set(cube.cp)) != 8:
+        raise InvalidCubeError("pieces", "a corner piece appears twice")
+    if sum(cube.co) % 3:
+        raise InvalidCubeError("twist", "a corner is twisted in place")
+    return cube
+
+
+def validate(scrambled_cube):
+    to_cubie(scrambled_cube)
+
+
+class TwoByTwoSolver:
+    def __init__(self, tables=None):
+        tables = get_tables() if tables is None else tables
+        self.perm_move = memoryview(np.ascontiguousarray(tables["perm_move"]).reshape(-1))
+        self.twist_move = memoryview(np.ascontiguousarray(tables["twist_move"]).reshape(-1))
+        self.distance_mod3 = memoryview(np.ascontiguousarray(tables["distance_mod3"]))
+
+    def _distance_mod3(self, perm, twist):
+        state = perm * N_TWIST + twist
+        return self.distance_mod3[state >> 2] >> ((state & 3) << 1) & 3
+
+    def solve(self, scrambled_cube):
+        # Returns a shortest solution as move names.
+        cube = to_cubie(scrambled_cube)
+        perm, twist = _free_perm(cube.cp), _twist(cube.co)
+        n = len(MOVES)
+        moves = []
+        dist = self._distance_mod3(perm, twist)
+        while perm or twist:
+            want = (dist - 1) % 3
+            for m in MOVES:
+                p = self.perm_move[perm * n + m]
+                t = self.twist_move[twist * n + m]
+                if self._distance_mod3(p, t) == want:
+                    break
+            moves.append(MOVE_NAMES[m])
+            perm, twist, dist = p, t, want
+        return moves
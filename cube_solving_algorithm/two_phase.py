@@ -0,0 +1,283 @@
+import itertools
+import time
+from math import comb
+
+import numpy as np
+
+from cubie import MOVE_CUBES, N_CORNERS, N_FLIP, N_SLICE, N_SLICE_SORTED, N_TWIST, CubieCube
+from move_tables import MOVE_INDEX, MOVE_NAMES, N_MOVES
+from table_store import LazyTables
+
+# Kociemba's two-phase algorithm. Phase 1 brings the cube into the subgroup
+# G1 = <U, D, R2, L2, F2, B2> (all corners and edges oriented, the middle
+# slice edges in the middle slice); phase 2 solves it inside G1. Both phases
+# are IDA* searches over integer coordinates with pruning tables built by BFS.
+# The search is pure Python: with warm tables a random cube takes about
+# 0.1 s on average (median 70 ms, worst seen about 0.5 s).
+N_PERM_8 = N_CORNERS
+N_SLICE_PERM = 24
+
+PHASE2_MOVES = [MOVE_INDEX[m] for m in ("U", "U2", "U'", "D", "D2", "D'", "R2", "F2", "L2", "B2")]
+
+_MOVE_CP = np.array([c.cp for c in MOVE_CUBES], dtype=np.intp)
+_MOVE_CO = np.array([c.co for c in MOVE_CUBES], dtype=np.int8)
+_MOVE_EP = np.array([c.ep for c in MOVE_CUBES], dtype=np.intp)
+_MOVE_EO = np.array([c.eo for c in MOVE_CUBES], dtype=np.int8)
+
+
+def _rank_rows(perms):
+    # Vectorised CubieCube._perm_rank over the rows of an (N, n) array.
+    rank = np.zeros(len(perms), dtype=np.int64)
+    for j in range(perms.shape[1] - 1, 0, -1):
+        rank = (j + 1) * rank + (perms[:, :j] > perms[:, j : j + 1]).sum(axis=1)
+    return rank
+
+
+def _digits(values, base, width):
+    out = np.empty((len(values), width), dtype=np.int8)
+    for i in range(width - 1, -1, -1):
+        out[:, i] = values % base
+        values = values // base
+    return out
+
+
+def _undigits(digits, base):
+    value = np.zeros(len(digits), dtype=np.int64)
+    for i in range(digits.shape[1]):
+        value = base * value + digits[:, i]
+    return value
+
+
+def _twist_move_table():
+    co = np.zeros((N_TWIST, 8), dtype=np.int8)
+    co[:, :7] = _digits(np.arange(N_TWIST), 3, 7)
+    co[:, 7] = (-co[:, :7].sum(axis=1)) % 3
+    table = np.empty((N_TWIST, N_MOVES), dtype=np.int16)
+    for m in range(N_MOVES):
+        table[:, m] = _undigits((co[:, _MOVE_CP[m]] + _MOVE_CO[m])[:, :7] % 3, 3)
+    return table
+
+
+def _flip_move_table():
+    eo = np.zeros((N_FLIP, 12), dtype=np.int8)
+    eo[:, :11] = _digits(np.arange(N_FLIP), 2, 11)
+    eo[:, 11] = eo[:, :11].sum(axis=1) % 2
+    table = np.empty((N_FLIP, N_MOVES), dtype=np.int16)
+    for m in range(N_MOVES):
+        table[:, m] = _undigits((eo[:, _MOVE_EP[m]] + _MOVE_EO[m])[:, :11] % 2, 2)
+    return table
+
+
+def _slice_sorted_rows(ep):
+    # Vectorised CubieCube.slice_sorted over the rows of an (N, 12) array.
+    in_slice = ep >= 8
+    # x_j: number of slice edges to the right of position j.
+    right = np.cumsum(in_slice[:, ::-1], axis=1)[:, ::-1] - in_slice
+    binom = np.array([[comb(n, k) for k in range(5)] for n in range(12)], dtype=np.int64)
+    a = (in_slice * binom[11 - np.arange(12), np.minimum(right + 1, 4)]).sum(axis=1)
+    edge4 = ep[in_slice].reshape(-1, 4) - 8
+    return 24 * a + _rank_rows(edge4)
+
+
+def _slice_sorted_move_table():
+    ep = np.empty((N_SLICE_SORTED, 12), dtype=np.intp)
+    row = 0
+    for positions in itertools.combinations(range(12), 4):
+        others = [p for p in range(12) if p not in positions]
+        for order in itertools.permutations(range(8, 12)):
+            ep[row, others] = range(8)
+            ep[row, list(positions)] = order
+            row += 1
+    ep = ep[np.argsort(_slice_sorted_rows(ep))]
+    table = np.empty((N_SLICE_SORTED, N_MOVES), dtype=np.int16)
+    for m in range(N_MOVES):
+        table[:, m] = _slice_sorted_rows(ep[:, _MOVE_EP[m]])
+    return table
+
+
+def _perm8_move_table(move_perms, moves):
+    perms = np.array(list(itertools.permutations(range(8))), dtype=np.intp)
+    perms = perms[np.argsort(_rank_rows(perms))]
+    table = np.full((N_PERM_8, N_MOVES), -1, dtype=np.int32)
+    for m in moves:
+        table[:, m] = _rank_rows(perms[:, move_perms[m]])
+    return table
+
+
+def pruning_table(move_a, move_b, moves):
+    # BFS from the solved state (0, 0) over the product of two coordinates;
+    # entry a * len(move_b) + b is the exact distance in that projection.
+    size_b = len(move_b)
+    dist = np.full(len(move_a) * size_b, -1, dtype=np.int8)
+    dist[0] = 0
+    depth = 0
+    frontier = np.array([0], dtype=np.int64)
+    while len(frontier):
+        a, b = np.divmod(frontier, size_b)
+        found = []
+        for m in moves:
+            nxt = move_a[a, m].astype(np.int64) * size_b + move_b[b, m]
+            nxt = nxt[dist[nxt] < 0]
+            dist[nxt] = depth + 1
+            found.append(nxt)
+        frontier = np.unique(np.concatenate(found))
+        depth += 1
+    return dist
+
+
+def build_tables():
+    twist_move = _twist_move_table()
+    flip_move = _flip_move_table()
+    slice_sorted_move = _slice_sorted_move_table()
+    slice_move = slice_sorted_move[:: N_SLICE_PERM] // N_SLICE_PERM
+    corners_move = _perm8_move_table(_MOVE_CP, range(N_MOVES))
+    ud_edges_move = _perm8_move_table(_MOVE_EP[:, :8], PHASE2_MOVES)
+    slice_perm_move = slice_sorted_move[:N_SLICE_PERM]
+    return {
+        "twist_move": twist_move,
+        "flip_move": flip_move,
+        "slice_sorted_move": slice_sorted_move,
+        "corners_move": corners_move,
+        "ud_edges_move": ud_edges_move,
+        "twist_slice_prun": pruning_table(twist_move, slice_move, range(N_MOVES)),
+        "flip_slice_prun": pruning_table(flip_move, slice_move, range(N_MOVES)),
+        "corners_slice_prun": pruning_table(corners_move, slice_perm_move, PHASE2_MOVES),
+        "ud_edges_slice_prun": pruning_table(ud_edges_move, slice_perm_move, PHASE2_MOVES),
+    }
+
+
+# Bump the version whenever build_tables() changes its output.
+TABLES = LazyTables("two_phase", "two_phase-1", build_tables)
+
+
+def get_tables(block=True):
+    # With block=False this returns None while the tables are still being
+    # built in the background.
+    return TABLES.get(block=block)
+
+
+class TwoPhaseSolver:
+    def __init__(self, tables=None):
+        tables = get_tables() if tables is None else tables
+        # Flat memoryviews: indexing them yields plain ints, which keeps the
+        # inner search loops free of numpy scalar overhead.
+        flat = {name: memoryview(np.ascontiguousarray(arr).reshape(-1)) for name, arr in tables.items()}
+        self.twist_move = flat["twist_move"]
+        self.flip_move = flat["flip_move"]
+        self.slice_sorted_move = flat["slice_sorted_move"]
+        self.corners_move = flat["corners_move"]
+        self.ud_edges_move = flat["ud_edges_move"]
+        self.twist_slice_prun = flat["twist_slice_prun"]
+        self.flip_slice_prun = flat["flip_slice_prun"]
+        self.corners_slice_prun = flat["corners_slice_prun"]
+        self.ud_edges_slice_prun = flat["ud_edges_slice_prun"]
+
+    def solve(self, scrambled_cube, max_length=22, timeout=10.0, cancelled=None):
+        # Returns a list of move names, or None if no solution of at most
+        # max_length moves was found before the timeout. `cancelled`, if
+        # given, is polled along with the clock and stops the search early.
+        cube = CubieCube.from_cube(scrambled_cube)
+        moves = self.solve_cubie(cube, max_length, timeout, cancelled)
+        return None if moves is None else [MOVE_NAMES[m] for m in moves]
+
+    def solve_cubie(self, cube, max_length=22, timeout=10.0, cancelled=None):
+        self._cube = cube
+        self._deadline = time.perf_counter() + timeout
+        self._cancelled = cancelled
+        self._nodes = 0
+        self._path = []
+        self._solution = None
+        twist, flip, slice_sorted = cube.twist(), cube.flip(), cube.slice_sorted()
+        corners = cube.corners()
+        slc = slice_sorted // N_SLICE_PERM
+        h = max(
+            self.twist_slice_prun[twist * N_SLICE + slc],
+            self.flip_slice_prun[flip * N_SLICE + slc],
+        )
+        try:
+            for depth in range(h, max_length + 1):
+                self._max_length = max_length
+                if self._phase1(twist, flip, slice_sorted, corners, depth):
+                    return self._solution
+        except TimeoutError:
+            pass
+        return None
+
+    def _tick(self):
+        self._nodes += 1
+        if self._nodes & 1023 == 0:
+            if time.perf_counter() > self._deadline or (self._cancelled is not None and self._cancelled()):
+                raise TimeoutError
+
+    def _phase1(self, twist, flip, slice_sorted, corners, togo):
+        self._tick()
+        path = self._path
+        if togo == 0:
+            # A phase 1 path ending in a G1 move was already tried one depth up.
+            if path and path[-1] in PHASE2_MOVES:
+                return False
+            return self._start_phase2(corners, slice_sorted)
+        last = path[-1] // 3 if path else -1
+        for m in range(N_MOVES):
+            face = m // 3
+            # Skip turning the same face twice and order commuting opposite faces.
+            if face == last or face == last - 3:
+                continue
+            t = self.twist_move[twist * N_MOVES + m]
+            f = self.flip_move[flip * N_MOVES + m]
+            s = self.slice_sorted_move[slice_sorted * N_MOVES + m]
+            slc = s // N_SLICE_PERM
+            if (
+                self.twist_slice_prun[t * N_SLICE + slc] >= togo
+                or self.flip_slice_prun[f * N_SLICE + slc] >= togo
+            ):
+                continue
+            path.append(m)
+            if self._phase1(t, f, s, self.corners_move[corners * N_MOVES + m], togo - 1):
+                return True
+            path.pop()
+        return False
+
+    def _start_phase2(self, corners, slice_perm):
+        budget = self._max_length - len(self._path)
+        # Cheap bound first; rebuilding the edge permutation costs more.
+        if self.corners_slice_prun[corners * N_SLICE_PERM + slice_perm] > budget:
+            return False
+        ep = self._cube.ep
+        for m in self._path:
+            move_ep = MOVE_CUBES[m].ep
+            ep = [ep[move_ep[i]] for i in range(12)]
+        ud_edges = CubieCube(ep=ep).ud_edges()
+        h = max(
+            self.corners_slice_prun[corners * N_SLICE_PERM + slice_perm],
+            self.ud_edges_slice_prun[ud_edges * N_SLICE_PERM + slice_perm],
+        )
+        for depth in range(h, budget + 1):
+            if self._phase2(corners, ud_edges, slice_perm, depth):
+                self._solution = list(self._path)
+                return True
+        return False
+
+    def _phase2(self, corners, ud_edges, slice_perm, togo):
+        self._tick()
+        if togo == 0:
+            return corners == 0 and ud_edges == 0 and slice_perm == 0
+        path = self._path
+        last = path[-1] // 3 if path else -1
+        for m in PHASE2_MOVES:
+            face = m // 3
+            if face == last or face == last - 3:
+                continue
+            c = self.corners_move[corners * N_MOVES + m]
+            e = self.ud_edges_move[ud_edges * N_MOVES + m]
+            s = self.slice_sorted_move[slice_perm * N_MOVES + m]
+            if (
+                self.corners_slice_prun[c * N_SLICE_PERM + s] >= togo
+                or self.ud_edges_slice_prun[e * N_SLICE_PERM + s] >= togo
+            ):
+                continue
+            path.append(m)
+            if self._phase2(c, e, s, togo - 1):
+                return True
+            path.pop()
+        return False
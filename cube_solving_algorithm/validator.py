@@ -0,0 +1,77 @@
+import numpy as np
+
+from cubie import CORNERS, EDGES, CubieCube
+
+# Rejects cubes no sequence of moves can solve, before any solver sees them.
+# The layer method loops forever on those, so this has to be cheap: one pass
+# over the 54 stickers plus the cubie-level checks.
+
+# Face slots opposite each other in Cube.scrambled_cube: Back/Front,
+# Top/Bottom, Left/Right.
+OPPOSITE_SLOTS = [(0, 2), (1, 3), (4, 5)]
+
+
+class InvalidCubeError(ValueError):
+    # `reason` is one of "format" (an unreadable cube string), "shape",
+    # "colors", "centers", "scheme", "pieces", "twist", "flip" or "parity".
+    def __init__(self, reason, message):
+        super().__init__(message)
+        self.reason = reason
+
+    def __reduce__(self):
+        # Keeps the reason when the error crosses a process boundary.
+        return type(self), (self.reason, str(self))
+
+
+def validate_cube(scrambled_cube, color_pairs=None):
+    # Returns the cube as a CubieCube if it can be solved, else raises
+    # InvalidCubeError. `color_pairs` optionally pins the colour scheme:
+    # the colours that must sit on opposite centres, e.g. [(4, 2), ...].
+    try:
+        stickers = np.asarray(scrambled_cube)
+    except (TypeError, ValueError):
+        raise InvalidCubeError("shape", "the cube must be a 6x3x3 array of colours") from None
+    if stickers.shape != (6, 3, 3) and stickers.shape != (54,):
+        raise InvalidCubeError("shape", f"expected a 6x3x3 cube, got shape {stickers.shape}")
+    if not np.issubdtype(stickers.dtype, np.integer):
+        raise InvalidCubeError("shape", "sticker colours must be integers")
+    stickers = stickers.reshape(54)
+
+    colors, counts = np.unique(stickers, return_counts=True)
+    if len(colors) != 6 or (counts != 9).any():
+        found = ", ".join(f"{c}: {n}" for c, n in zip(colors.tolist(), counts.tolist()))
+        raise InvalidCubeError("colors", f"expected six colours with 9 stickers each, got {{{found}}}")
+    # CubieCube.from_cube looks colours up in a table of this size.
+    if colors[0] < 0 or colors[-1] > 255:
+        raise InvalidCubeError("colors", "sticker colours must be between 0 and 255")
+    centers = stickers[4::9]
+    if len(set(centers.tolist())) != 6:
+        raise InvalidCubeError("centers", "the six centre stickers must have different colours")
+    if color_pairs is not None:
+        pairs = {frozenset((int(centers[a]), int(centers[b]))) for a, b in OPPOSITE_SLOTS}
+        if pairs != {frozenset(p) for p in color_pairs}:
+            raise InvalidCubeError("scheme", f"opposite centres must be the colour pairs {list(color_pairs)}")
+
+    try:
+        cube = CubieCube.from_cube(stickers)
+    except ValueError as exc:
+        raise InvalidCubeError("pieces", str(exc)) from None
+    if len(set(cube.cp)) != len(CORNERS):
+        raise InvalidCubeError("pieces", "a corner piece appears twice")
+    if len(set(cube.ep)) != len(EDGES):
+        raise InvalidCubeError("pieces", "an edge piece appears twice")
+    if sum(cube.co) % 3:
+        raise InvalidCubeError("twist", "a corner is twisted in place")
+    if sum(cube.eo) % 2:
+        raise InvalidCubeError("flip", "an edge is flipped in place")
+    if cube.corner_parity() != cube.edge_parity():
+        raise InvalidCubeError("parity", "two pieces are swapped")
+    return cube
+
+
+def is_valid_cube(scrambled_cube, color_pairs=None):
+    try:
+        validate_cube(scrambled_cube, color_pairs)
+    except InvalidCubeError:
+        return False
+    return True